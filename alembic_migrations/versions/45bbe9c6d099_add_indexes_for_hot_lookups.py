@@ -0,0 +1,72 @@
+"""add indexes for hot lookups
+
+Revision ID: 45bbe9c6d099
+Revises: a99218d85ae1
+Create Date: 2026-10-16 11:40:27.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '45bbe9c6d099'
+down_revision: Union[str, None] = 'a99218d85ae1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_PROJECT_ROLE_UNIQUE = "uq_user_project_roles_user_id_project_id_role_id"
+
+# name, table, columns, partial index predicate
+INDEXES = [
+    ("ix_user_project_roles_project_id_user_id", "user_project_roles", ["project_id", "user_id"], None),
+    ("ix_user_project_roles_role_id", "user_project_roles", ["role_id"], None),
+    ("ix_refresh_tokens_user_id_token_type_created_at", "refresh_tokens", ["user_id", "token_type", "created_at"], None),
+    ("ix_refresh_tokens_active_user_id_token_type", "refresh_tokens", ["user_id", "token_type"], "NOT is_revoked"),
+    ("ix_users_jira_account_id", "users", ["jira_account_id"], "jira_account_id IS NOT NULL"),
+    ("ix_user_performance_user_id_year_quarter", "user_performance", ["user_id", "year", "quarter"], None),
+]
+
+
+def upgrade() -> None:
+    # Duplicate assignments would block the unique constraint, keep the oldest of each
+    op.execute(
+        """
+        DELETE FROM user_project_roles a
+        USING user_project_roles b
+        WHERE a.user_id = b.user_id
+          AND a.project_id = b.project_id
+          AND a.role_id = b.role_id
+          AND a.id > b.id
+        """
+    )
+
+    # Built concurrently so writes are not blocked while the indexes build.
+    # init_db's create_all already made them on a fresh database, hence if_not_exists.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            USER_PROJECT_ROLE_UNIQUE, "user_project_roles", ["user_id", "project_id", "role_id"],
+            unique=True, postgresql_concurrently=True, if_not_exists=True
+        )
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True, if_not_exists=True
+            )
+
+    constraints = {c["name"] for c in sa.inspect(op.get_bind()).get_unique_constraints("user_project_roles")}
+    if USER_PROJECT_ROLE_UNIQUE not in constraints:
+        # Promotes the index built above, no second scan of the table
+        op.execute(
+            f"ALTER TABLE user_project_roles ADD CONSTRAINT {USER_PROJECT_ROLE_UNIQUE} "
+            f"UNIQUE USING INDEX {USER_PROJECT_ROLE_UNIQUE}"
+        )
+
+
+def downgrade() -> None:
+    op.drop_constraint(USER_PROJECT_ROLE_UNIQUE, "user_project_roles", type_="unique")
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
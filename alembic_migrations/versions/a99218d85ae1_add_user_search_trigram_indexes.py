@@ -0,0 +1,38 @@
+"""add user search trigram indexes
+
+Revision ID: a99218d85ae1
+Revises:
+Create Date: 2026-10-16 09:12:44.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a99218d85ae1'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Built concurrently so user writes are not blocked while the index builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_name_trgm", "users", ["name"],
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            "ix_users_email_trgm", "users", ["email"],
+            postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"},
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_users_email_trgm", table_name="users", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_users_name_trgm", table_name="users", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,34 @@
+"""hash app refresh tokens
+
+Revision ID: e6f0b23c0dac
+Revises: 45bbe9c6d099
+Create Date: 2026-10-16 15:02:51.660374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f0b23c0dac'
+down_revision: Union[str, None] = '45bbe9c6d099'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # App refresh tokens are now stored as their SHA-256 hex digest. Microsoft and Jira
+    # refresh tokens are sent back to their providers, so they stay as they are.
+    # Digests are 64 characters and issued tokens are longer, so re-running skips them.
+    op.execute(
+        """
+        UPDATE refresh_tokens
+        SET token = encode(sha256(convert_to(token, 'UTF8')), 'hex')
+        WHERE token_type = 'APP' AND length(token) <> 64
+        """
+    )
+
+
+def downgrade() -> None:
+    # Hashes cannot be turned back into tokens, the older code could not match them anyway
+    op.execute("UPDATE refresh_tokens SET is_revoked = true WHERE token_type = 'APP'")
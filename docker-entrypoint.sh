@@ -15,4 +15,4 @@ asyncio.run(init_db())
 alembic upgrade head
 
 # Start the application
-exec python -m src.main
+exec python -m src.server
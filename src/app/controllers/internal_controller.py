@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import List
 
 from fastapi import HTTPException
 
@@ -8,7 +8,6 @@ from src.app.services.project_service import ProjectService
 from src.app.services.user_service import UserService
 from src.domain.entities.user import User
 from src.domain.exceptions.project_exceptions import ProjectNotFoundError
-from src.domain.exceptions.user_exceptions import UserNotFoundError
 
 
 class InternalController:
@@ -18,17 +17,10 @@ class InternalController:
 
     async def get_users_by_ids(self, user_ids: List[int]) -> StandardResponse[List[UserWithProfileResponse]]:
         """Get users by list of IDs. This is an internal API for microservice."""
-        users: List[UserWithProfileResponse] = []
-        errors: List[Dict[str, Any]] = []
-
-        for user_id in user_ids:
-            try:
-                user = await self.user_service.get_current_user(user_id)
-                users.append(UserWithProfileResponse.from_domain(user))
-            except UserNotFoundError as e:
-                errors.append({"user_id": user_id, "error": str(e)})
-            except Exception as e:
-                errors.append({"user_id": user_id, "error": f"Unexpected error: {str(e)}"})
+        users = [
+            UserWithProfileResponse.from_domain(user)
+            for user in await self.user_service.get_users_by_ids(user_ids)
+        ]
 
         return StandardResponse(
             message="Users retrieved successfully",
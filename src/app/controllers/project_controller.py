@@ -1,23 +1,29 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
 
 from src.app.schemas.requests.project import LinkJiraProjectRequest, ProjectCreateRequest, ProjectUpdateRequest
 from src.app.schemas.responses.base import StandardResponse
 from src.app.schemas.responses.project import (
+    JiraLinkJobResponse,
+    LinkJiraProjectResponse,
     PaginatedProjectUsersWithRolesResponse,
     ProjectAssigneeResponse,
     ProjectResponse,
     ProjectUserWithRole,
 )
+from src.app.services.jira_link_job_service import JiraLinkJobService
 from src.app.services.project_service import ProjectService
+from src.domain.entities.jira_link_job import JiraLinkJob
 from src.domain.entities.project import ProjectCreate, ProjectUpdate
-from src.domain.exceptions.project_exceptions import ProjectError, UnauthorizedError
+from src.domain.exceptions.project_exceptions import JiraLinkJobNotFoundError, ProjectError, UnauthorizedError
 
 
 class ProjectController:
-    def __init__(self, project_service: ProjectService):
+    def __init__(self, project_service: ProjectService, jira_link_job_service: JiraLinkJobService):
         self.project_service = project_service
+        self.jira_link_job_service = jira_link_job_service
 
     async def create_project(self, project_data: ProjectCreateRequest) -> StandardResponse[ProjectResponse]:
         try:
@@ -89,21 +95,67 @@ class ProjectController:
         self,
         request: LinkJiraProjectRequest,
         current_user_id: int
-    ) -> StandardResponse[ProjectResponse]:
+    ) -> StandardResponse[LinkJiraProjectResponse]:
         try:
             project = await self.project_service.link_jira_project(
                 project_data=request,
                 current_user_id=current_user_id
             )
+            job = await self.jira_link_job_service.start_job(
+                project=project,
+                jira_project_id=request.jira_project_id,
+                user_id=current_user_id
+            )
             return StandardResponse(
-                message="Project linked successfully",
-                data=ProjectResponse.from_domain(project)
+                message="Project linked successfully, Jira sync started",
+                data=LinkJiraProjectResponse(
+                    project=ProjectResponse.from_domain(project),
+                    job=JiraLinkJobResponse.from_domain(job)
+                )
             )
         except (ProjectError, UnauthorizedError) as e:
             raise HTTPException(status_code=400, detail=str(e)) from e
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e)) from e
 
+    async def get_jira_link_job(self, job_id: str, current_user_id: int) -> StandardResponse[JiraLinkJobResponse]:
+        try:
+            job = await self._get_own_jira_link_job(job_id, current_user_id)
+            return StandardResponse(
+                message="Jira link job retrieved successfully",
+                data=JiraLinkJobResponse.from_domain(job)
+            )
+        except JiraLinkJobNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+
+    async def stream_jira_link_job(self, job_id: str, current_user_id: int) -> StreamingResponse:
+        """Stream job updates as server-sent events until the job finishes"""
+        try:
+            await self._get_own_jira_link_job(job_id, current_user_id)
+        except JiraLinkJobNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+
+        async def events() -> AsyncIterator[str]:
+            try:
+                async for job in self.jira_link_job_service.watch_job(job_id):
+                    payload = JiraLinkJobResponse.from_domain(job).model_dump_json(by_alias=True)
+                    yield f"event: {job.status.value}\ndata: {payload}\n\n"
+            except JiraLinkJobNotFoundError as e:
+                yield f"event: error\ndata: {str(e)}\n\n"
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    async def _get_own_jira_link_job(self, job_id: str, current_user_id: int) -> JiraLinkJob:
+        job = await self.jira_link_job_service.get_job(job_id)
+        # Other users' jobs are reported as missing rather than forbidden
+        if job.user_id != current_user_id:
+            raise JiraLinkJobNotFoundError(f"Jira link job {job_id} not found")
+        return job
+
     async def get_project_assignees(
         self,
         project_key: str,
@@ -18,6 +18,7 @@ from src.app.schemas.responses.role import (
     RoleResponse,
 )
 from src.app.services.role_service import RoleService
+from src.domain.exceptions.pagination_exceptions import InvalidCursorError
 from src.domain.exceptions.project_exceptions import ProjectNotFoundError
 from src.domain.exceptions.role_exceptions import (
     RoleAlreadyExistsError,
@@ -27,6 +28,18 @@ from src.domain.exceptions.role_exceptions import (
 from src.domain.exceptions.user_exceptions import UserNotFoundError
 
 
+def _offset(page: Optional[int], page_size: int, cursor: Optional[str]) -> int:
+    """Rows before the deprecated page number, a cursor takes precedence over it"""
+    return (page - 1) * page_size if page and not cursor else 0
+
+
+def _total_pages(page: Optional[int], page_size: int, total: Optional[int]) -> Optional[int]:
+    """Page count, only reported to clients still paging by page number"""
+    if page is None or total is None:
+        return None
+    return (total + page_size - 1) // page_size
+
+
 class RoleController:
     def __init__(self, role_service: RoleService):
         self.role_service = role_service
@@ -57,36 +70,43 @@ class RoleController:
 
     async def get_all_roles(
         self,
-        page: int = 1,
+        cursor: Optional[str] = None,
         page_size: int = 10,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         is_active: Optional[bool] = None,
-        is_system_role: Optional[bool] = None
+        is_system_role: Optional[bool] = None,
+        include_total: bool = False,
+        page: Optional[int] = None
     ) -> StandardResponse[PaginatedRoleResponse]:
-        """Get paginated, filtered and sorted roles"""
+        """Get a cursor page of filtered and sorted roles"""
         try:
-            roles, total = await self.role_service.get_all_roles(
-                page=page,
-                page_size=page_size,
+            roles_page = await self.role_service.get_all_roles(
+                limit=page_size,
+                cursor=cursor,
                 search=search,
                 sort_by=sort_by,
                 sort_order=sort_order,
                 is_active=is_active,
-                is_system_role=is_system_role
+                is_system_role=is_system_role,
+                include_total=include_total or page is not None,
+                offset=_offset(page, page_size, cursor)
             )
 
             return StandardResponse(
                 message="Roles retrieved successfully",
                 data=PaginatedRoleResponse(
-                    items=[RoleResponse.from_domain(role) for role in roles],
-                    total=total,
-                    page=page,
+                    items=[RoleResponse.from_domain(role) for role in roles_page.items],
+                    next_cursor=roles_page.next_cursor,
                     page_size=page_size,
-                    total_pages=(total + page_size - 1) // page_size
+                    total=roles_page.total,
+                    page=page,
+                    total_pages=_total_pages(page, page_size, roles_page.total)
                 )
             )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
         except RoleError as e:
             raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -114,32 +134,37 @@ class RoleController:
     async def get_project_roles_by_project_id(
         self,
         project_id: int,
-        page: int = 1,
+        cursor: Optional[str] = None,
         page_size: int = 10,
         role_name: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        include_total: bool = False,
+        page: Optional[int] = None
     ) -> StandardResponse[PaginatedGetProjectRolesResponse]:
         try:
-            user_project_roles, total = await self.role_service.get_project_roles_by_project_id(
+            assignments_page = await self.role_service.get_project_roles_by_project_id(
                 project_id=project_id,
-                page=page,
-                page_size=page_size,
+                limit=page_size,
+                cursor=cursor,
                 role_name=role_name,
-                search=search
+                search=search,
+                include_total=include_total or page is not None,
+                offset=_offset(page, page_size, cursor)
             )
 
             return StandardResponse(
                 message="Project roles retrieved successfully",
                 data=PaginatedGetProjectRolesResponse(
                     items=[GetProjectRoleResponse.from_domain(role)
-                           for role in user_project_roles],
-                    total=total,
-                    page=page,
+                           for role in assignments_page.items],
+                    next_cursor=assignments_page.next_cursor,
                     page_size=page_size,
-                    total_pages=(total + page_size - 1) // page_size
+                    total=assignments_page.total,
+                    page=page,
+                    total_pages=_total_pages(page, page_size, assignments_page.total)
                 )
             )
-        except ProjectNotFoundError as e:
+        except (ProjectNotFoundError, InvalidCursorError) as e:
             raise HTTPException(status_code=400, detail=str(e)) from e
         except RoleError as e:
             raise HTTPException(status_code=500, detail=str(e)) from e
@@ -154,34 +179,41 @@ class RoleController:
 
     async def get_system_roles(
         self,
-        page: int = 1,
+        cursor: Optional[str] = None,
         page_size: int = 10,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        include_total: bool = False,
+        page: Optional[int] = None
     ) -> StandardResponse[PaginatedGetSystemRolesResponse]:
         try:
-            roles, total = await self.role_service.get_system_roles(
-                page=page,
-                page_size=page_size,
+            roles_page = await self.role_service.get_system_roles(
+                limit=page_size,
+                cursor=cursor,
                 search=search,
                 sort_by=sort_by,
                 sort_order=sort_order,
-                is_active=is_active
+                is_active=is_active,
+                include_total=include_total or page is not None,
+                offset=_offset(page, page_size, cursor)
             )
 
             return StandardResponse(
                 message="System roles retrieved successfully",
                 data=PaginatedGetSystemRolesResponse(
                     items=[GetSystemRoleResponse.from_domain(
-                        role) for role in roles],
-                    total=total,
-                    page=page,
+                        role) for role in roles_page.items],
+                    next_cursor=roles_page.next_cursor,
                     page_size=page_size,
-                    total_pages=(total + page_size - 1) // page_size
+                    total=roles_page.total,
+                    page=page,
+                    total_pages=_total_pages(page, page_size, roles_page.total)
                 )
             )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
         except RoleError as e:
             raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -1,6 +1,9 @@
-from typing import List, Optional
+import csv
+import io
+from typing import AsyncIterator, List, Optional
 
 from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
 
 from src.app.schemas.requests.user import (
     CreateUserPerformanceRequest,
@@ -10,12 +13,16 @@ from src.app.schemas.requests.user import (
 from src.app.schemas.responses.base import StandardResponse
 from src.app.schemas.responses.performance import PerformanceResponse, ProjectPerformanceResponse
 from src.app.schemas.responses.project import ProjectAssigneeResponse
-from src.app.schemas.responses.user import AdminUserResponse, UserWithProfileResponse
+from src.app.schemas.responses.user import AdminUserResponse, UserSearchResponse, UserWithProfileResponse
 from src.app.services.user_service import UserService
+from src.configs.logger import log
 from src.domain.entities.user import UserProfileUpdate
 from src.domain.entities.user_performance import UserPerformanceCreate, UserPerformanceUpdate
 from src.domain.exceptions.user_exceptions import UserNotFoundError
 
+# Flush streamed export output in chunks of about this many bytes rather than row by row
+EXPORT_CHUNK_SIZE = 64 * 1024
+
 
 class UserController:
     def __init__(self, user_service: UserService):
@@ -94,6 +101,92 @@ class UserController:
                 detail=f"Failed to retrieve users: {str(e)}"
             ) from e
 
+    async def search_users(self, search: str, limit: int = 10) -> StandardResponse[List[UserSearchResponse]]:
+        """Type-ahead user search by name or email.
+
+        Args:
+            search: What has been typed so far
+            limit: Maximum number of users to return
+
+        Returns:
+            Matching users, most similar first
+        """
+        try:
+            users = await self.user_service.search_users(search, limit=limit)
+            return StandardResponse(
+                message="Users retrieved successfully",
+                data=[UserSearchResponse.from_domain(user) for user in users]
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to search users: {str(e)}"
+            ) from e
+
+    async def export_users_for_admin(
+        self,
+        search: Optional[str] = None,
+        export_format: str = "ndjson"
+    ) -> StreamingResponse:
+        """Stream all users with their system role as NDJSON or CSV.
+
+        Rows are read from a server-side cursor and written out as they arrive,
+        so memory stays flat however many users there are.
+
+        Args:
+            search: Optional search term to filter users by name or email
+            export_format: "ndjson" or "csv"
+
+        Returns:
+            Streaming response with one user per line
+        """
+        if export_format == "csv":
+            rows = self._export_csv_rows(search)
+            media_type = "text/csv"
+        else:
+            rows = self._export_ndjson_rows(search)
+            media_type = "application/x-ndjson"
+
+        return StreamingResponse(
+            self._export_chunks(rows),
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="users.{export_format}"'}
+        )
+
+    async def _export_ndjson_rows(self, search: Optional[str]) -> AsyncIterator[str]:
+        async for user in self.user_service.stream_users(search=search):
+            yield AdminUserResponse.from_user(user).model_dump_json(by_alias=True) + "\n"
+
+    async def _export_csv_rows(self, search: Optional[str]) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer: Optional[csv.DictWriter[str]] = None
+        async for user in self.user_service.stream_users(search=search):
+            row = AdminUserResponse.from_user(user).model_dump(by_alias=True)
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    async def _export_chunks(self, rows: AsyncIterator[str]) -> AsyncIterator[str]:
+        chunk: List[str] = []
+        size = 0
+        try:
+            async for row in rows:
+                chunk.append(row)
+                size += len(row)
+                if size >= EXPORT_CHUNK_SIZE:
+                    yield "".join(chunk)
+                    chunk, size = [], 0
+            if chunk:
+                yield "".join(chunk)
+        except Exception as e:
+            # Headers are already sent, all that is left is to cut the stream short
+            log.error(f"User export failed: {str(e)}")
+            raise
+
     async def get_user_profile(
         self,
         user_id: int,
@@ -15,6 +15,7 @@ from src.app.schemas.requests.auth import JWTClaims
 from src.app.services.auth_service import AuthService
 from src.app.services.user_service import UserService
 from src.configs.auth import oauth2_scheme
+from src.configs.container import AppContainer, get_app_container
 from src.configs.database import get_db
 from src.configs.logger import log
 from src.configs.settings import settings
@@ -23,10 +24,11 @@ from src.domain.exceptions.auth_exceptions import InvalidTokenError, TokenExpire
 from src.domain.exceptions.user_exceptions import UserInactiveError, UserNotFoundError
 from src.infrastructure.repositories.sqlalchemy_auth_repository import SQLAlchemyAuthRepository
 from src.infrastructure.services.jira_sso_service import JiraSSOService
-from src.infrastructure.services.jwt_token_service import JWTTokenService
+from src.infrastructure.services.jwt_key_store import JWTKeyStore
 from src.infrastructure.services.microsoft_sso_service import MicrosoftSSOService
 
 from .common import (
+    get_jwt_key_store,
     get_nats_service,
     get_redis_service,
     get_refresh_token_repository,
@@ -44,14 +46,14 @@ async def get_auth_repository(db: AsyncSession = Depends(get_db), role_repositor
     return SQLAlchemyAuthRepository(session=db, user_repository=user_repository, role_repository=role_repository, refresh_token_repository=refresh_token_repository)
 
 
-async def get_microsoft_sso_service() -> MicrosoftSSOService:
-    """Dependency for Microsoft SSO service"""
-    return MicrosoftSSOService()  # type: ignore
+async def get_microsoft_sso_service(container: AppContainer = Depends(get_app_container)) -> MicrosoftSSOService:
+    """Dependency for the process-wide Microsoft SSO service"""
+    return container.microsoft_sso_service
 
 
-async def get_jira_sso_service() -> JiraSSOService:
-    """Dependency for Jira SSO service"""
-    return JiraSSOService()
+async def get_jira_sso_service(container: AppContainer = Depends(get_app_container)) -> JiraSSOService:
+    """Dependency for the process-wide Jira SSO service"""
+    return container.jira_sso_service
 
 
 async def get_auth_service(
@@ -92,18 +94,14 @@ async def get_auth_controller(
 
 async def verify_token(
     token: Annotated[str, Depends(oauth2_scheme)],
-    token_service: Annotated[JWTTokenService, Depends(get_token_service)]
+    key_store: Annotated[JWTKeyStore, Depends(get_jwt_key_store)]
 ) -> Dict[str, Any]:
     """Base token verification"""
     try:
-        # Read the secret key from the file
-        with open(settings.JWT_PUBLIC_KEY_PATH, "rb") as key_file:
-            secret_key = key_file.read()
-
-        # Verify and decode token
+        # Verify and decode token with the pre-parsed public key
         payload: Dict[str, Any] = jwt.decode(
             token,
-            key=secret_key,
+            key=key_store.public_key,
             algorithms=[settings.JWT_ALGORITHM]
         )
         return payload
@@ -1,33 +1,59 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import Depends
-from redis.asyncio import Redis
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.configs.database import get_db
-from src.configs.redis import get_redis_client
+from src.configs.container import AppContainer, get_app_container
+from src.configs.database import AsyncSessionLocal, get_db
+from src.domain.repositories.refresh_token_repository import IRefreshTokenRepository
 from src.domain.services.redis_service import IRedisService
 from src.domain.services.user_event_service import IUserEventService
+from src.infrastructure.repositories.sqlalchemy_outbox_repository import SQLAlchemyOutboxRepository
 from src.infrastructure.repositories.sqlalchemy_permission_repository import SQLAlchemyPermissionRepository
 from src.infrastructure.repositories.sqlalchemy_refresh_token_repository import SQLAlchemyRefreshTokenRepository
 from src.infrastructure.repositories.sqlalchemy_role_repository import SQLAlchemyRoleRepository
 from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
+from src.infrastructure.services.crypto_executor import CryptoExecutor
+from src.infrastructure.services.http_client import HTTPClient
+from src.infrastructure.services.jwt_key_store import JWTKeyStore
 from src.infrastructure.services.jwt_token_service import JWTTokenService
 from src.infrastructure.services.nats_service import NATSService
+from src.infrastructure.services.redis_refresh_token_store import RedisRefreshTokenStore
 from src.infrastructure.services.redis_service import RedisService
 from src.infrastructure.services.user_event_service import UserEventService
 
 
-async def get_nats_service():
-    """Dependency for NATS service"""
-    nats_service = NATSService()
-    await nats_service.connect()
-    return nats_service
+async def get_nats_service(container: AppContainer = Depends(get_app_container)) -> NATSService:
+    """Dependency for the process-wide NATS service"""
+    return container.nats_service
+
+
+async def get_jwt_key_store(container: AppContainer = Depends(get_app_container)) -> JWTKeyStore:
+    """Dependency for the process-wide JWT key store"""
+    return container.key_store
+
+
+async def get_crypto_executor(container: AppContainer = Depends(get_app_container)) -> CryptoExecutor:
+    """Dependency for the shared crypto worker pool"""
+    return container.crypto_executor
+
+
+async def get_http_client(container: AppContainer = Depends(get_app_container)) -> HTTPClient:
+    """Dependency for the pooled outbound HTTP client"""
+    return container.http_client
+
+
+async def get_outbox_repository(db: AsyncSession = Depends(get_db)) -> SQLAlchemyOutboxRepository:
+    """Dependency for the event outbox, bound to the request's session"""
+    return SQLAlchemyOutboxRepository(db)
 
 
 async def get_user_event_service(
-    nats_service=Depends(get_nats_service)
+    outbox_repository: SQLAlchemyOutboxRepository = Depends(get_outbox_repository)
 ) -> IUserEventService:
     """Dependency for user event service"""
-    return UserEventService(nats_service=nats_service)
+    return UserEventService(outbox_repository=outbox_repository)
 
 
 async def get_permission_repository(db: AsyncSession = Depends(get_db)):
@@ -42,9 +68,21 @@ async def get_refresh_token_repository(
     return SQLAlchemyRefreshTokenRepository(session=db)
 
 
-async def get_redis_service(redis_client: Redis = Depends(get_redis_client)):
-    """Dependency for redis repository"""
-    return RedisService(redis_client=redis_client)
+@asynccontextmanager
+async def refresh_token_repository_scope() -> AsyncIterator[IRefreshTokenRepository]:
+    """Build a refresh token repository on its own session, for writes that outlive the request."""
+    async with AsyncSessionLocal() as db:
+        yield SQLAlchemyRefreshTokenRepository(session=db)
+
+
+async def get_redis_service(container: AppContainer = Depends(get_app_container)) -> RedisService:
+    """Dependency for the process-wide Redis service"""
+    return container.redis_service
+
+
+async def get_refresh_token_store(container: AppContainer = Depends(get_app_container)) -> RedisRefreshTokenStore:
+    """Dependency for the process-wide refresh token store"""
+    return container.refresh_token_store
 
 
 async def get_user_repository(
@@ -70,7 +108,10 @@ async def get_token_service(
     role_repository: SQLAlchemyRoleRepository = Depends(get_role_repository),
     user_repository: SQLAlchemyUserRepository = Depends(get_user_repository),
     refresh_token_repository: SQLAlchemyRefreshTokenRepository = Depends(get_refresh_token_repository),
-    permission_repository: SQLAlchemyPermissionRepository = Depends(get_permission_repository)
+    permission_repository: SQLAlchemyPermissionRepository = Depends(get_permission_repository),
+    key_store: JWTKeyStore = Depends(get_jwt_key_store),
+    crypto_executor: CryptoExecutor = Depends(get_crypto_executor),
+    refresh_token_store: RedisRefreshTokenStore = Depends(get_refresh_token_store)
 ) -> JWTTokenService:
     """Dependency for token service"""
     return JWTTokenService(
@@ -78,5 +119,9 @@ async def get_token_service(
         role_repository=role_repository,
         user_repository=user_repository,
         refresh_token_repository=refresh_token_repository,
-        permission_repository=permission_repository
+        permission_repository=permission_repository,
+        key_store=key_store,
+        crypto_executor=crypto_executor,
+        refresh_token_store=refresh_token_store,
+        refresh_token_repository_scope=refresh_token_repository_scope
     )
@@ -0,0 +1,41 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from src.app.services.nats_subscribe_service import NATSHandlerServices
+from src.app.services.project_service import ProjectService
+from src.app.services.role_service import RoleService
+from src.configs.container import get_app_container
+from src.configs.database import AsyncSessionLocal
+from src.infrastructure.repositories.sqlalchemy_outbox_repository import SQLAlchemyOutboxRepository
+from src.infrastructure.repositories.sqlalchemy_permission_repository import SQLAlchemyPermissionRepository
+from src.infrastructure.repositories.sqlalchemy_project_repository import SQLAlchemyProjectRepository
+from src.infrastructure.repositories.sqlalchemy_role_repository import SQLAlchemyRoleRepository
+from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
+from src.infrastructure.services.user_event_service import UserEventService
+
+
+@asynccontextmanager
+async def nats_handler_scope() -> AsyncIterator[NATSHandlerServices]:
+    """Build the services for a single NATS message on a session of its own."""
+    container = await get_app_container()
+    nats_service = container.nats_service
+    redis_service = container.redis_service
+    async with AsyncSessionLocal() as db:
+        user_repository = SQLAlchemyUserRepository(db, UserEventService(SQLAlchemyOutboxRepository(db)), redis_service)
+        project_repository = SQLAlchemyProjectRepository(db)
+        role_repository = SQLAlchemyRoleRepository(db)
+        yield NATSHandlerServices(
+            project_service=ProjectService(
+                project_repository,
+                role_repository,
+                user_repository,
+                nats_service,
+                redis_service
+            ),
+            role_service=RoleService(
+                role_repository,
+                SQLAlchemyPermissionRepository(db),
+                project_repository,
+                user_repository
+            )
+        )
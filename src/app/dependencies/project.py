@@ -1,11 +1,21 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.controllers.project_controller import ProjectController
 from src.app.dependencies.common import get_nats_service, get_redis_service, get_role_repository, get_user_repository
+from src.app.services.jira_link_job_service import JiraLinkJobService
 from src.app.services.project_service import ProjectService
-from src.configs.database import get_db
+from src.configs.container import get_app_container
+from src.configs.database import AsyncSessionLocal, get_db
+from src.configs.settings import settings
+from src.infrastructure.repositories.sqlalchemy_outbox_repository import SQLAlchemyOutboxRepository
 from src.infrastructure.repositories.sqlalchemy_project_repository import SQLAlchemyProjectRepository
+from src.infrastructure.repositories.sqlalchemy_role_repository import SQLAlchemyRoleRepository
+from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
+from src.infrastructure.services.user_event_service import UserEventService
 
 
 async def get_project_repository(db: AsyncSession = Depends(get_db)):
@@ -24,8 +34,38 @@ async def get_project_service(
     return ProjectService(project_repository, role_repository, user_repository, nats_service, redis_service)
 
 
+@asynccontextmanager
+async def project_service_scope() -> AsyncIterator[ProjectService]:
+    """Build a project service on its own session, for background work that outlives the request."""
+    container = await get_app_container()
+    nats_service = container.nats_service
+    redis_service = container.redis_service
+    async with AsyncSessionLocal() as db:
+        yield ProjectService(
+            SQLAlchemyProjectRepository(db),
+            SQLAlchemyRoleRepository(db),
+            SQLAlchemyUserRepository(db, UserEventService(SQLAlchemyOutboxRepository(db)), redis_service),
+            nats_service,
+            redis_service
+        )
+
+
+async def get_jira_link_job_service(
+    redis_service=Depends(get_redis_service)
+):
+    """Get the Jira link job service."""
+    return JiraLinkJobService(
+        redis_service,
+        project_service_scope,
+        sync_timeout=settings.JIRA_PROJECT_SYNC_TIMEOUT,
+        job_ttl=settings.JIRA_LINK_JOB_TTL,
+        poll_interval=settings.JIRA_LINK_JOB_POLL_INTERVAL
+    )
+
+
 async def get_project_controller(
-    project_service=Depends(get_project_service)
+    project_service=Depends(get_project_service),
+    jira_link_job_service=Depends(get_jira_link_job_service)
 ):
     """Get the project controller."""
-    return ProjectController(project_service)
+    return ProjectController(project_service, jira_link_job_service)
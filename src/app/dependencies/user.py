@@ -1,14 +1,23 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.controllers.user_controller import UserController
 from src.app.dependencies.common import get_redis_service, get_user_repository
 from src.app.services.user_service import UserService
-from src.configs.database import get_db
+from src.configs.cache import user_local_cache
+from src.configs.container import get_app_container
+from src.configs.database import AsyncSessionLocal, get_db
+from src.configs.settings import settings
 from src.domain.repositories.user_performance_repository import IUserPerformanceRepository
 from src.domain.repositories.user_repository import IUserRepository
 from src.domain.services.redis_service import IRedisService
+from src.infrastructure.repositories.sqlalchemy_outbox_repository import SQLAlchemyOutboxRepository
 from src.infrastructure.repositories.sqlalchemy_user_performance_repository import SQLAlchemyUserPerformanceRepository
+from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
+from src.infrastructure.services.user_event_service import UserEventService
 
 
 async def get_user_performance_repository(db: AsyncSession = Depends(get_db)) -> IUserPerformanceRepository:
@@ -16,6 +25,14 @@ async def get_user_performance_repository(db: AsyncSession = Depends(get_db)) ->
     return SQLAlchemyUserPerformanceRepository(db)
 
 
+@asynccontextmanager
+async def user_repository_scope() -> AsyncIterator[IUserRepository]:
+    """Build a user repository on its own session, for streamed responses that outlive the request."""
+    container = await get_app_container()
+    async with AsyncSessionLocal() as db:
+        yield SQLAlchemyUserRepository(db, UserEventService(SQLAlchemyOutboxRepository(db)), container.redis_service)
+
+
 async def get_user_service(
     user_repository: IUserRepository = Depends(get_user_repository),
     user_performance_repository: IUserPerformanceRepository = Depends(get_user_performance_repository),
@@ -25,7 +42,11 @@ async def get_user_service(
     return UserService(
         user_repository,
         user_performance_repository,
-        redis_service
+        redis_service,
+        user_local_cache,
+        user_repository_scope,
+        export_batch_size=settings.USER_EXPORT_BATCH_SIZE,
+        search_min_length=settings.USER_SEARCH_MIN_LENGTH
     )
 
 
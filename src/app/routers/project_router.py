@@ -9,6 +9,8 @@ from src.app.schemas.requests.auth import JWTClaims
 from src.app.schemas.requests.project import LinkJiraProjectRequest, ProjectCreateRequest, ProjectUpdateRequest
 from src.app.schemas.responses.base import StandardResponse
 from src.app.schemas.responses.project import (
+    JiraLinkJobResponse,
+    LinkJiraProjectResponse,
     PaginatedProjectUsersWithRolesResponse,
     ProjectResponse,
 )
@@ -80,18 +82,38 @@ async def get_user_projects(
     return await controller.get_user_projects(user_id)
 
 
-@router.post("/jira/link", response_model=StandardResponse[ProjectResponse])
+@router.post("/jira/link", response_model=StandardResponse[LinkJiraProjectResponse], status_code=202)
 async def link_jira_project(
     request: LinkJiraProjectRequest,
     claims: JWTClaims = Depends(get_jwt_claims),
     controller: ProjectController = Depends(get_project_controller)
 ):
-    """Link project with Jira project"""
+    """Link project with Jira project, the Jira sync runs as a background job"""
     # TODO: Create user if not exists, is_active = False, is_jira_linked = False
     user_id = int(claims.sub)
     return await controller.link_jira_project(request, user_id)
 
 
+@router.get("/jira/link/{job_id}", response_model=StandardResponse[JiraLinkJobResponse])
+async def get_jira_link_job(
+    job_id: str,
+    claims: JWTClaims = Depends(get_jwt_claims),
+    controller: ProjectController = Depends(get_project_controller)
+):
+    """Get the progress of a Jira link job"""
+    return await controller.get_jira_link_job(job_id, int(claims.sub))
+
+
+@router.get("/jira/link/{job_id}/events")
+async def stream_jira_link_job(
+    job_id: str,
+    claims: JWTClaims = Depends(get_jwt_claims),
+    controller: ProjectController = Depends(get_project_controller)
+):
+    """Stream the progress of a Jira link job as server-sent events"""
+    return await controller.stream_jira_link_job(job_id, int(claims.sub))
+
+
 @router.get(
     "/{project_id}/users",
     response_model=StandardResponse[PaginatedProjectUsersWithRolesResponse],
@@ -51,37 +51,44 @@ async def create_role(
 })
 async def get_system_roles(
     request: Request,
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     page_size: int = Query(10, ge=1, le=100, alias="pageSize"),
     search: Optional[str] = None,
     sort_by: Optional[str] = Query(
         None, regex="^(name|description|created_at|updated_at)$", alias="sortBy"),
     sort_order: Optional[str] = Query(None, regex="^(asc|desc)$", alias="sortOrder"),
     is_active: Optional[bool] = Query(None, alias="isActive"),
+    include_total: bool = Query(False, alias="includeTotal"),
+    page: Optional[int] = Query(
+        None, ge=1, deprecated=True, description="Deprecated, follow next_cursor instead. Served with OFFSET"),
     controller: RoleController = Depends(get_role_controller)
 ):
-    """Get paginated system roles with filtering and sorting.
+    """Get cursor-paginated system roles with filtering and sorting.
 
     Args:
         request: FastAPI request object
-        page: Page number
+        cursor: Opaque cursor returned as next_cursor by the previous page
         page_size: Number of items per page
         search: Search term for name and description
         sort_by: Field to sort by
         sort_order: Sort direction (asc/desc)
         is_active: Filter by active status
+        include_total: Also count every matching role
+        page: Deprecated page number, ignored when a cursor is given
         controller: Role controller instance
 
     Returns:
-        Paginated list of system roles
+        Page of system roles and the cursor of the next page
     """
     return await controller.get_system_roles(
-        page=page,
+        cursor=cursor,
         page_size=page_size,
         search=search,
         sort_by=sort_by,
         sort_order=sort_order,
-        is_active=is_active
+        is_active=is_active,
+        include_total=include_total,
+        page=page
     )
 
 
@@ -91,7 +98,7 @@ async def get_system_roles(
     summary="Get all roles with pagination, filtering and sorting"
 )
 async def get_all_roles(
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page", alias="pageSize"),
     search: Optional[str] = Query(None, description="Search in name and description"),
     sort_by: Optional[str] = Query(
@@ -99,17 +106,22 @@ async def get_all_roles(
     sort_order: Optional[str] = Query(None, description="Sort order (asc or desc)", alias="sortOrder"),
     is_active: Optional[bool] = Query(None, description="Filter by active status", alias="isActive"),
     is_system_role: Optional[bool] = Query(None, description="Filter by system role status", alias="isSystemRole"),
+    include_total: bool = Query(False, description="Also count every matching role", alias="includeTotal"),
+    page: Optional[int] = Query(
+        None, ge=1, deprecated=True, description="Deprecated, follow next_cursor instead. Served with OFFSET"),
     controller: RoleController = Depends(get_role_controller)
 ):
-    """Get all roles with pagination, filtering and sorting."""
+    """Get all roles with cursor pagination, filtering and sorting."""
     return await controller.get_all_roles(
-        page=page,
+        cursor=cursor,
         page_size=page_size,
         search=search,
         sort_by=sort_by,
         sort_order=sort_order,
         is_active=is_active,
-        is_system_role=is_system_role
+        is_system_role=is_system_role,
+        include_total=include_total,
+        page=page
     )
 
 
@@ -181,34 +193,41 @@ async def delete_role(
 async def get_project_roles(
     request: Request,
     project_id: int,
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     page_size: int = Query(
         10, ge=1, le=100, description="Number of items per page"),
     role_name: Optional[str] = Query(None, description="Filter by role name"),
     search: Optional[str] = Query(
         None, description="Search by user name or email"),
+    include_total: bool = Query(False, description="Also count every matching assignment", alias="includeTotal"),
+    page: Optional[int] = Query(
+        None, ge=1, deprecated=True, description="Deprecated, follow next_cursor instead. Served with OFFSET"),
     controller: RoleController = Depends(get_role_controller)
 ):
-    """Get all user role assignments for a specific project with pagination and filters.
+    """Get all user role assignments for a specific project with cursor pagination and filters.
 
     Args:
         request: FastAPI request object
         project_id: ID of the project
-        page: Page number (starts from 1)
+        cursor: Opaque cursor returned as next_cursor by the previous page
         page_size: Number of items per page (1-100)
         role_name: Optional filter by role name
         search: Optional search term for user name or email
+        include_total: Also count every matching assignment
+        page: Deprecated page number, ignored when a cursor is given
         controller: Role controller instance
 
     Returns:
-        Paginated list of user role assignments
+        Page of user role assignments and the cursor of the next page
     """
     return await controller.get_project_roles_by_project_id(
         project_id=project_id,
-        page=page,
+        cursor=cursor,
         page_size=page_size,
         role_name=role_name,
-        search=search
+        search=search,
+        include_total=include_total,
+        page=page
     )
 
 
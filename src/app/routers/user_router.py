@@ -17,7 +17,12 @@ from src.app.schemas.requests.user import (
 from src.app.schemas.responses.base import StandardResponse
 from src.app.schemas.responses.performance import PerformanceResponse, ProjectPerformanceResponse
 from src.app.schemas.responses.project import ProjectAssigneeResponse, ProjectResponse
-from src.app.schemas.responses.user import AdminUserResponse, UserResponse, UserWithProfileResponse
+from src.app.schemas.responses.user import (
+    AdminUserResponse,
+    UserResponse,
+    UserSearchResponse,
+    UserWithProfileResponse,
+)
 from src.app.utils.response_wrapper import wrap_response
 
 router = APIRouter()
@@ -119,6 +124,25 @@ async def get_users(
     )
 
 
+@router.get("/search", response_model=StandardResponse[List[UserSearchResponse]])
+async def search_users(
+    search: str = Query(..., max_length=255, description="Name or email typed so far"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of users to return"),
+    user_controller: UserController = Depends(get_user_controller),
+):
+    """Type-ahead search returning only id, name, email and avatar of the best matching users.
+
+    Args:
+        search: Name or email typed so far, too short a term returns no users
+        limit: Maximum number of users to return
+        user_controller: User controller instance
+
+    Returns:
+        Matching users, most similar first
+    """
+    return await user_controller.search_users(search=search, limit=limit)
+
+
 @router.get("/admin/all", response_model=StandardResponse[List[AdminUserResponse]])
 async def get_users_for_admin(
     request: Request,
@@ -140,6 +164,28 @@ async def get_users_for_admin(
     )
 
 
+@router.get("/admin/all/export")
+async def export_users_for_admin(
+    search: Optional[str] = Query(None, description="Search by user name or email"),
+    export_format: str = Query("ndjson", regex="^(ndjson|csv)$", alias="format"),
+    user_controller: UserController = Depends(get_user_controller),
+):
+    """Stream all users with their roles as NDJSON or CSV, for exports too large to build in memory.
+
+    Args:
+        search: Optional search term to filter users by name or email
+        export_format: Output format, ndjson (default) or csv
+        user_controller: User controller instance
+
+    Returns:
+        Streamed file with one user per line
+    """
+    return await user_controller.export_users_for_admin(
+        search=search,
+        export_format=export_format
+    )
+
+
 @router.get("/{user_id}/profile", response_model=StandardResponse[UserWithProfileResponse])
 async def get_user_profile(
     user_id: int,
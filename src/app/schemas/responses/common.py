@@ -1,4 +1,4 @@
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 from src.app.schemas.responses.base import BaseResponse
 
@@ -11,3 +11,13 @@ class PaginatedResponse(BaseResponse, Generic[T]):
     page: int
     page_size: int
     total_pages: int
+
+
+class CursorPaginatedResponse(BaseResponse, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    page_size: int
+    total: Optional[int] = None
+    # Only set when the request paged with the deprecated page parameter
+    page: Optional[int] = None
+    total_pages: Optional[int] = None
@@ -1,8 +1,11 @@
+from datetime import datetime
 from typing import List, Optional
 
 from pydantic import Field
 
 from src.app.schemas.responses.base import BaseResponse
+from src.domain.constants.jobs import JiraLinkJobStatus
+from src.domain.entities.jira_link_job import JiraLinkJob
 from src.domain.entities.project import Project
 from src.domain.entities.user import User
 from src.domain.entities.user_project_role import UserProjectRole
@@ -155,3 +158,53 @@ class PaginatedProjectUsersWithRolesResponse(BaseResponse):
             page_size=page_size,
             total_pages=total_pages
         )
+
+
+class JiraSyncSummaryResponse(BaseResponse):
+    total_issues: int = 0
+    synced_issues: int = 0
+    total_sprints: int = 0
+    synced_sprints: int = 0
+    total_users: int = 0
+    synced_users: int = 0
+    started_at: str
+    completed_at: Optional[str] = None
+
+
+class JiraUserSyncResponse(BaseResponse):
+    total_users: int = 0
+    matched_users: int = 0
+    created_users: int = 0
+    skipped_users: int = 0
+    assigned_memberships: int = 0
+
+
+class JiraLinkJobResponse(BaseResponse):
+    id: str
+    status: JiraLinkJobStatus
+    project_id: int
+    project_key: str
+    sync_summary: Optional[JiraSyncSummaryResponse] = None
+    user_sync: Optional[JiraUserSyncResponse] = None
+    error_message: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_domain(cls, job: JiraLinkJob) -> 'JiraLinkJobResponse':
+        return cls(
+            id=job.job_id,
+            status=job.status,
+            project_id=job.project_id,
+            project_key=job.project_key,
+            sync_summary=JiraSyncSummaryResponse.model_validate(job.sync_summary) if job.sync_summary else None,
+            user_sync=JiraUserSyncResponse.model_validate(job.user_sync) if job.user_sync else None,
+            error_message=job.error_message,
+            created_at=job.created_at,
+            updated_at=job.updated_at
+        )
+
+
+class LinkJiraProjectResponse(BaseResponse):
+    project: ProjectResponse
+    job: JiraLinkJobResponse
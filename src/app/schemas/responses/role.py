@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from src.app.schemas.responses.base import BaseResponse
-from src.app.schemas.responses.common import PaginatedResponse
+from src.app.schemas.responses.common import CursorPaginatedResponse
 from src.app.schemas.responses.permission import PermissionResponse
 from src.domain.entities.role import Role
 from src.domain.entities.user_project_role import UserProjectRole
@@ -76,7 +76,7 @@ class GetProjectRoleResponse(BaseResponse):
         from_attributes = True
 
 
-class PaginatedGetProjectRolesResponse(PaginatedResponse[GetProjectRoleResponse]):
+class PaginatedGetProjectRolesResponse(CursorPaginatedResponse[GetProjectRoleResponse]):
     pass
 
 
@@ -99,9 +99,9 @@ class GetSystemRoleResponse(BaseResponse):
         )
 
 
-class PaginatedGetSystemRolesResponse(PaginatedResponse[GetSystemRoleResponse]):
+class PaginatedGetSystemRolesResponse(CursorPaginatedResponse[GetSystemRoleResponse]):
     pass
 
 
-class PaginatedRoleResponse(PaginatedResponse[RoleResponse]):
+class PaginatedRoleResponse(CursorPaginatedResponse[RoleResponse]):
     pass
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 from src.app.schemas.responses.base import BaseResponse
 from src.domain.entities.user import User
 from src.domain.entities.user_project_role import UserProjectRole
+from src.domain.value_objects.users import UserSearchResult
 
 
 # Add new model for project roles
@@ -228,3 +229,19 @@ class AdminUserResponse(BaseResponse):
             is_active=user.is_active,
             is_jira_linked=user.is_jira_linked,
         )
+
+
+class UserSearchResponse(BaseResponse):
+    id: int
+    name: str
+    email: str
+    avatar_url: Optional[str] = None
+
+    @classmethod
+    def from_domain(cls, user: UserSearchResult) -> 'UserSearchResponse':
+        return cls(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            avatar_url=user.avatar_url,
+        )
@@ -1,11 +1,7 @@
 import base64
 import json
-from typing import Optional
-
-from aiohttp import ClientSession
 
 from src.configs.logger import log
-from src.configs.settings import settings
 from src.domain.constants.auth import TokenType
 from src.domain.constants.nats_events import NATSPublishTopic
 from src.domain.constants.roles import SystemRoles
@@ -110,14 +106,17 @@ class AuthService:
                 "expires_in": microsoft_info.expires_in,
             }
 
-            # Publish Microsoft login event to NATS
-            await self.nats_service.publish(
-                NATSPublishTopic.MICROSOFT_LOGIN.value,
+            # Queue Microsoft login event, committed once the tokens are issued
+            await self.user_event_service.publish_login_event(
+                user.id,
+                NATSPublishTopic.MICROSOFT_LOGIN,
                 microsoft_login_event
             )
 
             # Create access token
-            return await self.token_service.create_token_pair(user)
+            token_pair = await self.token_service.create_token_pair(user)
+            await self.user_event_service.commit()
+            return token_pair
 
         except Exception as e:
             log.error(f"Error handling Microsoft callback: {e}")
@@ -136,7 +135,7 @@ class AuthService:
             jira_account_id = await self._extract_jira_account_id(jira_info.access_token)
 
             # Fetch user avatar URL from Jira API
-            avatar_url = await self._fetch_jira_user_avatar(jira_info.access_token, jira_account_id)
+            avatar_url = await self.jira_sso_service.fetch_user_avatar(jira_info.access_token, jira_account_id)
 
             # Update user with Jira account ID, linked status, and avatar URL
             await self.user_repository.update_user_by_id(
@@ -174,8 +173,10 @@ class AuthService:
                 "refresh_token": jira_info.refresh_token,
                 "expires_in": jira_info.expires_in,
             }
-            await self.nats_service.publish(
-                NATSPublishTopic.JIRA_LOGIN.value,
+            # Queued, committed once the new tokens are issued
+            await self.user_event_service.publish_login_event(
+                user.id,
+                NATSPublishTopic.JIRA_LOGIN,
                 jira_login_event
             )
 
@@ -185,7 +186,9 @@ class AuthService:
                 raise UserNotFoundError("User not found after update")
 
             # Generate new token pair with updated is_jira_linked status
-            return await self.token_service.create_token_pair(updated_user)
+            token_pair = await self.token_service.create_token_pair(updated_user)
+            await self.user_event_service.commit()
+            return token_pair
 
         except Exception as e:
             log.error(f"Error handling Jira callback: {e}")
@@ -213,53 +216,26 @@ class AuthService:
             log.error(f"Error extracting Jira account ID: {e}")
             raise ValueError("Failed to extract Jira account ID from token") from e
 
-    async def _fetch_jira_user_avatar(self, access_token: str, account_id: str) -> Optional[str]:
-        """Fetch user avatar URL from Jira API"""
-        try:
-            # Jira API endpoint to get user information
-            url = f"{settings.JIRA_BASE_URL}/rest/api/3/user"
-
-            # Set up headers with access token
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json"
-            }
-
-            # Make request to Jira API
-            async with ClientSession() as session:
-                async with session.get(url, headers=headers, params={"accountId": account_id}) as response:
-                    if response.status == 200:
-                        user_data = await response.json()
-                        # Extract avatar URL from response
-                        if user_data and "avatarUrls" in user_data and "48x48" in user_data["avatarUrls"]:
-                            return str(user_data["avatarUrls"]["48x48"])
-                        return None
-                    else:
-                        log.error(f"Failed to fetch Jira user avatar: {response.status}")
-                        return None
-        except Exception as e:
-            log.error(f"Error fetching Jira user avatar: {e}")
-            return None
-
     async def logout(self, user_id: int) -> None:
         """Handle user logout"""
         try:
+            # Queue logout event, committed together with the revocation
+            await self.user_event_service.publish_user_event(
+                user_id=user_id,
+                event_type=NATSPublishTopic.USER_LOGOUT
+            )
+
             await self.refresh_token_repository.revoke_tokens_by_user_and_type(
                 user_id=user_id,
                 token_type=TokenType.APP
             )
+            await self.token_service.revoke_refresh_tokens(user_id)
 
             await self.redis_service.delete(f"user:{user_id}")
 
             # Clear permission cache
             await self.redis_service.delete(f"permissions:user:{user_id}")
 
-            # Send logout event
-            await self.user_event_service.publish_user_event(
-                user_id=user_id,
-                event_type=NATSPublishTopic.USER_LOGOUT
-            )
-
         except Exception as e:
             log.error(f"Error during logout: {e}")
             raise AuthenticationError("Logout failed") from e
@@ -272,9 +248,9 @@ class AuthService:
             # If refresh token is invalid, perform logout
             try:
                 # Extract user ID from the invalid refresh token
-                token_data = await self.refresh_token_repository.get_by_token(refresh_token)
-                if token_data and token_data.user_id:
-                    await self.logout(token_data.user_id)
+                user_id = await self.token_service.get_refresh_token_user_id(refresh_token)
+                if user_id:
+                    await self.logout(user_id)
             except Exception as logout_error:
                 log.error(f"Error during auto-logout: {logout_error}")
             raise e
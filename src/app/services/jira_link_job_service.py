@@ -0,0 +1,138 @@
+import asyncio
+from datetime import datetime
+from typing import AsyncContextManager, AsyncIterator, Callable, Optional, Set
+import uuid
+
+from src.app.services.project_service import ProjectService
+from src.configs.logger import log
+from src.domain.constants.jobs import JiraLinkJobStatus
+from src.domain.entities.jira_link_job import JiraLinkJob
+from src.domain.entities.project import Project
+from src.domain.events.project_events import JiraProjectSyncNATS, JiraProjectSyncNATSRequestDTO
+from src.domain.exceptions.project_exceptions import JiraLinkJobNotFoundError
+from src.domain.services.redis_service import IRedisService
+
+# Opens a project service on its own database session, so a job never borrows the request's session
+ProjectServiceScope = Callable[[], AsyncContextManager[ProjectService]]
+
+# Strong references to running jobs, the event loop only keeps weak ones
+_running_jobs: Set["asyncio.Task[None]"] = set()
+
+
+class JiraLinkJobService:
+    """Runs Jira project syncs in the background and tracks their progress in Redis.
+
+    Job state lives in Redis so any replica can answer a status request, whichever one runs the job.
+    """
+
+    def __init__(
+        self,
+        redis_service: IRedisService,
+        project_service_scope: ProjectServiceScope,
+        sync_timeout: float,
+        job_ttl: int,
+        poll_interval: float
+    ):
+        self.redis_service = redis_service
+        self.project_service_scope = project_service_scope
+        self.sync_timeout = sync_timeout
+        self.job_ttl = job_ttl
+        self.poll_interval = poll_interval
+
+    async def start_job(self, project: Project, jira_project_id: str, user_id: int) -> JiraLinkJob:
+        """Record a pending job for a freshly linked project and start syncing it"""
+        if project.id is None:
+            raise ValueError("Project must be persisted before it can be synced")
+
+        job = JiraLinkJob(
+            job_id=uuid.uuid4().hex,
+            project_id=project.id,
+            project_key=project.key,
+            jira_project_id=jira_project_id,
+            user_id=user_id
+        )
+        await self._save(job)
+
+        task = asyncio.create_task(self._run(job), name=f"jira-link-job:{job.job_id}")
+        _running_jobs.add(task)
+        task.add_done_callback(_running_jobs.discard)
+        return job
+
+    async def get_job(self, job_id: str) -> JiraLinkJob:
+        """Get the current state of a job"""
+        data = await self.redis_service.get(self._key(job_id))
+        if not data:
+            raise JiraLinkJobNotFoundError(f"Jira link job {job_id} not found")
+        return JiraLinkJob.model_validate(data)
+
+    async def watch_job(self, job_id: str) -> AsyncIterator[JiraLinkJob]:
+        """Yield the job every time its state changes, until it finishes"""
+        job = await self.get_job(job_id)
+        yield job
+        while not job.status.is_terminal:
+            await asyncio.sleep(self.poll_interval)
+            current = await self.get_job(job_id)
+            if current.updated_at != job.updated_at:
+                yield current
+            job = current
+
+    async def _run(self, job: JiraLinkJob) -> None:
+        sync_request = JiraProjectSyncNATSRequestDTO(
+            project_id=job.project_id,
+            user_id=job.user_id,
+            project_key=job.project_key,
+            jira_project_id=job.jira_project_id,
+            sync_issues=True,
+            sync_sprints=True,
+            sync_users=True
+        )
+
+        async def on_synced(reply: JiraProjectSyncNATS) -> None:
+            job.sync_summary = reply.sync_summary
+            await self._update(job, JiraLinkJobStatus.PROCESSING_USERS)
+
+        try:
+            await self._update(job, JiraLinkJobStatus.SYNCING)
+            # The session only checks out a connection once the synced users are written
+            async with self.project_service_scope() as project_service:
+                _, job.user_sync = await project_service.sync_jira_project(
+                    sync_request,
+                    timeout=self.sync_timeout,
+                    on_synced=on_synced
+                )
+            await self._update(job, JiraLinkJobStatus.SUCCEEDED)
+            log.info(f"Jira link job {job.job_id} for project {job.project_key} succeeded")
+        except asyncio.CancelledError:
+            await self._fail(job, "Jira project sync was interrupted by a shutdown")
+            raise
+        except Exception as e:
+            log.error(f"Jira link job {job.job_id} for project {job.project_key} failed: {str(e)}")
+            await self._fail(job, str(e))
+
+    async def _fail(self, job: JiraLinkJob, error_message: str) -> None:
+        job.error_message = error_message
+        try:
+            await self._update(job, JiraLinkJobStatus.FAILED)
+        except Exception as e:
+            log.error(f"Failed to record failure of Jira link job {job.job_id}: {str(e)}")
+
+    async def _update(self, job: JiraLinkJob, status: JiraLinkJobStatus) -> None:
+        job.status = status
+        job.updated_at = datetime.now()
+        await self._save(job)
+
+    async def _save(self, job: JiraLinkJob) -> None:
+        await self.redis_service.set(self._key(job.job_id), job.model_dump(mode='json'), self.job_ttl)
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"jira_link_job:{job_id}"
+
+
+async def cancel_running_jira_link_jobs(timeout: Optional[float] = None) -> None:
+    """Cancel the jobs still running in this process, marking them failed"""
+    tasks = list(_running_jobs)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.wait(tasks, timeout=timeout)
@@ -1,4 +1,4 @@
-from typing import Any, Awaitable, Callable, Dict
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional
 
 from src.app.services.project_service import ProjectService
 from src.app.services.role_service import RoleService
@@ -8,6 +8,10 @@ from src.domain.events.project_events import JiraUsersResponseEvent
 from src.domain.events.role_events import (
     AssignProjectRoleRequest,
     AssignProjectRoleResponse,
+    BatchAssignProjectRoleRequest,
+    BatchAssignProjectRoleResponse,
+    BatchUnassignProjectRoleRequest,
+    BatchUnassignProjectRoleResponse,
     UnassignProjectRoleRequest,
     UnassignProjectRoleResponse,
 )
@@ -17,39 +21,97 @@ from src.domain.exceptions.user_exceptions import UserNotFoundError
 from src.domain.services.nats_service import INATSService
 
 
+class NATSHandlerServices(NamedTuple):
+    """Services for handling one message, all bound to the same database session"""
+    project_service: ProjectService
+    role_service: RoleService
+
+
+# Opens a fresh unit of work for each message, messages are handled concurrently and must not share a session
+NATSHandlerScope = Callable[[], AsyncContextManager[NATSHandlerServices]]
+
+
 class NATSSubscribeService:
     def __init__(
         self,
         nats_service: INATSService,
-        project_service: ProjectService,
-        role_service: RoleService
+        handler_scope: NATSHandlerScope,
+        queue_group: Optional[str] = None,
+        fanout_subjects: Iterable[str] = (),
+        durable_prefix: Optional[str] = None,
+        batch_size: int = 100,
+        max_deliver: int = 5
     ):
         self.nats_service = nats_service
-        self.project_service = project_service
-        self.role_service = role_service
+        self.handler_scope = handler_scope
+        self.queue_group = queue_group
+        self.fanout_subjects = set(fanout_subjects)
+        # Durable JetStream consumers are used for events when a prefix is configured
+        self.durable_prefix = durable_prefix
+        self.batch_size = batch_size
+        self.max_deliver = max_deliver
+
+    def _queue_for(self, subject: str) -> Optional[str]:
+        """Load-balance a subject across replicas unless it is configured as fan-out"""
+        if subject in self.fanout_subjects:
+            return None
+        return self.queue_group or None
+
+    def _durable_for(self, subject: str) -> str:
+        """Durable consumer name shared by every replica, dots are not allowed in it"""
+        return f"{self.durable_prefix}_{subject.replace('.', '_')}"
 
     async def start_nats_subscribers(self) -> None:
         """Start NATS subscribers"""
         # Subscribe to existing topics
         for event_type in NATSSubscribeTopic:
-            if event_type == NATSSubscribeTopic.JIRA_USERS_RESPONSE:
+            if event_type == NATSSubscribeTopic.JIRA_USERS_RESPONSE and self.durable_prefix:
+                await self.nats_service.subscribe_batch(
+                    subject=event_type.value,
+                    durable=self._durable_for(event_type.value),
+                    callback=self.handle_jira_users_response_batch,
+                    batch_size=self.batch_size,
+                    max_deliver=self.max_deliver
+                )
+            elif event_type == NATSSubscribeTopic.JIRA_USERS_RESPONSE:
                 await self.nats_service.subscribe(
                     subject=event_type.value,
-                    callback=self.handle_jira_users_response_event
+                    callback=self.handle_jira_users_response_event,
+                    queue=self._queue_for(event_type.value)
                 )
 
         # Subscribe to direct request topics
         await self._setup_project_role_assignment_handler()
         await self._setup_project_role_unassignment_handler()
+        await self._setup_project_role_batch_assignment_handler()
+        await self._setup_project_role_batch_unassignment_handler()
 
     async def handle_jira_users_response_event(self, subject: str, data: Dict[str, Any]) -> None:
         """Route Jira users found event to project service"""
         try:
             event = JiraUsersResponseEvent.model_validate(data)
-            await self.project_service.handle_jira_users_response_event(event)
+            async with self.handler_scope() as services:
+                await services.project_service.handle_jira_users_response_event(event)
         except Exception as e:
             log.error(f"Error handling Jira users found event: {str(e)}")
 
+    async def handle_jira_users_response_batch(self, subject: str, batch: List[Dict[str, Any]]) -> None:
+        """Route a batch of Jira users found events to project service, in one transaction.
+
+        Errors propagate so the whole batch is redelivered.
+        """
+        events: List[JiraUsersResponseEvent] = []
+        for data in batch:
+            try:
+                events.append(JiraUsersResponseEvent.model_validate(data))
+            except Exception as e:
+                # Redelivery cannot fix an invalid event
+                log.error(f"Dropping invalid Jira users found event: {str(e)}")
+        if not events:
+            return
+        async with self.handler_scope() as services:
+            await services.project_service.handle_jira_users_response_events(events)
+
     async def _setup_project_role_assignment_handler(self) -> None:
         """Setup handler for project role assignment requests"""
         async def handle_assign_role_request(subject: str, data: Dict[str, Any], respond: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
@@ -59,96 +121,97 @@ class NATSSubscribeService:
                 log.info(f"Received project role assignment request for user {request.user_id}, " +
                          f"role {request.role_name}, project {request.project_key}")
 
-                # Process request
-                try:
-                    # 1. Get project by key
-                    project = await self.project_service.get_project(request.project_key)
-
-                    if not project or not project.id:
-                        raise ProjectNotFoundError(f"Project with key {request.project_key} not found")
-
-                    # 2. Verify role exists
-                    role = await self.role_service.role_repository.get_role_by_name(request.role_name)
-                    if not role:
-                        raise RoleNotFoundError(role_name=request.role_name)
-
-                    # 3. Verify role is not a system role
-                    if role.is_system_role:
-                        raise RoleIsSystemRoleError(request.role_name)
-
-                    # 4. Verify user exists
-                    user = await self.role_service.user_repository.get_user_by_id(request.user_id)
-                    if not user:
-                        raise UserNotFoundError(f"User with id {request.user_id} not found")
-
-                    # 5. Assign the role
-                    await self.role_service.role_repository.assign_project_role_to_user(
-                        user_id=request.user_id,
-                        project_id=project.id,
-                        role_name=request.role_name
-                    )
-
-                    # Create success response
-                    response = AssignProjectRoleResponse(
-                        success=True,
-                        message=f"Successfully assigned role {request.role_name} to user {request.user_id} in project {request.project_key}",
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key
-                    )
-                    log.info(
-                        f"Successfully assigned role {request.role_name} to user {request.user_id} in project {request.project_key}")
-
-                except ProjectNotFoundError as e:
-                    response = AssignProjectRoleResponse(
-                        success=False,
-                        message=str(e),
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key,
-                        error_code="PROJECT_NOT_FOUND"
-                    )
-                    log.error(f"Project not found error: {str(e)}")
-                except RoleNotFoundError as e:
-                    response = AssignProjectRoleResponse(
-                        success=False,
-                        message=str(e),
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key,
-                        error_code="ROLE_NOT_FOUND"
-                    )
-                    log.error(f"Role not found error: {str(e)}")
-                except RoleIsSystemRoleError as e:
-                    response = AssignProjectRoleResponse(
-                        success=False,
-                        message=str(e),
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key,
-                        error_code="ROLE_IS_SYSTEM_ROLE"
-                    )
-                    log.error(f"Role is system role error: {str(e)}")
-                except UserNotFoundError as e:
-                    response = AssignProjectRoleResponse(
-                        success=False,
-                        message=str(e),
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key,
-                        error_code="USER_NOT_FOUND"
-                    )
-                    log.error(f"User not found error: {str(e)}")
-                except Exception as e:
-                    response = AssignProjectRoleResponse(
-                        success=False,
-                        message=f"Error assigning role: {str(e)}",
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key,
-                        error_code="INTERNAL_ERROR"
-                    )
-                    log.error(f"Error assigning role: {str(e)}")
+                # Process request on its own session
+                async with self.handler_scope() as services:
+                    try:
+                        # 1. Get project by key
+                        project = await services.project_service.get_project(request.project_key)
+
+                        if not project or not project.id:
+                            raise ProjectNotFoundError(f"Project with key {request.project_key} not found")
+
+                        # 2. Verify role exists
+                        role = await services.role_service.role_repository.get_role_by_name(request.role_name)
+                        if not role:
+                            raise RoleNotFoundError(role_name=request.role_name)
+
+                        # 3. Verify role is not a system role
+                        if role.is_system_role:
+                            raise RoleIsSystemRoleError(request.role_name)
+
+                        # 4. Verify user exists
+                        user = await services.role_service.user_repository.get_user_by_id(request.user_id)
+                        if not user:
+                            raise UserNotFoundError(f"User with id {request.user_id} not found")
+
+                        # 5. Assign the role
+                        await services.role_service.role_repository.assign_project_role_to_user(
+                            user_id=request.user_id,
+                            project_id=project.id,
+                            role_name=request.role_name
+                        )
+
+                        # Create success response
+                        response = AssignProjectRoleResponse(
+                            success=True,
+                            message=f"Successfully assigned role {request.role_name} to user {request.user_id} in project {request.project_key}",
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key
+                        )
+                        log.info(
+                            f"Successfully assigned role {request.role_name} to user {request.user_id} in project {request.project_key}")
+
+                    except ProjectNotFoundError as e:
+                        response = AssignProjectRoleResponse(
+                            success=False,
+                            message=str(e),
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key,
+                            error_code="PROJECT_NOT_FOUND"
+                        )
+                        log.error(f"Project not found error: {str(e)}")
+                    except RoleNotFoundError as e:
+                        response = AssignProjectRoleResponse(
+                            success=False,
+                            message=str(e),
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key,
+                            error_code="ROLE_NOT_FOUND"
+                        )
+                        log.error(f"Role not found error: {str(e)}")
+                    except RoleIsSystemRoleError as e:
+                        response = AssignProjectRoleResponse(
+                            success=False,
+                            message=str(e),
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key,
+                            error_code="ROLE_IS_SYSTEM_ROLE"
+                        )
+                        log.error(f"Role is system role error: {str(e)}")
+                    except UserNotFoundError as e:
+                        response = AssignProjectRoleResponse(
+                            success=False,
+                            message=str(e),
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key,
+                            error_code="USER_NOT_FOUND"
+                        )
+                        log.error(f"User not found error: {str(e)}")
+                    except Exception as e:
+                        response = AssignProjectRoleResponse(
+                            success=False,
+                            message=f"Error assigning role: {str(e)}",
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key,
+                            error_code="INTERNAL_ERROR"
+                        )
+                        log.error(f"Error assigning role: {str(e)}")
 
                 # Send response
                 await respond(response.model_dump())
@@ -169,7 +232,8 @@ class NATSSubscribeService:
         # Register the handler for the request topic
         await self.nats_service.subscribe_request(
             subject=NATSPublishTopic.ASSIGN_PROJECT_ROLE_REQUEST.value,
-            callback=handle_assign_role_request
+            callback=handle_assign_role_request,
+            queue=self._queue_for(NATSPublishTopic.ASSIGN_PROJECT_ROLE_REQUEST.value)
         )
         log.info(
             f"Subscribed to {NATSPublishTopic.ASSIGN_PROJECT_ROLE_REQUEST.value} for project role assignment requests")
@@ -183,96 +247,97 @@ class NATSSubscribeService:
                 log.info(f"Received project role unassignment request for user {request.user_id}, " +
                          f"role {request.role_name}, project {request.project_key}")
 
-                # Process request
-                try:
-                    # 1. Get project by key
-                    project = await self.project_service.get_project(request.project_key)
-
-                    if not project or not project.id:
-                        raise ProjectNotFoundError(f"Project with key {request.project_key} not found")
-
-                    # 2. Verify role exists
-                    role = await self.role_service.role_repository.get_role_by_name(request.role_name)
-                    if not role:
-                        raise RoleNotFoundError(role_name=request.role_name)
-
-                    # 3. Verify role is not a system role
-                    if role.is_system_role:
-                        raise RoleIsSystemRoleError(request.role_name)
-
-                    # 4. Verify user exists
-                    user = await self.role_service.user_repository.get_user_by_id(request.user_id)
-                    if not user:
-                        raise UserNotFoundError(f"User with id {request.user_id} not found")
-
-                    # 5. Unassign the role
-                    await self.role_service.role_repository.unassign_project_role_from_user(
-                        user_id=request.user_id,
-                        project_id=project.id,
-                        role_name=request.role_name
-                    )
-
-                    # Create success response
-                    response = UnassignProjectRoleResponse(
-                        success=True,
-                        message=f"Successfully unassigned role {request.role_name} from user {request.user_id} in project {request.project_key}",
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key
-                    )
-                    log.info(
-                        f"Successfully unassigned role {request.role_name} from user {request.user_id} in project {request.project_key}")
-
-                except ProjectNotFoundError as e:
-                    response = UnassignProjectRoleResponse(
-                        success=False,
-                        message=str(e),
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key,
-                        error_code="PROJECT_NOT_FOUND"
-                    )
-                    log.error(f"Project not found error: {str(e)}")
-                except RoleNotFoundError as e:
-                    response = UnassignProjectRoleResponse(
-                        success=False,
-                        message=str(e),
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key,
-                        error_code="ROLE_NOT_FOUND"
-                    )
-                    log.error(f"Role not found error: {str(e)}")
-                except RoleIsSystemRoleError as e:
-                    response = UnassignProjectRoleResponse(
-                        success=False,
-                        message=str(e),
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key,
-                        error_code="ROLE_IS_SYSTEM_ROLE"
-                    )
-                    log.error(f"Role is system role error: {str(e)}")
-                except UserNotFoundError as e:
-                    response = UnassignProjectRoleResponse(
-                        success=False,
-                        message=str(e),
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key,
-                        error_code="USER_NOT_FOUND"
-                    )
-                    log.error(f"User not found error: {str(e)}")
-                except Exception as e:
-                    response = UnassignProjectRoleResponse(
-                        success=False,
-                        message=f"Error unassigning role: {str(e)}",
-                        user_id=request.user_id,
-                        role_name=request.role_name,
-                        project_key=request.project_key,
-                        error_code="INTERNAL_ERROR"
-                    )
-                    log.error(f"Error unassigning role: {str(e)}")
+                # Process request on its own session
+                async with self.handler_scope() as services:
+                    try:
+                        # 1. Get project by key
+                        project = await services.project_service.get_project(request.project_key)
+
+                        if not project or not project.id:
+                            raise ProjectNotFoundError(f"Project with key {request.project_key} not found")
+
+                        # 2. Verify role exists
+                        role = await services.role_service.role_repository.get_role_by_name(request.role_name)
+                        if not role:
+                            raise RoleNotFoundError(role_name=request.role_name)
+
+                        # 3. Verify role is not a system role
+                        if role.is_system_role:
+                            raise RoleIsSystemRoleError(request.role_name)
+
+                        # 4. Verify user exists
+                        user = await services.role_service.user_repository.get_user_by_id(request.user_id)
+                        if not user:
+                            raise UserNotFoundError(f"User with id {request.user_id} not found")
+
+                        # 5. Unassign the role
+                        await services.role_service.role_repository.unassign_project_role_from_user(
+                            user_id=request.user_id,
+                            project_id=project.id,
+                            role_name=request.role_name
+                        )
+
+                        # Create success response
+                        response = UnassignProjectRoleResponse(
+                            success=True,
+                            message=f"Successfully unassigned role {request.role_name} from user {request.user_id} in project {request.project_key}",
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key
+                        )
+                        log.info(
+                            f"Successfully unassigned role {request.role_name} from user {request.user_id} in project {request.project_key}")
+
+                    except ProjectNotFoundError as e:
+                        response = UnassignProjectRoleResponse(
+                            success=False,
+                            message=str(e),
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key,
+                            error_code="PROJECT_NOT_FOUND"
+                        )
+                        log.error(f"Project not found error: {str(e)}")
+                    except RoleNotFoundError as e:
+                        response = UnassignProjectRoleResponse(
+                            success=False,
+                            message=str(e),
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key,
+                            error_code="ROLE_NOT_FOUND"
+                        )
+                        log.error(f"Role not found error: {str(e)}")
+                    except RoleIsSystemRoleError as e:
+                        response = UnassignProjectRoleResponse(
+                            success=False,
+                            message=str(e),
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key,
+                            error_code="ROLE_IS_SYSTEM_ROLE"
+                        )
+                        log.error(f"Role is system role error: {str(e)}")
+                    except UserNotFoundError as e:
+                        response = UnassignProjectRoleResponse(
+                            success=False,
+                            message=str(e),
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key,
+                            error_code="USER_NOT_FOUND"
+                        )
+                        log.error(f"User not found error: {str(e)}")
+                    except Exception as e:
+                        response = UnassignProjectRoleResponse(
+                            success=False,
+                            message=f"Error unassigning role: {str(e)}",
+                            user_id=request.user_id,
+                            role_name=request.role_name,
+                            project_key=request.project_key,
+                            error_code="INTERNAL_ERROR"
+                        )
+                        log.error(f"Error unassigning role: {str(e)}")
 
                 # Send response
                 await respond(response.model_dump())
@@ -293,7 +358,102 @@ class NATSSubscribeService:
         # Register the handler for the request topic
         await self.nats_service.subscribe_request(
             subject=NATSPublishTopic.UNASSIGN_PROJECT_ROLE_REQUEST.value,
-            callback=handle_unassign_role_request
+            callback=handle_unassign_role_request,
+            queue=self._queue_for(NATSPublishTopic.UNASSIGN_PROJECT_ROLE_REQUEST.value)
         )
         log.info(
             f"Subscribed to {NATSPublishTopic.UNASSIGN_PROJECT_ROLE_REQUEST.value} for project role unassignment requests")
+
+    async def _setup_project_role_batch_assignment_handler(self) -> None:
+        """Setup handler for batched project role assignment requests"""
+        async def handle_batch_assign_role_request(subject: str, data: Dict[str, Any], respond: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+            try:
+                request = BatchAssignProjectRoleRequest.model_validate(data)
+            except Exception as e:
+                log.error(f"Error processing batched project role assignment request: {str(e)}")
+                await respond(BatchAssignProjectRoleResponse(
+                    success=False,
+                    message=f"Error processing request: {str(e)}",
+                    results=[]
+                ).model_dump())
+                return
+
+            log.info(f"Received batched project role assignment request with {len(request.assignments)} assignments")
+            try:
+                async with self.handler_scope() as services:
+                    response = await services.role_service.assign_project_roles_batch(request.assignments)
+                log.info(response.message)
+            except Exception as e:
+                # Nothing was written, every item failed
+                log.error(f"Error assigning project roles: {str(e)}")
+                response = BatchAssignProjectRoleResponse(
+                    success=False,
+                    message=f"Error assigning roles: {str(e)}",
+                    results=[
+                        AssignProjectRoleResponse(
+                            success=False,
+                            message=f"Error assigning role: {str(e)}",
+                            user_id=item.user_id,
+                            role_name=item.role_name,
+                            project_key=item.project_key,
+                            error_code="INTERNAL_ERROR"
+                        )
+                        for item in request.assignments
+                    ]
+                )
+            await respond(response.model_dump())
+
+        await self.nats_service.subscribe_request(
+            subject=NATSPublishTopic.ASSIGN_PROJECT_ROLES_BATCH_REQUEST.value,
+            callback=handle_batch_assign_role_request,
+            queue=self._queue_for(NATSPublishTopic.ASSIGN_PROJECT_ROLES_BATCH_REQUEST.value)
+        )
+        log.info(
+            f"Subscribed to {NATSPublishTopic.ASSIGN_PROJECT_ROLES_BATCH_REQUEST.value} for batched project role assignment requests")
+
+    async def _setup_project_role_batch_unassignment_handler(self) -> None:
+        """Setup handler for batched project role unassignment requests"""
+        async def handle_batch_unassign_role_request(subject: str, data: Dict[str, Any], respond: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+            try:
+                request = BatchUnassignProjectRoleRequest.model_validate(data)
+            except Exception as e:
+                log.error(f"Error processing batched project role unassignment request: {str(e)}")
+                await respond(BatchUnassignProjectRoleResponse(
+                    success=False,
+                    message=f"Error processing request: {str(e)}",
+                    results=[]
+                ).model_dump())
+                return
+
+            log.info(f"Received batched project role unassignment request with {len(request.unassignments)} unassignments")
+            try:
+                async with self.handler_scope() as services:
+                    response = await services.role_service.unassign_project_roles_batch(request.unassignments)
+                log.info(response.message)
+            except Exception as e:
+                # Nothing was written, every item failed
+                log.error(f"Error unassigning project roles: {str(e)}")
+                response = BatchUnassignProjectRoleResponse(
+                    success=False,
+                    message=f"Error unassigning roles: {str(e)}",
+                    results=[
+                        UnassignProjectRoleResponse(
+                            success=False,
+                            message=f"Error unassigning role: {str(e)}",
+                            user_id=item.user_id,
+                            role_name=item.role_name,
+                            project_key=item.project_key,
+                            error_code="INTERNAL_ERROR"
+                        )
+                        for item in request.unassignments
+                    ]
+                )
+            await respond(response.model_dump())
+
+        await self.nats_service.subscribe_request(
+            subject=NATSPublishTopic.UNASSIGN_PROJECT_ROLES_BATCH_REQUEST.value,
+            callback=handle_batch_unassign_role_request,
+            queue=self._queue_for(NATSPublishTopic.UNASSIGN_PROJECT_ROLES_BATCH_REQUEST.value)
+        )
+        log.info(
+            f"Subscribed to {NATSPublishTopic.UNASSIGN_PROJECT_ROLES_BATCH_REQUEST.value} for batched project role unassignment requests")
@@ -1,19 +1,20 @@
-from typing import List, Optional, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 from src.app.schemas.requests.project import LinkJiraProjectRequest
 from src.configs.logger import log
 from src.domain.constants.nats_events import NATSPublishTopic
 from src.domain.constants.roles import ProjectRoles
 from src.domain.entities.project import Project, ProjectCreate, ProjectUpdate
-from src.domain.entities.user import UserCreate
 from src.domain.entities.user_project_role import UserProjectRole
 from src.domain.events.project_events import (
+    JiraProjectSyncNATS,
     JiraProjectSyncNATSReplyDTO,
     JiraProjectSyncNATSRequestDTO,
     JiraUsersResponseEvent,
     SyncedJiraUserDTO,
 )
 from src.domain.exceptions.project_exceptions import (
+    JiraProjectSyncError,
     ProjectCreateError,
     ProjectKeyAlreadyExistsError,
     ProjectNotFoundError,
@@ -24,6 +25,7 @@ from src.domain.repositories.role_repository import IRoleRepository
 from src.domain.repositories.user_repository import IUserRepository
 from src.domain.services.nats_service import INATSService
 from src.domain.services.redis_service import IRedisService
+from src.domain.value_objects.jira_sync import JiraUserSyncResult
 
 
 class ProjectService:
@@ -80,6 +82,10 @@ class ProjectService:
         project_data: LinkJiraProjectRequest,
         current_user_id: int
     ) -> Project:
+        """Create the project and make the current user its product owner.
+
+        The Jira sync itself is slow and runs as a background job, see JiraLinkJobService.
+        """
         # Check if project with key already exists
         existing_project = await self.project_repository.get_project_by_key(project_data.key)
         if existing_project:
@@ -109,110 +115,69 @@ class ProjectService:
         await self.redis_service.delete(f"user:{current_user_id}")
         await self.redis_service.delete(f"permissions:user:{current_user_id}")
 
-        # Create Jira project sync request DTO
-        sync_request = JiraProjectSyncNATSRequestDTO(
-            project_id=new_project.id,
-            user_id=current_user_id,
-            project_key=project_data.key,
-            jira_project_id=project_data.jira_project_id,
-            sync_issues=True,
-            sync_sprints=True,
-            sync_users=True
+        return new_project
+
+    async def sync_jira_project(
+        self,
+        sync_request: JiraProjectSyncNATSRequestDTO,
+        timeout: float,
+        on_synced: Optional[Callable[[JiraProjectSyncNATS], Awaitable[None]]] = None
+    ) -> Tuple[JiraProjectSyncNATS, Optional[JiraUserSyncResult]]:
+        """Ask the Jira service to sync a linked project, then add its users as team members.
+
+        Args:
+            sync_request: The sync request sent to the Jira service
+            timeout: Seconds to wait for the Jira service to reply
+            on_synced: Called with the sync reply before the synced users are processed
+
+        Returns:
+            The Jira sync reply and the result of the user sync, if any users came back
+        """
+        reply_data = await self.nats_service.request(
+            NATSPublishTopic.JIRA_PROJECT_SYNC.value,
+            sync_request.model_dump(mode='json', exclude=None),
+            timeout=timeout
         )
 
-        # Publish project sync request to NATS and wait for reply
-        try:
-            reply_data = await self.nats_service.request(
-                NATSPublishTopic.JIRA_PROJECT_SYNC.value,
-                sync_request.model_dump(mode='json', exclude=None),
-                timeout=300
-            )
+        reply = JiraProjectSyncNATSReplyDTO.model_validate(reply_data)
+        if not reply.data.success:
+            raise JiraProjectSyncError(f"Jira project sync failed: {reply.data.error_message}")
 
-            # Process reply data
-            reply = JiraProjectSyncNATSReplyDTO.model_validate(reply_data)
-            if not reply.data.success:
-                raise Exception(f"Jira project sync failed: {reply.data.error_message}")
-            else:
-                log.info(f"Jira project sync completed: Issues: {reply.data.sync_summary.synced_issues}/{reply.data.sync_summary.total_issues}, " +
-                         f"Sprints: {reply.data.sync_summary.synced_sprints}/{reply.data.sync_summary.total_sprints}, " +
-                         f"Users: {reply.data.sync_summary.synced_users}/{reply.data.sync_summary.total_users}")
-
-                # Process synced users from Jira
-                if reply.data.synced_users:
-                    await self._process_synced_jira_users(reply.data.synced_users, new_project.id)
-        except Exception as e:
-            raise Exception(f"Error during Jira project sync: {str(e)}") from e
-
-        # # Publish find users event to NATS
-        # jira_event = JiraUsersRequestEvent(
-        #     admin_user_id=current_user_id,
-        #     project_id=new_project.id,
-        #     jira_project_id=project_data.jira_project_id,
-        #     key=project_data.key,
-        # )
-        # await self.nats_service.publish(
-        #     NATSPublishTopic.JIRA_USERS_REQUEST.value,
-        #     jira_event.model_dump(mode='json', exclude=None)
-        # )
+        log.info(f"Jira project sync completed: Issues: {reply.data.sync_summary.synced_issues}/{reply.data.sync_summary.total_issues}, " +
+                 f"Sprints: {reply.data.sync_summary.synced_sprints}/{reply.data.sync_summary.total_sprints}, " +
+                 f"Users: {reply.data.sync_summary.synced_users}/{reply.data.sync_summary.total_users}")
 
-        return new_project
+        if on_synced:
+            await on_synced(reply.data)
 
-    async def _process_synced_jira_users(self, synced_users: List[SyncedJiraUserDTO], project_id: int):
+        user_sync = None
+        if reply.data.synced_users:
+            user_sync = await self._process_synced_jira_users(reply.data.synced_users, sync_request.project_id)
+        return reply.data, user_sync
+
+    async def _process_synced_jira_users(self, synced_users: List[SyncedJiraUserDTO], project_id: int) -> JiraUserSyncResult:
         """Process synced users from Jira and create users if they don't exist.
 
         Args:
             synced_users: List of SyncedJiraUserDTO objects
             project_id: The ID of the project
         """
-        try:
-            # Get member role
-            member_role = await self.role_repository.get_role_by_name(ProjectRoles.TEAM_MEMBER.value)
-            if not member_role:
-                raise RoleNotFoundError(role_name=ProjectRoles.TEAM_MEMBER.value)
-
-            log.info(f"Processing {synced_users} synced users")
-            for jira_user in synced_users:
-                # First try to find user by email
-                user = await self.user_repository.get_user_by_email(jira_user.email)
-
-                if not user:
-                    # If not found by email, try to find by Jira account ID
-                    user = await self.user_repository.get_user_by_jira_account_id(jira_user.jira_account_id)
-
-                if not user:
-                    # Create new user if not exists
-                    user = await self.user_repository.create_user(
-                        UserCreate(
-                            email=jira_user.email,
-                            name=jira_user.name,
-                            is_active=False,
-                            jira_account_id=jira_user.jira_account_id,
-                            is_jira_linked=False,
-                            is_system_user=False,  # Users created from Jira sync are not system users
-                            avatar_url=jira_user.avatar_url
-                        )
-                    )
-                    log.info(f"Created new inactive user from Jira sync: {jira_user.email}")
-
-                if user and user.id:
-                    # Check if user already has a role in project
-                    has_role = await self.role_repository.check_user_has_any_project_role(
-                        user_id=user.id,
-                        project_id=project_id
-                    )
-
-                    # Only assign member role if user doesn't have any role
-                    if not has_role:
-                        await self.role_repository.assign_project_role_to_user(
-                            user_id=user.id,
-                            project_id=project_id,
-                            role_name=ProjectRoles.TEAM_MEMBER.value
-                        )
-                        log.info(f"Assigned member role to user {user.email} in project {project_id}")
-        except Exception as e:
-            log.error(f"Error processing synced Jira users: {str(e)}")
-            # Don't raise exception to not interrupt the project creation flow
-            # Just log the error and continue
+        # Get member role
+        member_role = await self.role_repository.get_role_by_name(ProjectRoles.TEAM_MEMBER.value)
+        if not member_role or member_role.id is None:
+            raise RoleNotFoundError(role_name=ProjectRoles.TEAM_MEMBER.value)
+
+        log.info(f"Processing {len(synced_users)} synced users")
+        result = await self.user_repository.bulk_sync_jira_users(
+            jira_users=synced_users,
+            project_id=project_id,
+            role_id=member_role.id,
+            match_by_email=True,
+            is_jira_linked=False
+        )
+        log.info(f"Jira user sync for project {project_id}: {result.created_users} created, " +
+                 f"{result.matched_users} matched, {result.assigned_memberships} assigned member role")
+        return result
 
     async def handle_jira_users_response_event(self, event: JiraUsersResponseEvent) -> None:
         """Handle users found in Jira project"""
@@ -224,50 +189,69 @@ class ProjectService:
 
             # Get member role
             member_role = await self.role_repository.get_role_by_name(ProjectRoles.TEAM_MEMBER.value)
-            if not member_role:
+            if not member_role or member_role.id is None:
                 raise RoleNotFoundError(role_name=ProjectRoles.TEAM_MEMBER.value)
 
             # Find matching users by jira_account_id and assign member role
-            for jira_user in event.users:
-                # Try to find existing user
-                user = await self.user_repository.get_user_by_jira_account_id(
-                    jira_user.jira_account_id
-                )
-
-                if not user:
-                    # Create new inactive user if not exists
-                    user = await self.user_repository.create_user(
-                        UserCreate(
-                            email=jira_user.email,
-                            name=jira_user.name,
-                            is_active=False,
-                            jira_account_id=jira_user.jira_account_id,
-                            is_jira_linked=True,
-                            is_system_user=False,  # Users created from Jira sync are not system users
-                        )
+            result = await self.user_repository.bulk_sync_jira_users(
+                jira_users=[
+                    SyncedJiraUserDTO(
+                        jira_account_id=jira_user.jira_account_id,
+                        name=jira_user.name,
+                        email=jira_user.email
                     )
-                    log.info(f"Created new inactive user from Jira: {jira_user.email}")
-
-                if user and user.id:
-                    # Check if user already has a role in project
-                    has_role = await self.role_repository.check_user_has_any_project_role(
-                        user_id=user.id,
-                        project_id=event.project_id
-                    )
-
-                    # Only assign member role if user doesn't have any role
-                    if not has_role:
-                        await self.role_repository.assign_project_role_to_user(
-                            user_id=user.id,
-                            project_id=event.project_id,
-                            role_name=ProjectRoles.TEAM_MEMBER.value
-                        )
-                        log.info(f"Assigned member role to user {user.email} in project {event.project_id}")
+                    for jira_user in event.users
+                ],
+                project_id=event.project_id,
+                role_id=member_role.id,
+                match_by_email=False,
+                is_jira_linked=True
+            )
+            log.info(f"Jira users for project {event.project_id}: {result.created_users} created, " +
+                     f"{result.matched_users} matched, {result.assigned_memberships} assigned member role")
 
         except Exception as e:
             log.error(f"Error handling Jira users found event: {str(e)}")
             raise
 
+    async def handle_jira_users_response_events(self, events: List[JiraUsersResponseEvent]) -> None:
+        """Handle a batch of Jira users responses in a single transaction.
+
+        Events for unknown projects are skipped so they do not send the rest of the batch back for redelivery.
+        """
+        project_users: Dict[int, List[SyncedJiraUserDTO]] = {}
+        for event in events:
+            if event.project_id not in project_users:
+                project = await self.project_repository.get_project_by_id(event.project_id)
+                if not project:
+                    log.error(f"Skipping Jira users for unknown project {event.project_id}")
+                    continue
+                project_users[event.project_id] = []
+            project_users[event.project_id].extend(
+                SyncedJiraUserDTO(
+                    jira_account_id=jira_user.jira_account_id,
+                    name=jira_user.name,
+                    email=jira_user.email
+                )
+                for jira_user in event.users
+            )
+        if not project_users:
+            return
+
+        member_role = await self.role_repository.get_role_by_name(ProjectRoles.TEAM_MEMBER.value)
+        if not member_role or member_role.id is None:
+            raise RoleNotFoundError(role_name=ProjectRoles.TEAM_MEMBER.value)
+
+        results = await self.user_repository.bulk_sync_jira_project_users(
+            project_users=project_users,
+            role_id=member_role.id,
+            match_by_email=False,
+            is_jira_linked=True
+        )
+        for project_id, result in results.items():
+            log.info(f"Jira users for project {project_id}: {result.created_users} created, " +
+                     f"{result.matched_users} matched, {result.assigned_memberships} assigned member role")
+
     async def get_project_users_with_roles(self, project_key: str, search: Optional[str] = None) -> List[UserProjectRole]:
         """Get all users in a project with their roles
 
@@ -1,13 +1,22 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from src.app.schemas.requests.role import RoleCreateRequest, RoleUpdateRequest
 from src.domain.entities.role import Role, RoleCreate as DomainRoleCreate, RoleUpdate as DomainRoleUpdate
 from src.domain.entities.user_project_role import UserProjectRole
+from src.domain.events.role_events import (
+    AssignProjectRoleRequest,
+    AssignProjectRoleResponse,
+    BatchAssignProjectRoleResponse,
+    BatchUnassignProjectRoleResponse,
+    UnassignProjectRoleRequest,
+    UnassignProjectRoleResponse,
+)
 from src.domain.exceptions.project_exceptions import ProjectNotFoundError
 from src.domain.exceptions.role_exceptions import (
     InvalidPermissionIdsError,
     RoleError,
+    RoleIsSystemRoleError,
     RoleNotFoundError,
 )
 from src.domain.exceptions.user_exceptions import UserNotFoundError
@@ -15,6 +24,17 @@ from src.domain.repositories.permission_repository import IPermissionRepository
 from src.domain.repositories.project_repository import IProjectRepository
 from src.domain.repositories.role_repository import IRoleRepository
 from src.domain.repositories.user_repository import IUserRepository
+from src.domain.value_objects.pagination import CursorPage
+from src.domain.value_objects.roles import ProjectRoleAssignment
+
+ProjectRoleItem = Union[AssignProjectRoleRequest, UnassignProjectRoleRequest]
+
+
+@dataclass
+class ResolvedProjectRoles:
+    """Items of a batch that passed validation, by position, and the error of every other item"""
+    assignments: Dict[int, ProjectRoleAssignment]
+    errors: Dict[int, Tuple[str, str]]
 
 
 @dataclass
@@ -86,23 +106,27 @@ class RoleService:
 
     async def get_all_roles(
         self,
-        page: int = 1,
-        page_size: int = 10,
+        limit: int = 10,
+        cursor: Optional[str] = None,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         is_active: Optional[bool] = None,
-        is_system_role: Optional[bool] = None
-    ) -> Tuple[List[Role], int]:
-        """Get paginated, filtered and sorted roles"""
+        is_system_role: Optional[bool] = None,
+        include_total: bool = False,
+        offset: int = 0
+    ) -> CursorPage[Role]:
+        """Get a cursor page of filtered and sorted roles"""
         return await self.role_repository.get_all_roles(
-            page=page,
-            page_size=page_size,
+            limit=limit,
+            cursor=cursor,
             search=search,
             sort_by=sort_by,
             sort_order=sort_order,
             is_active=is_active,
-            is_system_role=is_system_role
+            is_system_role=is_system_role,
+            include_total=include_total,
+            offset=offset
         )
 
     async def delete_role(self, role_id: int) -> Role:
@@ -121,24 +145,28 @@ class RoleService:
     async def get_project_roles_by_project_id(
         self,
         project_id: int,
-        page: int = 1,
-        page_size: int = 10,
+        limit: int = 10,
+        cursor: Optional[str] = None,
         role_name: Optional[str] = None,
-        search: Optional[str] = None
-    ) -> Tuple[List[UserProjectRole], int]:
+        search: Optional[str] = None,
+        include_total: bool = False,
+        offset: int = 0
+    ) -> CursorPage[UserProjectRole]:
         # Verify project exists
         project = await self.project_repository.get_project_by_id(project_id)
         if not project:
             raise ProjectNotFoundError(
                 f"Project with id {project_id} not found")
 
-        # Get paginated assignments
+        # Get a cursor page of assignments
         return await self.role_repository.get_project_roles_by_project_id(
             project_id=project_id,
-            page=page,
-            page_size=page_size,
+            limit=limit,
+            cursor=cursor,
             role_name=role_name,
-            search=search
+            search=search,
+            include_total=include_total,
+            offset=offset
         )
 
     # async def assign_project_role(self, project_id: int, assignment: AssignProjectRoleRequest) -> None:
@@ -173,20 +201,24 @@ class RoleService:
 
     async def get_system_roles(
         self,
-        page: int = 1,
-        page_size: int = 10,
+        limit: int = 10,
+        cursor: Optional[str] = None,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
-        is_active: Optional[bool] = None
-    ) -> Tuple[List[Role], int]:
+        is_active: Optional[bool] = None,
+        include_total: bool = False,
+        offset: int = 0
+    ) -> CursorPage[Role]:
         return await self.role_repository.get_system_roles(
-            page=page,
-            page_size=page_size,
+            limit=limit,
+            cursor=cursor,
             search=search,
             sort_by=sort_by,
             sort_order=sort_order,
-            is_active=is_active
+            is_active=is_active,
+            include_total=include_total,
+            offset=offset
         )
 
     async def get_all_roles_without_pagination(
@@ -195,17 +227,16 @@ class RoleService:
     ) -> List[Role]:
         """Get all roles without pagination, filtering only by is_active"""
         # We can reuse the existing get_all_roles method but ignore pagination and other filters
-        roles, _ = await self.role_repository.get_all_roles(
-            page=1,
-            # Set a very large page size to effectively get all roles
-            page_size=10000,
+        page = await self.role_repository.get_all_roles(
+            # Set a very large limit to effectively get all roles in one page
+            limit=10000,
             search=None,
             sort_by=None,
             sort_order=None,
             is_active=is_active,
             is_system_role=None
         )
-        return roles
+        return page.items
 
     async def assign_project_roles(
         self,
@@ -256,3 +287,93 @@ class RoleService:
                 project_id=project_id,
                 role_id=role_id
             )
+
+    async def assign_project_roles_batch(
+        self,
+        requests: List[AssignProjectRoleRequest]
+    ) -> BatchAssignProjectRoleResponse:
+        """Assign many project roles, validated with one query per entity type and written in one transaction.
+
+        Invalid items are reported in their result and skipped, the valid ones are still applied.
+        """
+        resolved = await self._resolve_project_roles(requests, require_active=True)
+        await self.role_repository.bulk_assign_project_roles(list(resolved.assignments.values()))
+
+        results: List[AssignProjectRoleResponse] = []
+        for i, request in enumerate(requests):
+            error = resolved.errors.get(i)
+            results.append(AssignProjectRoleResponse(
+                success=error is None,
+                message=error[1] if error else
+                f"Successfully assigned role {request.role_name} to user {request.user_id} in project {request.project_key}",
+                user_id=request.user_id,
+                role_name=request.role_name,
+                project_key=request.project_key,
+                error_code=error[0] if error else None
+            ))
+        return BatchAssignProjectRoleResponse(
+            success=not resolved.errors,
+            message=f"Assigned {len(resolved.assignments)} of {len(requests)} project roles",
+            results=results
+        )
+
+    async def unassign_project_roles_batch(
+        self,
+        requests: List[UnassignProjectRoleRequest]
+    ) -> BatchUnassignProjectRoleResponse:
+        """Unassign many project roles, validated with one query per entity type and written in one transaction.
+
+        Invalid items are reported in their result and skipped, the valid ones are still applied.
+        """
+        resolved = await self._resolve_project_roles(requests, require_active=False)
+        await self.role_repository.bulk_unassign_project_roles(list(resolved.assignments.values()))
+
+        results: List[UnassignProjectRoleResponse] = []
+        for i, request in enumerate(requests):
+            error = resolved.errors.get(i)
+            results.append(UnassignProjectRoleResponse(
+                success=error is None,
+                message=error[1] if error else
+                f"Successfully unassigned role {request.role_name} from user {request.user_id} in project {request.project_key}",
+                user_id=request.user_id,
+                role_name=request.role_name,
+                project_key=request.project_key,
+                error_code=error[0] if error else None
+            ))
+        return BatchUnassignProjectRoleResponse(
+            success=not resolved.errors,
+            message=f"Unassigned {len(resolved.assignments)} of {len(requests)} project roles",
+            results=results
+        )
+
+    async def _resolve_project_roles(
+        self,
+        items: Sequence[ProjectRoleItem],
+        require_active: bool
+    ) -> ResolvedProjectRoles:
+        """Resolve project keys, role names and user ids of a batch with a single query each"""
+        projects = await self.project_repository.get_projects_by_keys(list({item.project_key for item in items}))
+        roles = await self.role_repository.get_roles_by_names(list({item.role_name for item in items}))
+        user_ids = await self.user_repository.get_existing_user_ids(list({item.user_id for item in items}))
+        projects_by_key = {project.key.upper(): project for project in projects}
+        roles_by_name = {role.name: role for role in roles}
+
+        resolved = ResolvedProjectRoles(assignments={}, errors={})
+        for i, item in enumerate(items):
+            project = projects_by_key.get(item.project_key.upper())
+            role = roles_by_name.get(item.role_name)
+            if not project or not project.id:
+                resolved.errors[i] = ("PROJECT_NOT_FOUND", f"Project with key {item.project_key} not found")
+            elif not role or not role.id or (require_active and not role.is_active):
+                resolved.errors[i] = ("ROLE_NOT_FOUND", str(RoleNotFoundError(role_name=item.role_name)))
+            elif role.is_system_role:
+                resolved.errors[i] = ("ROLE_IS_SYSTEM_ROLE", str(RoleIsSystemRoleError(item.role_name)))
+            elif item.user_id not in user_ids:
+                resolved.errors[i] = ("USER_NOT_FOUND", f"User with id {item.user_id} not found")
+            else:
+                resolved.assignments[i] = ProjectRoleAssignment(
+                    user_id=item.user_id,
+                    project_id=project.id,
+                    role_id=role.id
+                )
+        return resolved
@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Dict, List, Optional
 
 from src.domain.entities.user import User, UserProfileUpdate
 from src.domain.entities.user_performance import UserPerformance, UserPerformanceCreate, UserPerformanceUpdate
@@ -9,7 +9,12 @@ from src.domain.exceptions.user_exceptions import (
 )
 from src.domain.repositories.user_performance_repository import IUserPerformanceRepository
 from src.domain.repositories.user_repository import IUserRepository
+from src.domain.services.local_cache import ILocalCache
 from src.domain.services.redis_service import IRedisService
+from src.domain.value_objects.users import UserSearchResult
+
+# Opens a user repository on its own database session, for streams that outlive the request's session
+UserRepositoryScope = Callable[[], AsyncContextManager[IUserRepository]]
 
 
 class UserService:
@@ -17,11 +22,19 @@ class UserService:
         self,
         user_repository: IUserRepository,
         user_performance_repository: IUserPerformanceRepository,
-        redis_service: IRedisService
+        redis_service: IRedisService,
+        local_cache: ILocalCache,
+        user_repository_scope: UserRepositoryScope,
+        export_batch_size: int = 500,
+        search_min_length: int = 3
     ):
         self.user_repository = user_repository
         self.user_performance_repository = user_performance_repository
         self.redis_service = redis_service
+        self.local_cache = local_cache
+        self.user_repository_scope = user_repository_scope
+        self.export_batch_size = export_batch_size
+        self.search_min_length = search_min_length
         self.cache_ttl = timedelta(minutes=5)
 
     async def get_current_user(self, user_id: int) -> User:
@@ -29,9 +42,9 @@ class UserService:
         cache_key = f"user:{user_id}"
 
         # Try to get from cache
-        cached_user = await self.redis_service.get(cache_key)
+        cached_user = await self._get_cached_user(cache_key)
         if cached_user:
-            return User.model_validate(cached_user)
+            return cached_user
 
         # Get from database with project roles and permissions
         user = await self.user_repository.get_user_by_id(user_id)
@@ -41,11 +54,7 @@ class UserService:
             raise UserInactiveError(f"User with id {user_id} is inactive")
 
         # Cache user data
-        await self.redis_service.set(
-            key=cache_key,
-            value=user.model_dump(),
-            expiry=int(self.cache_ttl.total_seconds())
-        )
+        await self._cache_user(cache_key, user)
         return user
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
@@ -70,31 +79,91 @@ class UserService:
         # Get all users from system
         return await self.user_repository.get_all_users(search=search)
 
+    async def stream_users(
+        self,
+        search: Optional[str] = None
+    ) -> AsyncIterator[User]:
+        """Stream users with their system role for export, without holding them all in memory
+
+        Args:
+            search: Optional search term to filter users by name or email
+
+        Yields:
+            User objects, ordered by ID
+        """
+        async with self.user_repository_scope() as user_repository:
+            async for user in user_repository.stream_users(search=search, batch_size=self.export_batch_size):
+                yield user
+
+    async def search_users(self, term: str, limit: int = 10) -> List[UserSearchResult]:
+        """Type-ahead search over active users' names and emails
+
+        Args:
+            term: What has been typed so far, terms shorter than search_min_length match nothing
+            limit: Maximum number of users to return
+
+        Returns:
+            Matching users, most similar first
+        """
+        term = term.strip()
+        if len(term) < self.search_min_length:
+            return []
+        return await self.user_repository.search_users(term, limit=limit)
+
     def _validate_update_data(self, update_data: Dict[str, Any]) -> bool:
         """Validate user update data"""
         allowed_fields = {"name", "email", "is_active"}
         return all(key in allowed_fields for key in update_data.keys())
 
     async def get_users_by_ids(self, user_ids: List[int]) -> List[User]:
-        """Get multiple users by their IDs"""
-        users = []
-        for user_id in user_ids:
-            try:
-                user = await self.get_current_user(user_id)
-                users.append(user)
-            except Exception:
-                # Skip users that can't be retrieved
-                continue
-        return users
+        """Get multiple users by their IDs.
+
+        Looks in the in-process cache first, fetches the rest with one Redis MGET,
+        loads whatever is still missing with a single query and backfills Redis in
+        one pipeline. Unknown and inactive users are skipped.
+        """
+        unique_ids = list(dict.fromkeys(user_ids))
+        found: Dict[int, User] = {}
+
+        redis_ids: List[int] = []
+        for user_id in unique_ids:
+            user = self.local_cache.get(f"user:{user_id}")
+            if user:
+                found[user_id] = user
+            else:
+                redis_ids.append(user_id)
+
+        missing_ids: List[int] = []
+        cached_users = await self.redis_service.get_many([f"user:{user_id}" for user_id in redis_ids])
+        for user_id, cached_user in zip(redis_ids, cached_users, strict=True):
+            self.local_cache.record_fallback(hit=cached_user is not None)
+            if cached_user:
+                user = User.model_validate(cached_user)
+                self.local_cache.set(f"user:{user_id}", user)
+                found[user_id] = user
+            else:
+                missing_ids.append(user_id)
+
+        if missing_ids:
+            backfill: Dict[str, Dict[str, Any]] = {}
+            for user in await self.user_repository.get_users_by_ids(missing_ids):
+                if not user.id or not user.is_active:
+                    continue
+                found[user.id] = user
+                backfill[f"user:{user.id}"] = user.model_dump()
+                self.local_cache.set(f"user:{user.id}", user)
+            await self.redis_service.set_many(backfill, expiry=int(self.cache_ttl.total_seconds()))
+
+        return [found[user_id] for user_id in unique_ids if user_id in found]
 
     async def get_user_with_profile_data(self, user_id: int) -> User:
         """Get user with complete profile data (including relationships)"""
         cache_key = f"user_profile:{user_id}"
 
         # Try to get from cache
-        cached_user = await self.redis_service.get(cache_key)
+        cached_user = await self._get_cached_user(cache_key)
         if cached_user:
-            return User.model_validate(cached_user)
+            return cached_user
 
         # Get from database with all profile relationships
         user = await self.user_repository.get_user_profile(user_id)
@@ -104,13 +173,33 @@ class UserService:
             raise UserInactiveError(f"User with id {user_id} is inactive")
 
         # Cache user profile data
+        await self._cache_user(cache_key, user)
+
+        return user
+
+    async def _get_cached_user(self, cache_key: str) -> Optional[User]:
+        """Look a user up in the in-process cache, then in Redis"""
+        user: Optional[User] = self.local_cache.get(cache_key)
+        if user:
+            return user
+
+        cached_user = await self.redis_service.get(cache_key)
+        self.local_cache.record_fallback(hit=cached_user is not None)
+        if not cached_user:
+            return None
+
+        user = User.model_validate(cached_user)
+        self.local_cache.set(cache_key, user)
+        return user
+
+    async def _cache_user(self, cache_key: str, user: User) -> None:
+        """Write a user through both cache tiers"""
         await self.redis_service.set(
             key=cache_key,
             value=user.model_dump(),
             expiry=int(self.cache_ttl.total_seconds())
         )
-
-        return user
+        self.local_cache.set(cache_key, user)
 
     async def get_user_performance(
         self,
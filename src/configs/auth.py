@@ -1,8 +1,23 @@
 from fastapi.security import OAuth2PasswordBearer
 
+from src.configs.settings import settings
+from src.infrastructure.services.crypto_executor import CryptoExecutor
+from src.infrastructure.services.jwt_key_store import JWTKeyStore
+
 # Centralize OAuth2 configuration
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="api/v1/auth/token",
     scheme_name="JWT",
     description="JWT authentication"
 )
+
+# Process-wide JWT keys, parsed once and reloaded only when the PEM files change
+jwt_key_store = JWTKeyStore(
+    private_key_path=settings.JWT_PRIVATE_KEY_PATH,
+    public_key_path=settings.JWT_PUBLIC_KEY_PATH,
+    algorithm=settings.JWT_ALGORITHM,
+    reload_interval=settings.JWT_KEY_RELOAD_INTERVAL
+)
+
+# Process-wide pool for CPU-bound crypto so signing and bcrypt never block the event loop
+crypto_executor = CryptoExecutor(max_workers=settings.CRYPTO_EXECUTOR_MAX_WORKERS)
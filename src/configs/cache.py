@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from src.configs.nats import get_nats_client
+from src.configs.settings import settings
+from src.infrastructure.services.cache_invalidation_service import CacheInvalidationService
+from src.infrastructure.services.local_cache import LocalCache
+
+# Process-wide first tier in front of Redis for the hottest user lookups
+user_local_cache = LocalCache(
+    max_size=settings.USER_CACHE_LOCAL_MAX_SIZE,
+    ttl=settings.USER_CACHE_LOCAL_TTL
+)
+
+_cache_invalidation_service: Optional[CacheInvalidationService] = None
+
+
+async def get_cache_invalidation_service() -> CacheInvalidationService:
+    """Get the process-wide cache invalidation service.
+
+    Returns:
+        CacheInvalidationService: Service bound to the shared NATS connection
+    """
+    global _cache_invalidation_service
+    if _cache_invalidation_service is None:
+        _cache_invalidation_service = CacheInvalidationService(
+            local_cache=user_local_cache,
+            nats_service=await get_nats_client()
+        )
+    return _cache_invalidation_service
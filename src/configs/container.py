@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.configs.auth import crypto_executor, jwt_key_store
+from src.configs.cache import get_cache_invalidation_service
+from src.configs.http import http_client
+from src.configs.nats import get_nats_client
+from src.configs.redis import get_redis_client
+from src.infrastructure.services.cache_invalidation_service import CacheInvalidationService
+from src.infrastructure.services.crypto_executor import CryptoExecutor
+from src.infrastructure.services.http_client import HTTPClient
+from src.infrastructure.services.jira_sso_service import JiraSSOService
+from src.infrastructure.services.jwt_key_store import JWTKeyStore
+from src.infrastructure.services.microsoft_sso_service import MicrosoftSSOService
+from src.infrastructure.services.nats_service import NATSService
+from src.infrastructure.services.redis_refresh_token_store import RedisRefreshTokenStore
+from src.infrastructure.services.redis_service import RedisService
+
+
+@dataclass(frozen=True)
+class AppContainer:
+    """Stateless services built once per process and shared by every request.
+
+    Only what holds a database session is built per request, on top of these.
+    """
+    nats_service: NATSService
+    redis_service: RedisService
+    refresh_token_store: RedisRefreshTokenStore
+    http_client: HTTPClient
+    key_store: JWTKeyStore
+    crypto_executor: CryptoExecutor
+    microsoft_sso_service: MicrosoftSSOService
+    jira_sso_service: JiraSSOService
+
+
+def build_app_container(
+    nats_service: NATSService,
+    redis_client: Redis[str],
+    cache_invalidation_service: CacheInvalidationService
+) -> AppContainer:
+    """Wire the app-scoped services around already created clients"""
+    return AppContainer(
+        nats_service=nats_service,
+        redis_service=RedisService(redis_client=redis_client, cache_invalidation_service=cache_invalidation_service),
+        refresh_token_store=RedisRefreshTokenStore(redis_client),
+        http_client=http_client,
+        key_store=jwt_key_store,
+        crypto_executor=crypto_executor,
+        microsoft_sso_service=MicrosoftSSOService(
+            key_store=jwt_key_store,
+            crypto_executor=crypto_executor,
+            http_client=http_client
+        ),
+        jira_sso_service=JiraSSOService(http_client=http_client)
+    )
+
+
+_container: Optional[AppContainer] = None
+
+
+async def get_app_container() -> AppContainer:
+    """Get the process-wide service container, building it on first use.
+
+    Returns:
+        AppContainer: Services shared by every request and message handler
+    """
+    global _container
+    if _container is None:
+        _container = build_app_container(
+            nats_service=await get_nats_client(),
+            redis_client=await get_redis_client(),
+            cache_invalidation_service=await get_cache_invalidation_service()
+        )
+    return _container
+
+
+def reset_app_container() -> None:
+    """Drop the container so the next use rebuilds it around fresh clients"""
+    global _container
+    _container = None
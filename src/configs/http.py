@@ -0,0 +1,12 @@
+from src.configs.settings import settings
+from src.infrastructure.services.http_client import HTTPClient
+
+# Process-wide pooled HTTP client for the SSO providers and the Jira API
+http_client = HTTPClient(
+    limit=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+    limit_per_host=settings.HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST,
+    keepalive_timeout=settings.HTTP_CLIENT_KEEPALIVE_TIMEOUT,
+    dns_cache_ttl=settings.HTTP_CLIENT_DNS_CACHE_TTL,
+    total_timeout=settings.HTTP_CLIENT_TIMEOUT,
+    connect_timeout=settings.HTTP_CLIENT_CONNECT_TIMEOUT
+)
@@ -0,0 +1,68 @@
+import glob
+import os
+import re
+import shutil
+
+from src.configs.logger import log
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Live gauge files are written per process, e.g. gauge_livesum_1234.db
+_LIVE_GAUGE_FILE = re.compile(r"gauge_live\w+?_(\d+)\.db$")
+
+
+def is_multiprocess() -> bool:
+    """Whether metrics are written to the shared directory instead of process memory"""
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def prepare_multiprocess_dir(directory: str) -> None:
+    """Empty the metrics directory and point every worker at it.
+
+    Runs in the supervisor before prometheus_client is imported and before any worker
+    starts: prometheus_client picks its storage on import, and files left by a previous
+    run would be reported as if they were current.
+    """
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+    os.environ[MULTIPROC_DIR_ENV] = directory
+    log.info(f"Collecting metrics of every worker in {directory}")
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def mark_dead_workers() -> None:
+    """Drop the live gauges of workers that exited without cleaning up, e.g. after a crash.
+
+    Counters and histograms of dead workers are kept, their totals stay part of the sum.
+    """
+    if not is_multiprocess():
+        return
+    from prometheus_client import multiprocess
+
+    pids = set()
+    for path in glob.glob(os.path.join(os.environ[MULTIPROC_DIR_ENV], "gauge_live*.db")):
+        match = _LIVE_GAUGE_FILE.search(os.path.basename(path))
+        if match:
+            pids.add(int(match.group(1)))
+    for pid in pids:
+        if pid != os.getpid() and not _is_alive(pid):
+            multiprocess.mark_process_dead(pid)  # type: ignore[no-untyped-call]
+            log.info(f"Removed live metrics of dead worker {pid}")
+
+
+def mark_process_dead() -> None:
+    """Drop the live gauges of this process, for a worker shutting down or the supervisor"""
+    if not is_multiprocess():
+        return
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(os.getpid())  # type: ignore[no-untyped-call]
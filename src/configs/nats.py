@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from src.infrastructure.services.nats_service import NATSService
+
+_nats_service: Optional[NATSService] = None
+
+
+async def get_nats_client() -> NATSService:
+    """Get the process-wide NATS service instance.
+
+    The connection is opened once and shared by every request-scoped
+    dependency, so publishing does not pay a connect handshake per request.
+
+    Returns:
+        NATSService: Connected NATS service instance
+    """
+    global _nats_service
+    if _nats_service is None:
+        _nats_service = NATSService()
+    if not _nats_service.is_connected:
+        await _nats_service.connect()
+    return _nats_service
+
+
+async def close_nats_client() -> None:
+    """Drain and close the process-wide NATS connection if it was opened."""
+    global _nats_service
+    if _nats_service is not None:
+        await _nats_service.disconnect()
+        _nats_service = None
@@ -26,16 +26,31 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
     ENABLE_METRICS: bool = True
+    # Shared metric files of every worker, used whenever more than one worker runs
+    METRICS_MULTIPROC_DIR: str = "/tmp/prometheus_multiproc"
 
     # Port
     PORT: int = 8000
 
+    # Server process settings, see src/server.py
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_WORKERS: int = 0  # Worker processes, 0 starts one per CPU core
+    SERVER_RELOAD: bool = False  # Restart on file changes, development only, forces a single process
+    SERVER_MAX_REQUESTS: int = 0  # Requests a worker serves before it is replaced, 0 never recycles
+    SERVER_GRACEFUL_TIMEOUT: int = 30  # Seconds a stopping worker waits for in-flight requests
+    SERVER_KEEPALIVE_TIMEOUT: int = 5
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"  # Proxies trusted for X-Forwarded-* headers
+
     # Redis settings
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_PASSWORD: str | None = None  # Add password if Redis is secured
     REDIS_DB: int = 0  # Default Redis database
 
+    # In-process user cache kept in front of Redis
+    USER_CACHE_LOCAL_MAX_SIZE: int = 10000
+    USER_CACHE_LOCAL_TTL: int = 30  # Seconds, bounds staleness if an invalidation is missed
+
     # FastAPI Azure Auth settings
     BACKEND_CORS_ORIGINS: list[str | AnyHttpUrl] = [
         "http://localhost:8000", "http://localhost:4200"]
@@ -54,6 +69,32 @@ class Settings(BaseSettings):
     NATS_CLUSTER_ID: str = "test-cluster"
     NATS_USERNAME: str = "myuser"
     NATS_PASSWORD: str = "mypassword"
+    NATS_RECONNECT_TIME_WAIT: int = 3
+    NATS_MAX_RECONNECT_ATTEMPTS: int = -1  # Keep retrying, the connection is shared process-wide
+    NATS_HANDLER_MAX_CONCURRENCY: int = 32  # Messages handled at once, each holds a DB connection while it runs
+    NATS_SUBSCRIPTION_PENDING_LIMIT: int = 1000  # Messages buffered per subscription while every handler is busy
+    NATS_HANDLER_SHUTDOWN_TIMEOUT: float = 10.0  # Seconds to let in-flight handlers finish on disconnect
+    # Replicas share this queue group so each request and event is handled once, empty disables it
+    NATS_QUEUE_GROUP: str = "auth_service"
+    # Subjects every replica must see, subscribed without the queue group
+    NATS_FANOUT_SUBJECTS: list[str] = []
+    # Payload format of outgoing messages: json, orjson or msgpack (install the extra of the same name,
+    # startup fails without it).
+    # Incoming messages are decoded by their Content-Type header, untagged ones as JSON
+    NATS_CODEC: str = "json"
+    # Durable JetStream consumers for events that must survive restarts, the streams must already exist
+    NATS_JETSTREAM_ENABLED: bool = False
+    NATS_JETSTREAM_DURABLE_PREFIX: str = "auth_service"
+    NATS_JETSTREAM_BATCH_SIZE: int = 100
+    NATS_JETSTREAM_MAX_DELIVER: int = 5
+    NATS_JETSTREAM_ACK_WAIT: float = 60.0  # Seconds a fetched batch may take before it is redelivered
+    NATS_JETSTREAM_FETCH_TIMEOUT: float = 5.0
+    NATS_JETSTREAM_NAK_DELAY: float = 5.0  # Seconds before a failed batch is redelivered
+
+    # Outbox relay publishing user and login events after their transaction commits
+    OUTBOX_RELAY_BATCH_SIZE: int = 200
+    OUTBOX_RELAY_POLL_INTERVAL: float = 0.5  # Seconds between polls while the outbox is empty
+    OUTBOX_RELAY_MAX_ATTEMPTS: int = 10  # Failed publishes before an event is dead-lettered
 
     # Refresh token settings
     REFRESH_TOKEN_EXPIRATION_TIME: int = 60 * 60 * 24 * 30  # 30 days
@@ -69,10 +110,33 @@ class Settings(BaseSettings):
     JWT_PRIVATE_KEY_PATH: str = "keys/jwt-private.pem"
     JWT_PUBLIC_KEY_PATH: str = "keys/jwt-public.pem"
     JWT_ISSUER: str = "zodc-service-auth"
+    JWT_KEY_RELOAD_INTERVAL: int = 60  # Seconds between checks of the key files for rotation
+
+    # Worker threads for CPU-heavy crypto (token signing, bcrypt) kept off the event loop
+    CRYPTO_EXECUTOR_MAX_WORKERS: int = 4
+
+    # Pooled HTTP client for the SSO providers and the Jira API
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_CLIENT_KEEPALIVE_TIMEOUT: float = 30.0  # Seconds an idle connection is kept open for reuse
+    HTTP_CLIENT_DNS_CACHE_TTL: int = 300  # Seconds
+    HTTP_CLIENT_TIMEOUT: float = 15.0  # Seconds for a whole request
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 5.0
 
     # Jira settings
     JIRA_BASE_URL: str
 
+    # Background Jira project linking
+    JIRA_PROJECT_SYNC_TIMEOUT: int = 300  # Seconds to wait for the Jira service to finish a project sync
+    JIRA_LINK_JOB_TTL: int = 60 * 60 * 24  # 1 day, how long job status stays queryable
+    JIRA_LINK_JOB_POLL_INTERVAL: float = 1.0  # Seconds between job status checks on the SSE stream
+
+    # Streaming admin user export
+    USER_EXPORT_BATCH_SIZE: int = 500  # Rows fetched from the server-side cursor at a time
+
+    # Type-ahead user search, shorter terms have no trigram to look up in the index
+    USER_SEARCH_MIN_LENGTH: int = 3
+
     class Config:
         """Configuration settings."""
 
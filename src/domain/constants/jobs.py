@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class JiraLinkJobStatus(str, Enum):
+    PENDING = "pending"
+    SYNCING = "syncing"
+    PROCESSING_USERS = "processing_users"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @property
+    def is_terminal(self) -> bool:
+        return self in (JiraLinkJobStatus.SUCCEEDED, JiraLinkJobStatus.FAILED)
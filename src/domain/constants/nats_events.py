@@ -20,6 +20,9 @@ class NATSPublishTopic(str, Enum):
     JIRA_PROJECT_SYNC = "jira.project.sync.request"
     ASSIGN_PROJECT_ROLE_REQUEST = "role.assign.request"
     UNASSIGN_PROJECT_ROLE_REQUEST = "role.unassign.request"
+    ASSIGN_PROJECT_ROLES_BATCH_REQUEST = "role.assign.batch.request"
+    UNASSIGN_PROJECT_ROLES_BATCH_REQUEST = "role.unassign.batch.request"
+    USER_CACHE_INVALIDATED = "auth.cache.invalidate"
 
 
 class NATSSubscribeTopic(str, Enum):
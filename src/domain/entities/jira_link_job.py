@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from src.domain.constants.jobs import JiraLinkJobStatus
+from src.domain.events.project_events import JiraProjectSyncSummaryDTO
+from src.domain.value_objects.jira_sync import JiraUserSyncResult
+
+
+class JiraLinkJob(BaseModel):
+    # Jobs live in Redis only and are keyed by a UUID
+    job_id: str
+    project_id: int
+    project_key: str
+    jira_project_id: str
+    user_id: int
+    status: JiraLinkJobStatus = JiraLinkJobStatus.PENDING
+    sync_summary: Optional[JiraProjectSyncSummaryDTO] = None
+    user_sync: Optional[JiraUserSyncResult] = None
+    error_message: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,13 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .base import BaseEntity
+
+
+class OutboxEvent(BaseEntity):
+    id: int
+    subject: str
+    user_id: Optional[int] = None
+    payload: Dict[str, Any]
+    attempts: int = 0
+    created_at: datetime
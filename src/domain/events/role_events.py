@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -50,3 +50,27 @@ class UnassignProjectRoleResponse(BaseModel):
     role_name: str = Field(..., description="Name of the role that was unassigned")
     project_key: str = Field(..., description="Key of the project where the role was unassigned")
     error_code: Optional[str] = Field(None, description="Error code if an error occurred")
+
+
+class BatchAssignProjectRoleRequest(BaseModel):
+    """Request model for assigning several project roles at once"""
+    assignments: List[AssignProjectRoleRequest] = Field(..., description="Roles to assign, applied in one transaction")
+
+
+class BatchAssignProjectRoleResponse(BaseModel):
+    """Response model for a batched project role assignment request"""
+    success: bool = Field(..., description="Whether every assignment succeeded")
+    message: str = Field(..., description="Summary of the batch")
+    results: List[AssignProjectRoleResponse] = Field(..., description="Result of each assignment, in request order")
+
+
+class BatchUnassignProjectRoleRequest(BaseModel):
+    """Request model for unassigning several project roles at once"""
+    unassignments: List[UnassignProjectRoleRequest] = Field(..., description="Roles to unassign, applied in one transaction")
+
+
+class BatchUnassignProjectRoleResponse(BaseModel):
+    """Response model for a batched project role unassignment request"""
+    success: bool = Field(..., description="Whether every unassignment succeeded")
+    message: str = Field(..., description="Summary of the batch")
+    results: List[UnassignProjectRoleResponse] = Field(..., description="Result of each unassignment, in request order")
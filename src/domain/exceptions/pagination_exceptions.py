@@ -0,0 +1,5 @@
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or was issued for a different sort order"""
+
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        super().__init__(message)
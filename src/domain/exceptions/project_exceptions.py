@@ -21,3 +21,13 @@ class ProjectKeyAlreadyExistsError(ProjectError):
 class UnauthorizedError(ProjectError):
     """Exception raised when a user is not authorized to perform an action."""
     pass
+
+
+class JiraLinkJobNotFoundError(ProjectError):
+    """Exception raised when a Jira link job is unknown or has expired."""
+    pass
+
+
+class JiraProjectSyncError(ProjectError):
+    """Exception raised when the Jira service reports a failed project sync."""
+    pass
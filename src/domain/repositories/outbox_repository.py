@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from src.domain.entities.outbox_event import OutboxEvent
+
+
+class IOutboxRepository(ABC):
+    @abstractmethod
+    async def add(self, subject: str, payload: Dict[str, Any], user_id: Optional[int] = None) -> None:
+        """Stage an event in the current transaction, it is published once the transaction commits"""
+        pass
+
+    @abstractmethod
+    async def try_lock_relay(self) -> bool:
+        """Take the lock that lets one relay publish until the transaction ends, False while another relay holds it"""
+        pass
+
+    @abstractmethod
+    async def claim_batch(self, limit: int) -> List[OutboxEvent]:
+        """Load the oldest pending events that are not dead-lettered"""
+        pass
+
+    @abstractmethod
+    async def delete(self, event_ids: List[int]) -> None:
+        """Remove published events"""
+        pass
+
+    @abstractmethod
+    async def record_failure(self, event_ids: List[int], error: str) -> None:
+        """Count a failed publish attempt, the events stay pending"""
+        pass
+
+    @abstractmethod
+    async def dead_letter(self, event_ids: List[int], error: str) -> None:
+        """Count the last failed publish attempt and stop claiming the events"""
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit the current transaction, staged events become visible to the relay and the relay lock is released"""
+        pass
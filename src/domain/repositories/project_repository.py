@@ -17,6 +17,11 @@ class IProjectRepository(ABC):
     async def get_project_by_key(self, key: str) -> Optional[Project]:
         pass
 
+    @abstractmethod
+    async def get_projects_by_keys(self, keys: List[str]) -> List[Project]:
+        """Get the projects with any of the keys in a single query"""
+        pass
+
     @abstractmethod
     async def get_all_projects(self) -> List[Project]:
         pass
@@ -8,7 +8,7 @@ from src.domain.entities.auth import RefreshTokenEntity
 class IRefreshTokenRepository(ABC):
     @abstractmethod
     async def create_refresh_token(self, refresh_token: RefreshTokenEntity) -> RefreshTokenEntity:
-        """Create new refresh token"""
+        """Create new refresh token, a token already stored is kept as is"""
         pass
 
     @abstractmethod
@@ -21,6 +21,16 @@ class IRefreshTokenRepository(ABC):
         """Revoke a refresh token"""
         pass
 
+    @abstractmethod
+    async def consume_token(self, token: str) -> Optional[RefreshTokenEntity]:
+        """Revoke a refresh token in one statement if it is still active, returning it as it was"""
+        pass
+
+    @abstractmethod
+    async def rotate_token(self, token: str, new_refresh_token: RefreshTokenEntity) -> None:
+        """Revoke a refresh token and store its replacement in one transaction, even if the token itself is not stored yet"""
+        pass
+
     @abstractmethod
     async def get_by_user_id_and_type(self, user_id: int, token_type: TokenType) -> Optional[RefreshTokenEntity]:
         """Get refresh token by user id and token type"""
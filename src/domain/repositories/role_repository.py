@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 
 from src.domain.entities.permission import Permission
 from src.domain.entities.role import Role, RoleCreate, RoleUpdate
 from src.domain.entities.user_project_role import UserProjectRole
-from src.domain.value_objects.roles import ProjectRole, SystemRole
+from src.domain.value_objects.pagination import CursorPage
+from src.domain.value_objects.roles import ProjectRole, ProjectRoleAssignment, SystemRole
 
 
 class IRoleRepository(ABC):
@@ -12,6 +13,11 @@ class IRoleRepository(ABC):
     async def get_role_by_name(self, name: str) -> Optional[Role]:
         pass
 
+    @abstractmethod
+    async def get_roles_by_names(self, names: List[str]) -> List[Role]:
+        """Get the roles with any of the names in a single query, without their permissions"""
+        pass
+
     @abstractmethod
     async def get_role_permissions(self, role_id: int) -> List[Permission]:
         pass
@@ -79,40 +85,49 @@ class IRoleRepository(ABC):
     @abstractmethod
     async def get_all_roles(
         self,
-        page: int = 1,
-        page_size: int = 10,
+        limit: int = 10,
+        cursor: Optional[str] = None,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         is_active: Optional[bool] = None,
-        is_system_role: Optional[bool] = None
-    ) -> Tuple[List[Role], int]:
-        """Get paginated, filtered and sorted roles"""
+        is_system_role: Optional[bool] = None,
+        include_total: bool = False,
+        offset: int = 0
+    ) -> CursorPage[Role]:
+        """Get the page of filtered and sorted roles after the cursor, the total only if asked for.
+
+        Without a cursor, offset rows are skipped first, for clients still paging by page number.
+        """
         pass
 
     @abstractmethod
     async def get_project_roles_by_project_id(
         self,
         project_id: int,
-        page: int = 1,
-        page_size: int = 10,
+        limit: int = 10,
+        cursor: Optional[str] = None,
         role_name: Optional[str] = None,
-        search: Optional[str] = None
-    ) -> Tuple[List[UserProjectRole], int]:
-        """Get paginated and filtered user role assignments for a project"""
+        search: Optional[str] = None,
+        include_total: bool = False,
+        offset: int = 0
+    ) -> CursorPage[UserProjectRole]:
+        """Get the page of filtered user role assignments for a project after the cursor, or after offset rows"""
         pass
 
     @abstractmethod
     async def get_system_roles(
         self,
-        page: int = 1,
-        page_size: int = 10,
+        limit: int = 10,
+        cursor: Optional[str] = None,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
-        is_active: Optional[bool] = None
-    ) -> Tuple[List[Role], int]:
-        """Get paginated and filtered system roles"""
+        is_active: Optional[bool] = None,
+        include_total: bool = False,
+        offset: int = 0
+    ) -> CursorPage[Role]:
+        """Get the page of filtered system roles after the cursor, or after offset rows, the total only if asked for"""
         pass
 
     @abstractmethod
@@ -160,3 +175,25 @@ class IRoleRepository(ABC):
     ) -> None:
         """Unassign a project role from a user"""
         pass
+
+    @abstractmethod
+    async def bulk_assign_project_roles(
+        self,
+        assignments: List[ProjectRoleAssignment]
+    ) -> Set[ProjectRoleAssignment]:
+        """Insert the assignments that do not exist yet, in one transaction.
+
+        Returns the assignments that were inserted.
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_unassign_project_roles(
+        self,
+        assignments: List[ProjectRoleAssignment]
+    ) -> Set[ProjectRoleAssignment]:
+        """Delete the assignments, in one transaction.
+
+        Returns the assignments that existed and were deleted.
+        """
+        pass
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Set
 
 from src.domain.entities.user import User, UserCreate, UserProfileUpdate, UserUpdate, UserWithPassword
 from src.domain.entities.user_project_role import UserProjectRole
+from src.domain.events.project_events import SyncedJiraUserDTO
+from src.domain.value_objects.jira_sync import JiraUserSyncResult
+from src.domain.value_objects.token import TokenPayload
+from src.domain.value_objects.users import UserSearchResult
 
 
 class IUserRepository(ABC):
@@ -11,6 +15,16 @@ class IUserRepository(ABC):
         """Get user by ID"""
         pass
 
+    @abstractmethod
+    async def get_users_by_ids(self, user_ids: List[int]) -> List[User]:
+        """Get users with their project roles by IDs in a single query"""
+        pass
+
+    @abstractmethod
+    async def get_existing_user_ids(self, user_ids: List[int]) -> Set[int]:
+        """Get which of the IDs belong to a user, without loading the users"""
+        pass
+
     @abstractmethod
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
@@ -26,6 +40,11 @@ class IUserRepository(ABC):
         """Get user by ID with role permissions"""
         pass
 
+    @abstractmethod
+    async def get_token_claims(self, user_id: int) -> Optional[TokenPayload]:
+        """Get the roles and permissions claims of a user in a single query"""
+        pass
+
     @abstractmethod
     async def update_user_by_id(self, user_id: int, user: UserUpdate) -> None:
         """Update user by ID"""
@@ -41,6 +60,29 @@ class IUserRepository(ABC):
         """Create new user"""
         pass
 
+    @abstractmethod
+    async def bulk_sync_jira_users(
+        self,
+        jira_users: List[SyncedJiraUserDTO],
+        project_id: int,
+        role_id: int,
+        match_by_email: bool = True,
+        is_jira_linked: bool = False
+    ) -> JiraUserSyncResult:
+        """Upsert Jira users and give those without a project role the given role, in one transaction"""
+        pass
+
+    @abstractmethod
+    async def bulk_sync_jira_project_users(
+        self,
+        project_users: Dict[int, List[SyncedJiraUserDTO]],
+        role_id: int,
+        match_by_email: bool = True,
+        is_jira_linked: bool = False
+    ) -> Dict[int, JiraUserSyncResult]:
+        """Same as bulk_sync_jira_users for the Jira users of several projects, keyed by project id, in one transaction"""
+        pass
+
     @abstractmethod
     async def get_users_by_project(
         self,
@@ -58,6 +100,20 @@ class IUserRepository(ABC):
         """Get all users in the system with their roles"""
         pass
 
+    @abstractmethod
+    def stream_users(
+        self,
+        search: Optional[str] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[User]:
+        """Stream users with their system role, batch_size rows at a time from a server-side cursor"""
+        pass
+
+    @abstractmethod
+    async def search_users(self, term: str, limit: int = 10) -> List[UserSearchResult]:
+        """Active users whose name or email contains or resembles the term, most similar first"""
+        pass
+
     @abstractmethod
     async def get_user_profile(self, user_id: int) -> User:
         """Get user profile"""
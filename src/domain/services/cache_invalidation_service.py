@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class ICacheInvalidationService(ABC):
+    @abstractmethod
+    async def invalidate(self, key: str) -> None:
+        """Drop a cache key locally and tell every other replica to drop it"""
+        pass
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start listening for invalidations broadcast by other replicas"""
+        pass
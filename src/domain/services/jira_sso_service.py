@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from src.domain.entities.auth import JiraIdentity
 
@@ -16,3 +17,8 @@ class IJiraSSOService(ABC):
     ) -> JiraIdentity:
         """Exchange authorization code for Jira user information"""
         pass
+
+    @abstractmethod
+    async def fetch_user_avatar(self, access_token: str, account_id: str) -> Optional[str]:
+        """Fetch the avatar URL of a Jira user, None if it cannot be fetched"""
+        pass
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class ILocalCache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live entry from the in-process cache"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry in the in-process cache"""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Drop an entry from the in-process cache"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry from the in-process cache"""
+        pass
+
+    @abstractmethod
+    def record_fallback(self, hit: bool) -> None:
+        """Count a lookup against the shared cache tier behind this one"""
+        pass
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any, Awaitable, Callable, Dict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 MessageCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+BatchMessageCallback = Callable[[str, List[Dict[str, Any]]], Awaitable[None]]
 RequestReplyCallback = Callable[[str, Dict[str, Any], Callable[[Dict[str, Any]], Awaitable[None]]], Awaitable[None]]
 
 
@@ -24,22 +25,43 @@ class INATSService(ABC):
         pass
 
     @abstractmethod
-    async def subscribe(self, subject: str, callback: MessageCallback) -> None:
-        """Subscribe to a subject"""
+    async def subscribe(self, subject: str, callback: MessageCallback, queue: Optional[str] = None) -> None:
+        """Subscribe to a subject.
+
+        With a queue group each message goes to one member of the group, otherwise to every subscriber.
+        """
         pass
 
     @abstractmethod
-    async def request(self, subject: str, message: Dict[str, Any], timeout: int = 10) -> Dict[str, Any]:
+    async def request(self, subject: str, message: Dict[str, Any], timeout: float = 10) -> Dict[str, Any]:
         """Send request and wait for response"""
         pass
 
     @abstractmethod
-    async def subscribe_request(self, subject: str, callback: RequestReplyCallback) -> None:
+    async def subscribe_request(self, subject: str, callback: RequestReplyCallback, queue: Optional[str] = None) -> None:
         """Subscribe to a subject for handling request-reply pattern.
 
+        With a queue group each request is answered by one member of the group.
+
         The callback will receive:
         - subject: The subject that received the request
         - data: The parsed request data
         - respond: A function to call with the response data
         """
         pass
+
+    @abstractmethod
+    async def subscribe_batch(
+        self,
+        subject: str,
+        durable: str,
+        callback: BatchMessageCallback,
+        batch_size: int = 100,
+        max_deliver: int = 5
+    ) -> None:
+        """Consume a subject through a durable JetStream pull consumer, a batch at a time.
+
+        Replicas sharing the durable name split the messages between them. A batch is acked once the
+        callback returns and redelivered if it raises, up to max_deliver times per message.
+        """
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from src.domain.constants.auth import TokenType
 from src.domain.entities.auth import CachedToken
@@ -16,6 +16,16 @@ class IRedisService(ABC):
         """Set a value in Redis with an expiry time."""
         pass
 
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values from Redis in one round trip."""
+        pass
+
+    @abstractmethod
+    async def set_many(self, values: Dict[str, Dict[str, Any]], expiry: int):
+        """Set several values with an expiry time in one pipelined round trip."""
+        pass
+
     @abstractmethod
     async def delete(self, key: str):
         """Delete a key from Redis."""
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class IRefreshTokenStore(ABC):
+    """Fast store of which refresh tokens are active, keyed by token hash.
+
+    Validation and rotation go through here, the refresh token repository is the durable log behind it.
+    """
+
+    @abstractmethod
+    async def issue(self, token_hash: str, user_id: int, ttl: int) -> None:
+        """Mark a new refresh token active for ttl seconds"""
+        pass
+
+    @abstractmethod
+    async def rotate(self, token_hash: str, new_token_hash: str, ttl: int) -> Optional[int]:
+        """Atomically revoke an active token and activate its replacement.
+
+        Returns:
+            The owner's user ID, or None when the store does not know the token
+
+        Raises:
+            InvalidTokenError: If the token was already revoked
+        """
+        pass
+
+    @abstractmethod
+    async def get_user_id(self, token_hash: str) -> Optional[int]:
+        """Owner of a known token, active or revoked"""
+        pass
+
+    @abstractmethod
+    async def revoke_user_tokens(self, user_id: int) -> None:
+        """Revoke every active refresh token of a user"""
+        pass
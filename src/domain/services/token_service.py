@@ -18,6 +18,16 @@ class ITokenService(ABC):
         """Refresh access token using refresh token"""
         pass
 
+    @abstractmethod
+    async def get_refresh_token_user_id(self, refresh_token: str) -> Optional[int]:
+        """Owner of a refresh token this service issued, whether or not it is still valid"""
+        pass
+
+    @abstractmethod
+    async def revoke_refresh_tokens(self, user_id: int) -> None:
+        """Revoke every active refresh token of a user"""
+        pass
+
     @abstractmethod
     async def verify_token(self, token: str) -> Optional[User]:
         """Verify token and return user identity"""
@@ -12,5 +12,20 @@ class IUserEventService(ABC):
         event_type: NATSPublishTopic,
         data: Dict[str, Any] = None
     ) -> None:
-        """Publish user event to message broker"""
+        """Publish user event to message broker once the current transaction commits"""
+        pass
+
+    @abstractmethod
+    async def publish_login_event(
+        self,
+        user_id: int,
+        event_type: NATSPublishTopic,
+        data: Dict[str, Any]
+    ) -> None:
+        """Publish an SSO login payload as is, once the current transaction commits"""
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit the queued events together with the rest of the current transaction"""
         pass
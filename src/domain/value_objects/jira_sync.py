@@ -0,0 +1,18 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class JiraUserSyncStage(BaseModel):
+    name: str
+    count: int = 0
+    duration_ms: float = 0.0
+
+
+class JiraUserSyncResult(BaseModel):
+    total_users: int = 0
+    matched_users: int = 0
+    created_users: int = 0
+    skipped_users: int = 0
+    assigned_memberships: int = 0
+    stages: List[JiraUserSyncStage] = []
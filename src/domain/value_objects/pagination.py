@@ -0,0 +1,15 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """One page of a keyset-paginated listing.
+
+    next_cursor is None on the last page. total is only counted when the caller asks for it.
+    """
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
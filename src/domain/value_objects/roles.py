@@ -8,3 +8,10 @@ class ProjectRole(BaseModel):
 
 class SystemRole(BaseModel):
     role_name: str
+
+
+class ProjectRoleAssignment(BaseModel, frozen=True):
+    """One user_project_roles row, by ids"""
+    user_id: int
+    project_id: int
+    role_id: int
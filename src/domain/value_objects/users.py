@@ -0,0 +1,11 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class UserSearchResult(BaseModel):
+    """Just enough of a user for a type-ahead picker"""
+    id: int
+    name: str
+    email: str
+    avatar_url: Optional[str] = None
@@ -1,4 +1,5 @@
 from .base import BaseModel, BaseModelWithTimestamps
+from .outbox_event import OutboxEvent
 from .permission import Permission
 from .project import Project
 from .refresh_token import RefreshToken
@@ -19,3 +20,4 @@ User.model_rebuild()
 UserProjectRole.model_rebuild()
 UserPerformance.model_rebuild()
 RolePermission.model_rebuild()
+OutboxEvent.model_rebuild()
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlmodel import JSON, Field, SQLModel
+
+
+class OutboxEvent(SQLModel, table=True):
+    __tablename__ = "outbox_events"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    subject: str = Field(max_length=255)
+    # Events of one user can be coalesced by the relay
+    user_id: Optional[int] = Field(default=None, index=True)
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_type=JSON)
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(default=None)
+    # Set once the relay gave up on the event, it is kept for inspection but no longer claimed
+    dead_lettered_at: Optional[datetime] = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.now)
@@ -25,19 +25,19 @@ class Project(BaseModelWithTimestamps, table=True):
         back_populates="projects",
         link_model=UserProjectRole,
         sa_relationship_kwargs={
-            "lazy": "selectin",
+            "lazy": "raise",
             "overlaps": "user,project,user_project_roles"
         }
     )
     user_project_roles: List["UserProjectRole"] = Relationship(
         back_populates="project",
         sa_relationship_kwargs={
-            "lazy": "selectin",
+            "lazy": "raise",
             "overlaps": "users,projects"
         }
     )
 
     performance_records: List["UserPerformance"] = Relationship(
         back_populates="project",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 from src.domain.constants.auth import TokenType
@@ -8,6 +9,15 @@ from src.domain.constants.auth import TokenType
 
 class RefreshToken(SQLModel, table=True):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Latest token of a type for a user
+        Index("ix_refresh_tokens_user_id_token_type_created_at", "user_id", "token_type", "created_at"),
+        # Revoking a user's tokens only ever touches the ones not revoked yet
+        Index(
+            "ix_refresh_tokens_active_user_id_token_type", "user_id", "token_type",
+            postgresql_where=text("NOT is_revoked")
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     token: str = Field(index=True, unique=True)
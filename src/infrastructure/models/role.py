@@ -23,24 +23,24 @@ class Role(BaseModelWithTimestamps, table=True):
     # Relationship with users (for system-wide roles)
     users: List["User"] = Relationship(
         back_populates="system_role",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
 
     permissions: List["Permission"] = Relationship(
         back_populates="roles",
         link_model=RolePermission,
-        sa_relationship_kwargs={"lazy": "selectin",
+        sa_relationship_kwargs={"lazy": "raise",
                                 "overlaps": "role,permission"}
     )
 
     role_permissions: List["RolePermission"] = Relationship(
         back_populates="role",
-        sa_relationship_kwargs={"lazy": "selectin",
+        sa_relationship_kwargs={"lazy": "raise",
                                 "overlaps": "permissions"}
     )
 
     # Direct relationship with UserProjectRole entries
     user_project_roles: List["UserProjectRole"] = Relationship(
         back_populates="role",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
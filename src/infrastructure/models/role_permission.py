@@ -25,6 +25,6 @@ class RolePermission(SQLModel, table=True):
     )
 
     role: "Role" = Relationship(
-        back_populates="role_permissions", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="role_permissions", sa_relationship_kwargs={"lazy": "raise"})
     permission: "Permission" = Relationship(
-        back_populates="role_permissions", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="role_permissions", sa_relationship_kwargs={"lazy": "raise"})
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from pydantic import EmailStr
+from sqlalchemy import Index, text
 from sqlmodel import JSON, Field, Relationship, SQLModel
 
 from .base import BaseModelWithTimestamps
@@ -23,6 +24,13 @@ class UserBase(SQLModel):
 
 class User(BaseModelWithTimestamps, table=True):
     __tablename__ = "users"
+    __table_args__ = (
+        # Most users never link Jira, so only linked accounts are indexed
+        Index(
+            "ix_users_jira_account_id", "jira_account_id",
+            postgresql_where=text("jira_account_id IS NOT NULL")
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(unique=True, index=True)
@@ -46,25 +54,25 @@ class User(BaseModelWithTimestamps, table=True):
     # Relationships
     system_role: Optional["Role"] = Relationship(
         back_populates="users",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
     projects: List["Project"] = Relationship(
         back_populates="users",
         link_model=UserProjectRole,
         sa_relationship_kwargs={
-            "lazy": "selectin",
+            "lazy": "raise",
             "overlaps": "project,user,user_project_roles"
         }
     )
     user_project_roles: List["UserProjectRole"] = Relationship(
         back_populates="user",
         sa_relationship_kwargs={
-            "lazy": "selectin",
+            "lazy": "raise",
             "overlaps": "projects,users"
         }
     )
 
     performance_records: List["UserPerformance"] = Relationship(
         back_populates="user",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from sqlalchemy import Index
 from sqlmodel import JSON, Field, Relationship
 
 from .base import BaseModelWithTimestamps
@@ -12,6 +13,9 @@ if TYPE_CHECKING:
 
 class UserPerformance(BaseModelWithTimestamps, table=True):
     __tablename__ = "user_performance"
+    __table_args__ = (
+        Index("ix_user_performance_user_id_year_quarter", "user_id", "year", "quarter"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id")
@@ -25,9 +29,9 @@ class UserPerformance(BaseModelWithTimestamps, table=True):
     # Relationships
     user: Optional["User"] = Relationship(
         back_populates="performance_records",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
     project: Optional["Project"] = Relationship(
         back_populates="performance_records",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
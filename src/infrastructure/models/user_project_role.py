@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, Relationship
 
 from .base import BaseModelWithTimestamps
@@ -10,17 +11,25 @@ if TYPE_CHECKING:
     from .role import Role
     from .user import User
 
+USER_PROJECT_ROLE_UNIQUE_CONSTRAINT = "uq_user_project_roles_user_id_project_id_role_id"
+
 
 class UserProjectRole(BaseModelWithTimestamps, table=True):
     __tablename__ = "user_project_roles"
+    __table_args__ = (
+        # Also serves every lookup by user_id, it leads the constraint's index
+        UniqueConstraint("user_id", "project_id", "role_id", name=USER_PROJECT_ROLE_UNIQUE_CONSTRAINT),
+        Index("ix_user_project_roles_project_id_user_id", "project_id", "user_id"),
+        Index("ix_user_project_roles_role_id", "role_id"),
+    )
 
     user_id: int = Field(foreign_key="users.id")
     project_id: int = Field(foreign_key="projects.id")
     role_id: int = Field(foreign_key="roles.id")
 
     user: "User" = Relationship(
-        back_populates="user_project_roles", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="user_project_roles", sa_relationship_kwargs={"lazy": "raise"})
     project: "Project" = Relationship(
-        back_populates="user_project_roles", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="user_project_roles", sa_relationship_kwargs={"lazy": "raise"})
     role: "Role" = Relationship(
-        back_populates="user_project_roles", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="user_project_roles", sa_relationship_kwargs={"lazy": "raise"})
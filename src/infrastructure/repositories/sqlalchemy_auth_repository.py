@@ -34,7 +34,7 @@ class SQLAlchemyAuthRepository(IAuthRepository):
             if not user:
                 return None
 
-            if not user.password or not BcryptService.verify_password(credentials.password, user.password):
+            if not user.password or not await BcryptService.verify_password_async(credentials.password, user.password):
                 return None
             return user
         except Exception as e:
@@ -58,7 +58,11 @@ class SQLAlchemyAuthRepository(IAuthRepository):
         # Assign default role
         await self.role_repository.assign_system_role_to_user(new_user.id, SystemRoles.USER)
 
-        return self._to_domain(new_user)
+        # Reload through the user repository so the assigned role comes with its declared load graph
+        user = await self.user_repository.get_user_by_id(new_user.id)
+        if not user:
+            raise UserCreationError("Something went wrong")
+        return user
 
     async def update_refresh_token(self, user_id: int, refresh_token: str, token_type: TokenType) -> None:
         user = await self.user_repository.get_user_by_id(user_id)
@@ -75,16 +79,3 @@ class SQLAlchemyAuthRepository(IAuthRepository):
             )
             await self.session.add(new_refresh_token)  # type: ignore
             await self.session.commit()
-
-    def _to_domain(self, user: UserModel) -> UserEntity:
-        return UserEntity(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            system_role=user.system_role,
-            is_active=user.is_active,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            is_system_user=user.is_system_user,
-            avatar_url=user.avatar_url,
-        )
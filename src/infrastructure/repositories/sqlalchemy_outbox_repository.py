@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, func, update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.entities.outbox_event import OutboxEvent as OutboxEventEntity
+from src.domain.repositories.outbox_repository import IOutboxRepository
+from src.infrastructure.models.outbox_event import OutboxEvent as OutboxEventModel
+
+# Key of the advisory lock electing the relay that publishes, one at a time keeps every user's events in order
+OUTBOX_RELAY_LOCK_KEY = 0x6F7574626F78
+
+
+class SQLAlchemyOutboxRepository(IOutboxRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, subject: str, payload: Dict[str, Any], user_id: Optional[int] = None) -> None:
+        self.session.add(OutboxEventModel(subject=subject, payload=payload, user_id=user_id))
+
+    async def try_lock_relay(self) -> bool:
+        return bool(await self.session.scalar(select(func.pg_try_advisory_xact_lock(OUTBOX_RELAY_LOCK_KEY))))
+
+    async def claim_batch(self, limit: int) -> List[OutboxEventEntity]:
+        result = await self.session.exec(
+            select(OutboxEventModel)
+            .where(col(OutboxEventModel.dead_lettered_at).is_(None))
+            .order_by(col(OutboxEventModel.id))
+            .limit(limit)
+        )
+        return [OutboxEventEntity.model_validate(event) for event in result.all()]
+
+    async def delete(self, event_ids: List[int]) -> None:
+        if event_ids:
+            await self.session.exec(  # type: ignore
+                delete(OutboxEventModel).where(col(OutboxEventModel.id).in_(event_ids))
+            )
+
+    async def record_failure(self, event_ids: List[int], error: str) -> None:
+        if event_ids:
+            await self.session.exec(  # type: ignore
+                update(OutboxEventModel)
+                .where(col(OutboxEventModel.id).in_(event_ids))
+                .values(attempts=OutboxEventModel.attempts + 1, last_error=error[:1000])
+            )
+
+    async def dead_letter(self, event_ids: List[int], error: str) -> None:
+        if event_ids:
+            await self.session.exec(  # type: ignore
+                update(OutboxEventModel)
+                .where(col(OutboxEventModel.id).in_(event_ids))
+                .values(
+                    attempts=OutboxEventModel.attempts + 1,
+                    last_error=error[:1000],
+                    dead_lettered_at=datetime.now()
+                )
+            )
+
+    async def commit(self) -> None:
+        await self.session.commit()
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.domain.entities.project import Project as ProjectEntity, ProjectCreate, ProjectUpdate
@@ -37,6 +37,14 @@ class SQLAlchemyProjectRepository(IProjectRepository):
         project = result.first()
         return self._to_domain(project) if project else None
 
+    async def get_projects_by_keys(self, keys: List[str]) -> List[ProjectEntity]:
+        if not keys:
+            return []
+        result = await self.session.exec(
+            select(Project).where(col(Project.key).in_({key.upper() for key in keys}))
+        )
+        return [self._to_domain(p) for p in result.all()]
+
     async def get_all_projects(self) -> List[ProjectEntity]:
         result = await self.session.exec(select(Project))
         projects = result.all()
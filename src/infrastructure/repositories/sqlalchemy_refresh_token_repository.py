@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import and_, col, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -15,23 +16,17 @@ class SQLAlchemyRefreshTokenRepository(IRefreshTokenRepository):
         self.session = session
 
     async def create_refresh_token(self, refresh_token: RefreshTokenEntity) -> RefreshTokenEntity:
-        # Convert to UTC then remove timezone info for database
-        expires_at_utc = refresh_token.expires_at.astimezone(timezone.utc).replace(tzinfo=None)
-        created_at_utc = datetime.now(timezone.utc).replace(tzinfo=None)
-
-        db_token = RefreshTokenModel(
-            token=refresh_token.token,
-            user_id=refresh_token.user_id,
-            expires_at=expires_at_utc,  # Timezone-naive UTC
-            is_revoked=refresh_token.is_revoked,
-            token_type=refresh_token.token_type,
-            created_at=created_at_utc  # Timezone-naive UTC
+        # A rotation written behind before this insert has already logged the token as revoked, keep that row
+        await self.session.execute(
+            pg_insert(RefreshTokenModel)
+            .values(**self._to_values(refresh_token))
+            .on_conflict_do_nothing(index_elements=["token"])
         )
-
-        self.session.add(db_token)
         await self.session.commit()
-        await self.session.refresh(db_token)
-        return self._to_domain(db_token)
+        result = await self.session.exec(
+            select(RefreshTokenModel).where(col(RefreshTokenModel.token) == refresh_token.token)
+        )
+        return self._to_domain(result.one())
 
     async def get_by_token(self, token: str) -> Optional[RefreshTokenEntity]:
         result = await self.session.exec(
@@ -49,6 +44,45 @@ class SQLAlchemyRefreshTokenRepository(IRefreshTokenRepository):
             db_token.is_revoked = True
             await self.session.commit()
 
+    async def consume_token(self, token: str) -> Optional[RefreshTokenEntity]:
+        # A single conditional UPDATE, so two concurrent refreshes cannot both consume the token
+        stmt = (
+            update(RefreshTokenModel)
+            .where(
+                and_(
+                    RefreshTokenModel.token == token,
+                    RefreshTokenModel.is_revoked == False  # noqa: E712
+                )
+            )
+            .values(is_revoked=True)
+            .returning(RefreshTokenModel)
+        )
+        result = await self.session.exec(stmt)  # type: ignore
+        db_token = result.scalars().first()
+        await self.session.commit()
+        if not db_token:
+            return None
+        consumed = self._to_domain(db_token)
+        consumed.is_revoked = False
+        return consumed
+
+    async def rotate_token(self, token: str, new_refresh_token: RefreshTokenEntity) -> None:
+        # Write-behinds are not ordered, the insert of the old token may not have landed yet. Upserting it
+        # as revoked holds in either order; its expiry is unknown here, the replacement's is an upper bound.
+        revoked = {**self._to_values(new_refresh_token), "token": token, "is_revoked": True}
+        await self.session.execute(
+            pg_insert(RefreshTokenModel)
+            .values(**revoked)
+            .on_conflict_do_update(index_elements=["token"], set_={"is_revoked": True})
+        )
+        # The replacement may itself have been rotated already
+        await self.session.execute(
+            pg_insert(RefreshTokenModel)
+            .values(**self._to_values(new_refresh_token))
+            .on_conflict_do_nothing(index_elements=["token"])
+        )
+        await self.session.commit()
+
     async def get_by_user_id_and_type(self, user_id: int, token_type: TokenType) -> Optional[RefreshTokenEntity]:
         """Get refresh token by user id and token type by last created"""
         result = await self.session.exec(
@@ -94,6 +128,20 @@ class SQLAlchemyRefreshTokenRepository(IRefreshTokenRepository):
         await self.session.exec(stmt)  # type: ignore
         await self.session.commit()
 
+    def _to_values(self, refresh_token: RefreshTokenEntity) -> Dict[str, Any]:
+        # Convert to UTC then remove timezone info for database
+        expires_at_utc = refresh_token.expires_at.astimezone(timezone.utc).replace(tzinfo=None)
+        created_at_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        return {
+            "token": refresh_token.token,
+            "user_id": refresh_token.user_id,
+            "expires_at": expires_at_utc,  # Timezone-naive UTC
+            "is_revoked": refresh_token.is_revoked,
+            "token_type": refresh_token.token_type,
+            "created_at": created_at_utc  # Timezone-naive UTC
+        }
+
     def _to_domain(self, db_token: RefreshTokenModel) -> RefreshTokenEntity:
         # Add UTC timezone info when converting back to domain entity
         return RefreshTokenEntity(
@@ -1,5 +1,8 @@
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import selectinload
 from sqlmodel import and_, asc, col, delete, desc, distinct, func, or_, select
@@ -22,13 +25,30 @@ from src.domain.exceptions.role_exceptions import (
 )
 from src.domain.exceptions.user_exceptions import UserNotFoundError
 from src.domain.repositories.role_repository import IRoleRepository
-from src.domain.value_objects.roles import ProjectRole, SystemRole
+from src.domain.value_objects.pagination import CursorPage
+from src.domain.value_objects.roles import ProjectRole, ProjectRoleAssignment, SystemRole
 from src.infrastructure.models.permission import Permission
 from src.infrastructure.models.project import Project
 from src.infrastructure.models.role import Role
 from src.infrastructure.models.role_permission import RolePermission
 from src.infrastructure.models.user import User
-from src.infrastructure.models.user_project_role import UserProjectRole
+from src.infrastructure.models.user_project_role import USER_PROJECT_ROLE_UNIQUE_CONSTRAINT, UserProjectRole
+from src.utils.cursor import decode_cursor, encode_cursor
+from src.utils.sql import keyset_after, matches_search
+
+# Sortable role fields: the SQL sort expression and how to read it off a loaded row.
+# Nullable columns are coalesced, a NULL sort key cannot be compared against a cursor.
+ROLE_SORT_KEYS: Dict[str, Tuple[Any, Callable[[Role], Any]]] = {
+    "name": (col(Role.name), lambda role: role.name),
+    "description": (func.coalesce(col(Role.description), ""), lambda role: role.description or ""),
+    "created_at": (col(Role.created_at), lambda role: role.created_at),
+    "updated_at": (
+        func.coalesce(col(Role.updated_at), col(Role.created_at)),
+        lambda role: role.updated_at or role.created_at
+    ),
+    "is_active": (col(Role.is_active), lambda role: role.is_active),
+    "is_system_role": (col(Role.is_system_role), lambda role: role.is_system_role),
+}
 
 
 class SQLAlchemyRoleRepository(IRoleRepository):
@@ -110,11 +130,19 @@ class SQLAlchemyRoleRepository(IRoleRepository):
 
     async def get_role_by_name(self, name: str) -> Optional[RoleEntity]:
         result = await self.session.exec(
-            select(Role).where(Role.name == name)
+            select(Role).options(selectinload(Role.permissions)).where(Role.name == name)  # type: ignore
         )
         role = result.first()
         return self._to_domain(role) if role else None
 
+    async def get_roles_by_names(self, names: List[str]) -> List[RoleEntity]:
+        if not names:
+            return []
+        result = await self.session.exec(
+            select(Role).where(col(Role.name).in_(set(names)))
+        )
+        return [self._to_domain_role(role) for role in result.all()]
+
     async def get_role_permissions(self, role_id: int) -> List[PermissionEntity]:
         result = await self.session.exec(
             select(Permission)
@@ -168,29 +196,20 @@ class SQLAlchemyRoleRepository(IRoleRepository):
         if role.is_system_role:
             raise RoleIsSystemRoleError(role_name=role_name)
 
-        # Check if this specific role assignment already exists
-        existing_assignment = await self.session.exec(
-            select(UserProjectRole)
-            .where(
-                col(UserProjectRole.user_id) == user_id,
-                col(UserProjectRole.project_id) == project_id,
-                col(UserProjectRole.role_id) == role.id
-            )
+        # Add the assignment without removing existing roles, the unique constraint skips it if it already exists
+        result = await self.session.exec(
+            self._insert_assignments([{
+                "user_id": user_id,
+                "project_id": project_id,
+                "role_id": role.id,
+                "created_at": datetime.now()
+            }]).returning(col(UserProjectRole.id))
         )
+        assigned = result.first() is not None
+        await self.session.commit()
 
-        assignment = existing_assignment.first()
-
-        # Only create a new assignment if this specific role doesn't exist for the user in this project
-        if not assignment:
-            log.info(f"Adding new role {role_name} to user {user_id} in project {project_id}")
-            # Create new assignment without removing existing roles
-            new_assignment = UserProjectRole(
-                user_id=user_id,
-                project_id=project_id,
-                role_id=role.id
-            )
-            self.session.add(new_assignment)
-            await self.session.commit()
+        if assigned:
+            log.info(f"Added role {role_name} to user {user_id} in project {project_id}")
         else:
             log.info(f"User {user_id} already has role {role_name} in project {project_id}")
 
@@ -226,15 +245,17 @@ class SQLAlchemyRoleRepository(IRoleRepository):
 
     async def get_all_roles(
         self,
-        page: int = 1,
-        page_size: int = 10,
+        limit: int = 10,
+        cursor: Optional[str] = None,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         is_active: Optional[bool] = None,
-        is_system_role: Optional[bool] = None
-    ) -> Tuple[List[RoleEntity], int]:
-        """Get paginated, filtered and sorted roles"""
+        is_system_role: Optional[bool] = None,
+        include_total: bool = False,
+        offset: int = 0
+    ) -> CursorPage[RoleEntity]:
+        """Get a keyset-paginated, filtered and sorted page of roles"""
         try:
             # Base query with permissions loaded
             base_query = select(Role).options(selectinload(Role.permissions))  # type: ignore
@@ -248,41 +269,16 @@ class SQLAlchemyRoleRepository(IRoleRepository):
 
             # Apply search
             if search:
-                search_term = f"%{search}%"
-                base_query = base_query.where(
-                    or_(
-                        col(Role.name).ilike(search_term),
-                        col(Role.description).ilike(search_term)
-                    )
-                )
-
-            # Get total count before pagination and sorting
-            count_query = select(func.count()).select_from(base_query.subquery())
-            total = await self.session.scalar(count_query) or 0
-
-            # Apply sorting
-            valid_sort_fields = {"name", "created_at", "updated_at", "is_active", "is_system_role"}
-            if sort_by and sort_by in valid_sort_fields:
-                sort_column = getattr(Role, sort_by)
-                if sort_order and sort_order.lower() == "desc":
-                    base_query = base_query.order_by(desc(sort_column))
-                else:
-                    base_query = base_query.order_by(asc(sort_column))
-            else:
-                # Default sorting by name
-                base_query = base_query.order_by(asc(Role.name))
-
-            # Apply pagination
-            base_query = base_query.offset((page - 1) * page_size).limit(page_size)
-
-            # Execute query
-            result = await self.session.exec(base_query)
-            roles = result.all()
-
-            # Convert to domain entities
-            domain_roles = [self._to_domain(role) for role in roles]
+                base_query = base_query.where(matches_search(search, col(Role.name), col(Role.description)))
 
-            return domain_roles, total
+            roles, next_cursor, total = await self._role_page(
+                base_query, sort_by, sort_order, cursor, limit, include_total, offset
+            )
+            return CursorPage(
+                items=[self._to_domain(role) for role in roles],
+                next_cursor=next_cursor,
+                total=total
+            )
 
         except SQLAlchemyError as e:
             raise RoleError(f"Failed to fetch roles: {str(e)}") from e
@@ -436,22 +432,26 @@ class SQLAlchemyRoleRepository(IRoleRepository):
         role.is_active = False
         await self.session.commit()
         await self.session.refresh(role)
+        await self.session.refresh(role, ["permissions"])
         return self._to_domain(role)
 
     async def get_project_roles_by_project_id(
         self,
         project_id: int,
-        page: int = 1,
-        page_size: int = 10,
+        limit: int = 10,
+        cursor: Optional[str] = None,
         role_name: Optional[str] = None,
-        search: Optional[str] = None
-    ) -> Tuple[List[UserProjectRoleEntity], int]:
+        search: Optional[str] = None,
+        include_total: bool = False,
+        offset: int = 0
+    ) -> CursorPage[UserProjectRoleEntity]:
         try:
             # Base query
             base_query = select(UserProjectRole)\
                 .options(
                     selectinload(UserProjectRole.user),  # type: ignore
-                    selectinload(UserProjectRole.role)  # type: ignore
+                    selectinload(UserProjectRole.role),  # type: ignore
+                    selectinload(UserProjectRole.project)  # type: ignore
             )\
                 .where(col(UserProjectRole.project_id) == project_id)
 
@@ -462,33 +462,21 @@ class SQLAlchemyRoleRepository(IRoleRepository):
 
             # Apply search filter
             if search:
-                search_term = f"%{search}%"
                 base_query = base_query.join(User).where(
-                    or_(
-                        col(User.name).ilike(search_term),
-                        col(User.email).ilike(search_term)
-                    )
+                    matches_search(search, col(User.name), col(User.email))
                 )
 
-            # Get total count before pagination
-            count_query = select(func.count()).select_from(
-                base_query.subquery())
-            total = await self.session.scalar(count_query)
-
-            # Apply pagination
-            base_query = base_query.offset(
-                (page - 1) * page_size).limit(page_size)
-
-            # Execute query
-            result = await self.session.exec(base_query)
-            assignments = result.all()
-
-            # Convert to domain entities
-            domain_assignments = [
-                self._to_domain_user_project_role(a) for a in assignments
-            ]
-
-            return domain_assignments, total or 0
+            # Assignments are listed in the order they were made
+            assignment_id = col(UserProjectRole.id)
+            assignments, next_cursor, total = await self._keyset_page(
+                base_query, "id:asc", assignment_id, lambda a: a.id, assignment_id,
+                False, cursor, limit, include_total, offset
+            )
+            return CursorPage(
+                items=[self._to_domain_user_project_role(a) for a in assignments],
+                next_cursor=next_cursor,
+                total=total
+            )
 
         except SQLAlchemyError as e:
             raise RoleError(
@@ -496,54 +484,99 @@ class SQLAlchemyRoleRepository(IRoleRepository):
 
     async def get_system_roles(
         self,
-        page: int = 1,
-        page_size: int = 10,
+        limit: int = 10,
+        cursor: Optional[str] = None,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
-        is_active: Optional[bool] = None
-    ) -> Tuple[List[RoleEntity], int]:
+        is_active: Optional[bool] = None,
+        include_total: bool = False,
+        offset: int = 0
+    ) -> CursorPage[RoleEntity]:
         try:
-            # Base query
-            base_query = select(Role).where(Role.is_system_role)
+            # Base query with permissions loaded
+            base_query = select(Role).options(selectinload(Role.permissions)).where(Role.is_system_role)  # type: ignore
 
             # Apply filters
             if search:
-                base_query = base_query.where(
-                    or_(
-                        col(Role.name).ilike(f"%{search}%"),
-                        col(Role.description).ilike(f"%{search}%")
-                    )
-                )
+                base_query = base_query.where(matches_search(search, col(Role.name), col(Role.description)))
 
             if is_active is not None:
                 base_query = base_query.where(col(Role.is_active) == is_active)
 
-            # Get total count before pagination
-            count_query = select(func.count()).select_from(
-                base_query.subquery())
-            total = await self.session.scalar(count_query)
-
-            # Apply sorting
-            if sort_by:
-                direction = desc if sort_order == "desc" else asc
-                base_query = base_query.order_by(
-                    direction(getattr(Role, sort_by)))
-            else:
-                base_query = base_query.order_by(col(Role.name))
+            roles, next_cursor, total = await self._role_page(
+                base_query, sort_by, sort_order, cursor, limit, include_total, offset
+            )
+            return CursorPage(
+                items=[self._to_domain(role) for role in roles],
+                next_cursor=next_cursor,
+                total=total
+            )
 
-            # Apply pagination
-            base_query = base_query.offset(
-                (page - 1) * page_size).limit(page_size)
+        except SQLAlchemyError as e:
+            raise RoleError(f"Failed to fetch system roles: {str(e)}") from e
 
-            # Execute query
-            result = await self.session.exec(base_query)
-            roles = result.all()
+    async def _role_page(
+        self,
+        query: Any,
+        sort_by: Optional[str],
+        sort_order: Optional[str],
+        cursor: Optional[str],
+        limit: int,
+        include_total: bool,
+        offset: int = 0
+    ) -> Tuple[List[Role], Optional[str], Optional[int]]:
+        """Page through roles sorted by one of ROLE_SORT_KEYS, name by default"""
+        sort_by = sort_by if sort_by in ROLE_SORT_KEYS else "name"
+        descending = bool(sort_order and sort_order.lower() == "desc")
+        sort_expression, sort_value = ROLE_SORT_KEYS[sort_by]
+        return await self._keyset_page(
+            query, f"{sort_by}:{'desc' if descending else 'asc'}", sort_expression, sort_value, col(Role.id),
+            descending, cursor, limit, include_total, offset
+        )
 
-            return [self._to_domain(role) for role in roles], total or 0
+    async def _keyset_page(
+        self,
+        query: Any,
+        sort: str,
+        sort_expression: Any,
+        sort_value: Callable[[Any], Any],
+        id_column: Any,
+        descending: bool,
+        cursor: Optional[str],
+        limit: int,
+        include_total: bool,
+        offset: int = 0
+    ) -> Tuple[List[Any], Optional[str], Optional[int]]:
+        """Fetch the page after the cursor in ORDER BY sort_expression, id.
+
+        The id tie-breaker keeps the order total, so rows inserted while a client pages
+        through never shift what the next cursor points at. Returns the rows, the cursor
+        of the next page and the total count, which is only counted on request. Without a
+        cursor, offset rows are skipped, which only the deprecated page parameter asks for.
+        """
+        total: Optional[int] = None
+        if include_total:
+            total = await self.session.scalar(select(func.count()).select_from(query.subquery())) or 0
+
+        if cursor:
+            key, row_id = decode_cursor(cursor, sort)
+            query = query.where(keyset_after(sort_expression, id_column, key, row_id, descending))
+        elif offset:
+            query = query.offset(offset)
+
+        direction = desc if descending else asc
+        # One extra row tells whether there is a next page
+        query = query.order_by(direction(sort_expression), direction(id_column)).limit(limit + 1)
+        result = await self.session.exec(query)
+        rows = list(result.all())
 
-        except SQLAlchemyError as e:
-            raise RoleError(f"Failed to fetch system roles: {str(e)}") from e
+        next_cursor: Optional[str] = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(sort, sort_value(last), last.id)
+        return rows, next_cursor, total
 
     async def check_user_has_any_project_role(
         self,
@@ -582,21 +615,14 @@ class SQLAlchemyRoleRepository(IRoleRepository):
             select(UserProjectRole, User, Role)
             .join(User, col(User.id) == col(UserProjectRole.user_id))
             .join(Role, col(Role.id) == col(UserProjectRole.role_id))
-            .options(
-                selectinload(UserProjectRole.user),  # type: ignore
-                selectinload(UserProjectRole.role).selectinload(Role.permissions)  # type: ignore
-            )
+            .options(selectinload(Role.permissions))  # type: ignore
             .where(col(UserProjectRole.project_id) == project_id)
         )
 
         # Add search filter if provided
         if search:
-            search_term = f"%{search}%"
             query = query.where(
-                or_(
-                    col(User.name).ilike(search_term),
-                    col(User.email).ilike(search_term)
-                )
+                matches_search(search, col(User.name), col(User.email))
             )
 
         result = await self.session.exec(query)
@@ -658,7 +684,7 @@ class SQLAlchemyRoleRepository(IRoleRepository):
     ) -> Tuple[List[UserProjectRoleEntity], int]:
         """Get users in a project with their roles with pagination, filtering, searching, and sorting"""
         async with self.session as session:
-            # Build the base query
+            # Build the filtered membership query
             query = (
                 select(
                     UserProjectRole,
@@ -678,12 +704,8 @@ class SQLAlchemyRoleRepository(IRoleRepository):
 
             # Apply search filter if provided
             if search:
-                search_term = f"%{search}%"
                 query = query.where(
-                    or_(
-                        col(User.name).ilike(search_term),
-                        col(User.email).ilike(search_term)
-                    )
+                    matches_search(search, col(User.name), col(User.email))
                 )
 
             # Apply role ID filter if provided
@@ -697,37 +719,46 @@ class SQLAlchemyRoleRepository(IRoleRepository):
             if total is None or total == 0:
                 return [], 0
 
-            # Apply sorting if provided
-            if sort_by and sort_order:
-                sort_order = sort_order.lower()
-                if sort_order not in ["asc", "desc"]:
-                    sort_order = "asc"
-
-                if sort_by == "name":
-                    order_column = User.name
-                elif sort_by == "email":
-                    order_column = User.email
-                elif sort_by == "role_id":
-                    order_column = Role.id  # type: ignore
-                else:
-                    # Default sort by user name
-                    order_column = User.name
-
-                if sort_order == "desc":
-                    query = query.order_by(desc(order_column))
-                else:
-                    query = query.order_by(asc(order_column))
-            else:
+            # Resolve the sort key; a user is ordered by their first row under that sort
+            if not (sort_by and sort_order):
                 # Default sort by user name ascending
-                query = query.order_by(col(User.name).asc())
+                sort_by, sort_order = "name", "asc"
+            sort_order = sort_order.lower()
+            if sort_order not in ["asc", "desc"]:
+                sort_order = "asc"
+
+            if sort_by == "email":
+                sort_key: Any = col(User.email)
+            elif sort_by == "role_id":
+                sort_key = func.min(Role.id) if sort_order == "asc" else func.max(Role.id)
+            else:
+                # Default sort by user name
+                sort_key = col(User.name)
+
+            # Select only the page of distinct user IDs in the database
+            page_query = (
+                query.with_only_columns(col(User.id))
+                .group_by(col(User.id), col(User.name), col(User.email))
+                .order_by(
+                    desc(sort_key) if sort_order == "desc" else asc(sort_key),
+                    col(User.id).asc()
+                )
+                .offset((page - 1) * page_size)
+                .limit(page_size)
+            )
+            page_user_ids = list((await session.execute(page_query)).scalars().all())
+            if not page_user_ids:
+                return [], total
 
-            # Execute the query without pagination first to get all roles
-            result = await session.exec(query)
-            all_rows = result.all()
+            # Fetch the roles of the users on this page only
+            roles_query = query.where(col(User.id).in_(page_user_ids)).order_by(
+                desc(col(Role.id)) if sort_by == "role_id" and sort_order == "desc" else asc(col(Role.id))
+            )
+            result = await session.exec(roles_query)
 
             # Group by user_id to collect all roles for each user
             user_roles_map: Dict[int, Dict[str, Any]] = {}
-            for upr, user, role in all_rows:
+            for upr, user, role in result.all():
                 if not user or not user.id:
                     continue
 
@@ -747,7 +778,7 @@ class SQLAlchemyRoleRepository(IRoleRepository):
                     # Create a new entry in the map
                     user_roles_map[user.id] = {
                         'user': domain_user,
-                        'roles': [],  # Lưu trữ toàn bộ role objects thay vì chỉ role_ids
+                        'roles': [],
                         'project_id': upr.project_id,
                         'created_at': upr.created_at,
                         'updated_at': upr.updated_at
@@ -765,9 +796,12 @@ class SQLAlchemyRoleRepository(IRoleRepository):
                 )
                 user_roles_map[user.id]['roles'].append(domain_role)
 
-            # Convert the map to a list of UserProjectRoleEntity objects
+            # Convert the map to UserProjectRoleEntity objects in page order
             user_project_roles = []
-            for user_id, data in user_roles_map.items():
+            for user_id in page_user_ids:
+                data = user_roles_map.get(user_id)
+                if not data:
+                    continue
                 domain_upr = UserProjectRoleEntity(
                     id=0,  # This is a synthetic ID since we're grouping
                     user_id=user_id,
@@ -781,10 +815,7 @@ class SQLAlchemyRoleRepository(IRoleRepository):
                 )
                 user_project_roles.append(domain_upr)
 
-            # Apply pagination to the grouped results
-            paginated_user_project_roles = user_project_roles[(page-1)*page_size:page*page_size]
-
-            return paginated_user_project_roles, total
+            return user_project_roles, total
 
     async def remove_user_project_roles(
         self,
@@ -819,12 +850,14 @@ class SQLAlchemyRoleRepository(IRoleRepository):
             role_id: ID of the role
         """
         async with self.session as session:
-            user_project_role = UserProjectRole(
-                user_id=user_id,
-                project_id=project_id,
-                role_id=role_id
+            await session.exec(
+                self._insert_assignments([{
+                    "user_id": user_id,
+                    "project_id": project_id,
+                    "role_id": role_id,
+                    "created_at": datetime.now()
+                }])
             )
-            session.add(user_project_role)
             await session.commit()
 
     async def get_role_by_id(self, role_id: int) -> Optional[RoleEntity]:
@@ -892,3 +925,96 @@ class SQLAlchemyRoleRepository(IRoleRepository):
         else:
             log.info(f"User {user_id} does not have role {role_name} in project {project_id}")
             # Don't raise an exception, just log it
+
+    async def bulk_assign_project_roles(
+        self,
+        assignments: List[ProjectRoleAssignment]
+    ) -> Set[ProjectRoleAssignment]:
+        wanted = list(set(assignments))
+        if not wanted:
+            return set()
+
+        added: Set[ProjectRoleAssignment] = set()
+        try:
+            now = datetime.now()
+            for chunk in self._chunks(wanted):
+                # Existing assignments are skipped by the unique constraint, RETURNING lists only the new ones
+                result = await self.session.exec(
+                    self._insert_assignments([
+                        {
+                            "user_id": assignment.user_id,
+                            "project_id": assignment.project_id,
+                            "role_id": assignment.role_id,
+                            "created_at": now
+                        }
+                        for assignment in chunk
+                    ]).returning(
+                        col(UserProjectRole.user_id),
+                        col(UserProjectRole.project_id),
+                        col(UserProjectRole.role_id)
+                    )
+                )
+                added.update(
+                    ProjectRoleAssignment(user_id=user_id, project_id=project_id, role_id=role_id)
+                    for user_id, project_id, role_id in result.all()
+                )
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise RoleError(f"Failed to assign project roles: {str(e)}") from e
+
+        log.info(f"Assigned {len(added)} project roles, {len(wanted) - len(added)} already existed")
+        return added
+
+    async def bulk_unassign_project_roles(
+        self,
+        assignments: List[ProjectRoleAssignment]
+    ) -> Set[ProjectRoleAssignment]:
+        wanted = list(set(assignments))
+        if not wanted:
+            return set()
+
+        removed: Set[ProjectRoleAssignment] = set()
+        try:
+            for chunk in self._chunks(wanted):
+                result = await self.session.exec(  # type: ignore
+                    delete(UserProjectRole)
+                    .where(self._assignment_key().in_(self._assignment_values(chunk)))
+                    .returning(
+                        col(UserProjectRole.user_id),
+                        col(UserProjectRole.project_id),
+                        col(UserProjectRole.role_id)
+                    )
+                )
+                removed.update(
+                    ProjectRoleAssignment(user_id=user_id, project_id=project_id, role_id=role_id)
+                    for user_id, project_id, role_id in result.all()
+                )
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise RoleError(f"Failed to unassign project roles: {str(e)}") from e
+
+        log.info(f"Unassigned {len(removed)} project roles, {len(wanted) - len(removed)} did not exist")
+        return removed
+
+    @staticmethod
+    def _insert_assignments(values: List[Dict[str, Any]]) -> Any:
+        """Multi-row INSERT of assignments, skipping the ones the (user, project, role) constraint says exist"""
+        return pg_insert(UserProjectRole).values(values).on_conflict_do_nothing(
+            constraint=USER_PROJECT_ROLE_UNIQUE_CONSTRAINT
+        )
+
+    @staticmethod
+    def _assignment_key() -> Any:
+        return tuple_(col(UserProjectRole.user_id), col(UserProjectRole.project_id), col(UserProjectRole.role_id))
+
+    @staticmethod
+    def _assignment_values(assignments: List[ProjectRoleAssignment]) -> List[Tuple[int, int, int]]:
+        return [(a.user_id, a.project_id, a.role_id) for a in assignments]
+
+    @staticmethod
+    def _chunks(items: List[Any], size: int = 1000) -> Iterator[List[Any]]:
+        """Split bulk statements to stay under the bind parameter limit"""
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
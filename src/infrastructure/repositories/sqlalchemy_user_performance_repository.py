@@ -47,6 +47,7 @@ class SQLAlchemyUserPerformanceRepository(IUserPerformanceRepository):
         self.session.add(db_performance)
         await self.session.commit()
         await self.session.refresh(db_performance)
+        await self.session.refresh(db_performance, ["project"])
 
         return await self._to_domain(db_performance)
 
@@ -163,6 +164,7 @@ class SQLAlchemyUserPerformanceRepository(IUserPerformanceRepository):
 
         await self.session.commit()
         await self.session.refresh(db_performance)
+        await self.session.refresh(db_performance, ["project"])
 
         return await self._to_domain(db_performance)
 
@@ -1,22 +1,32 @@
-from typing import List, Optional
-
-from sqlalchemy.orm import selectinload
-from sqlmodel import col, or_, select, update
+from datetime import datetime
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import noload, selectinload
+from sqlmodel import JSON, col, func, or_, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.configs.logger import log
 from src.domain.constants.nats_events import NATSPublishTopic
 from src.domain.entities.user import User as UserEntity, UserCreate, UserProfileUpdate, UserUpdate, UserWithPassword
 from src.domain.entities.user_project_role import UserProjectRole as UserProjectRoleEntity
+from src.domain.events.project_events import SyncedJiraUserDTO
 from src.domain.exceptions.auth_exceptions import UserNotFoundError
 from src.domain.repositories.user_repository import IUserRepository
 from src.domain.services.redis_service import IRedisService
 from src.domain.services.user_event_service import IUserEventService
+from src.domain.value_objects.jira_sync import JiraUserSyncResult, JiraUserSyncStage
+from src.domain.value_objects.token import TokenPayload
+from src.domain.value_objects.users import UserSearchResult
 from src.infrastructure.models.permission import Permission as PermissionModel
 from src.infrastructure.models.role import Role as RoleModel
 from src.infrastructure.models.role_permission import RolePermission as RolePermissionModel
 from src.infrastructure.models.user import User as UserModel
 from src.infrastructure.models.user_project_role import UserProjectRole as UserProjectRoleModel
+from src.infrastructure.repositories.sqlalchemy_role_repository import SQLAlchemyRoleRepository
+from src.utils.sql import matches_search
 
 
 class SQLAlchemyUserRepository(IUserRepository):
@@ -34,13 +44,7 @@ class SQLAlchemyUserRepository(IUserRepository):
         # Load user with system role and permissions
         stmt = (
             select(UserModel)
-            .options(
-                selectinload(UserModel.system_role).selectinload(  # type: ignore
-                    RoleModel.permissions),  # type: ignore
-                selectinload(UserModel.user_project_roles).selectinload(UserProjectRoleModel.role).selectinload(  # type: ignore
-                    RoleModel.permissions),  # type: ignore
-                selectinload(UserModel.user_project_roles).selectinload(UserProjectRoleModel.project)  # type: ignore
-            )
+            .options(*self._project_roles_load_options())
             .where(UserModel.id == int(user_id))
         )
         result = await self.session.exec(stmt)
@@ -49,6 +53,47 @@ class SQLAlchemyUserRepository(IUserRepository):
         if not user:
             return None
 
+        return self._to_domain_with_project_roles(user)
+
+    async def get_users_by_ids(self, user_ids: List[int]) -> List[UserEntity]:
+        if not user_ids:
+            return []
+
+        stmt = (
+            select(UserModel)
+            .options(*self._project_roles_load_options())
+            .where(col(UserModel.id).in_(user_ids))
+        )
+        result = await self.session.exec(stmt)
+        return [self._to_domain_with_project_roles(user) for user in result.all()]
+
+    async def get_existing_user_ids(self, user_ids: List[int]) -> Set[int]:
+        if not user_ids:
+            return set()
+
+        result = await self.session.exec(
+            select(UserModel.id).where(col(UserModel.id).in_(set(user_ids)))
+        )
+        return {user_id for user_id in result.all() if user_id is not None}
+
+    def _user_load_options(self) -> List[Any]:
+        """Eager loads read by _to_domain: the system role and the bare project role rows"""
+        return [
+            selectinload(UserModel.system_role),  # type: ignore
+            selectinload(UserModel.user_project_roles)  # type: ignore
+        ]
+
+    def _project_roles_load_options(self) -> List[Any]:
+        """Eager loads for the system role and project roles with their permissions"""
+        return [
+            selectinload(UserModel.system_role).selectinload(  # type: ignore
+                RoleModel.permissions),  # type: ignore
+            selectinload(UserModel.user_project_roles).selectinload(UserProjectRoleModel.role).selectinload(  # type: ignore
+                RoleModel.permissions),  # type: ignore
+            selectinload(UserModel.user_project_roles).selectinload(UserProjectRoleModel.project)  # type: ignore
+        ]
+
+    def _to_domain_with_project_roles(self, user: UserModel) -> UserEntity:
         # Create a simplified system_role without nested relationships
         system_role = None
         if user.system_role:
@@ -126,7 +171,7 @@ class SQLAlchemyUserRepository(IUserRepository):
     async def get_user_by_id_with_role_permissions(self, user_id: int) -> Optional[UserEntity]:
         stmt = (
             select(UserModel)
-            .options(selectinload(UserModel.system_role))  # type: ignore
+            .options(*self._user_load_options())
             .where(UserModel.id == int(user_id))
         )
         result = await self.session.exec(stmt)
@@ -186,10 +231,82 @@ class SQLAlchemyUserRepository(IUserRepository):
             avatar_url=user.avatar_url,
         )
 
+    async def get_token_claims(self, user_id: int) -> Optional[TokenPayload]:
+        """Project everything a token needs in one round trip.
+
+        Project roles and permissions are aggregated per project with CTEs and
+        folded into JSON objects keyed by project id, so issuing a token costs a
+        single statement instead of one query per claim.
+        """
+        project_roles = (
+            select(
+                col(UserProjectRoleModel.project_id).label("project_id"),
+                func.json_agg(col(RoleModel.name)).label("roles")
+            )
+            .join(RoleModel, col(RoleModel.id) == col(UserProjectRoleModel.role_id))
+            .where(col(UserProjectRoleModel.user_id) == user_id)
+            .group_by(col(UserProjectRoleModel.project_id))
+            .cte("project_roles")
+        )
+        project_permissions = (
+            select(
+                col(UserProjectRoleModel.project_id).label("project_id"),
+                func.json_agg(col(PermissionModel.name).distinct()).label("permissions")
+            )
+            .join(RolePermissionModel, col(RolePermissionModel.role_id) == col(UserProjectRoleModel.role_id))
+            .join(PermissionModel, col(PermissionModel.id) == col(RolePermissionModel.permission_id))
+            .where(col(UserProjectRoleModel.user_id) == user_id)
+            .group_by(col(UserProjectRoleModel.project_id))
+            .cte("project_permissions")
+        )
+        system_permissions = (
+            select(func.json_agg(col(PermissionModel.name)))
+            .join(RolePermissionModel, col(RolePermissionModel.permission_id) == col(PermissionModel.id))
+            .join(RoleModel, col(RoleModel.id) == col(RolePermissionModel.role_id))
+            .where(col(RoleModel.id) == col(UserModel.role_id), col(RoleModel.is_system_role))
+            .correlate(UserModel)
+            .scalar_subquery()
+        )
+
+        # Eight columns is past the typed overloads of sqlmodel's select, SQLAlchemy's goes up to ten
+        stmt = (
+            sa_select(
+                col(UserModel.id),
+                col(UserModel.email),
+                col(UserModel.name),
+                col(UserModel.is_jira_linked),
+                col(RoleModel.name).label("system_role"),
+                func.coalesce(system_permissions, func.json_build_array(), type_=JSON).label("system_permissions"),
+                select(
+                    func.json_object_agg(project_roles.c.project_id, project_roles.c.roles, type_=JSON)
+                ).scalar_subquery().label("project_roles"),
+                select(
+                    func.json_object_agg(project_permissions.c.project_id, project_permissions.c.permissions, type_=JSON)
+                ).scalar_subquery().label("project_permissions")
+            )
+            .outerjoin(RoleModel, col(RoleModel.id) == col(UserModel.role_id))
+            .where(col(UserModel.id) == user_id)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if not row:
+            return None
+
+        return TokenPayload(
+            sub=str(row.id),
+            email=row.email,
+            name=row.name,
+            system_role=row.system_role or "",
+            system_permissions=row.system_permissions or [],
+            project_roles=row.project_roles or {},
+            project_permissions=row.project_permissions or {},
+            is_jira_linked=row.is_jira_linked
+        )
+
     async def get_user_by_email(self, email: str) -> Optional[UserEntity]:
         try:
             result = await self.session.exec(
-                select(UserModel).where(col(UserModel.email) == email)
+                select(UserModel).options(*self._user_load_options()).where(col(UserModel.email) == email)
             )
             user = result.first()
             return self._to_domain(user) if user else None
@@ -200,7 +317,7 @@ class SQLAlchemyUserRepository(IUserRepository):
     async def get_user_with_password_by_email(self, email: str) -> Optional[UserWithPassword]:
         try:
             result = await self.session.exec(
-                select(UserModel).where(UserModel.email == email)
+                select(UserModel).options(*self._user_load_options()).where(UserModel.email == email)
             )
             user = result.first()
             return self._to_domain_with_password(user) if user else None
@@ -223,17 +340,20 @@ class SQLAlchemyUserRepository(IUserRepository):
             )
 
             self.session.add(db_user)
-            await self.session.commit()
-            await self.session.refresh(db_user)
+            await self.session.flush()
 
-            # Publish user created event
-            if db_user and db_user.id is not None:
+            # Publish user created event, committed together with the user
+            if db_user.id is not None:
                 await self.user_event_service.publish_user_event(
                     user_id=db_user.id,
                     event_type=NATSPublishTopic.USER_CREATED,
                     data=user.model_dump(exclude_none=True)
                 )
 
+            await self.session.commit()
+            await self.session.refresh(db_user)
+            await self.session.refresh(db_user, ["system_role", "user_project_roles"])
+
             return self._to_domain(db_user)
 
         except Exception as e:
@@ -241,15 +361,200 @@ class SQLAlchemyUserRepository(IUserRepository):
             await self.session.rollback()
             raise
 
+    async def bulk_sync_jira_users(
+        self,
+        jira_users: List[SyncedJiraUserDTO],
+        project_id: int,
+        role_id: int,
+        match_by_email: bool = True,
+        is_jira_linked: bool = False
+    ) -> JiraUserSyncResult:
+        """Resolve, create and enrol Jira users with set-based statements in one transaction"""
+        results = await self.bulk_sync_jira_project_users({project_id: jira_users}, role_id, match_by_email, is_jira_linked)
+        return results[project_id]
+
+    async def bulk_sync_jira_project_users(
+        self,
+        project_users: Dict[int, List[SyncedJiraUserDTO]],
+        role_id: int,
+        match_by_email: bool = True,
+        is_jira_linked: bool = False
+    ) -> Dict[int, JiraUserSyncResult]:
+        """Sync the Jira users of several projects in one transaction"""
+        results: Dict[int, JiraUserSyncResult] = {}
+        created: List[Tuple[int, SyncedJiraUserDTO]] = []
+        try:
+            for project_id, jira_users in project_users.items():
+                results[project_id] = await self._sync_jira_users(
+                    jira_users, project_id, role_id, match_by_email, is_jira_linked, created
+                )
+
+            # Publish user created events, committed together with the users
+            for user_id, jira_user in created:
+                await self.user_event_service.publish_user_event(
+                    user_id=user_id,
+                    event_type=NATSPublishTopic.USER_CREATED,
+                    data=UserCreate(
+                        email=jira_user.email,
+                        name=jira_user.name,
+                        is_active=False,
+                        jira_account_id=jira_user.jira_account_id,
+                        is_jira_linked=is_jira_linked,
+                        is_system_user=False,
+                        avatar_url=jira_user.avatar_url
+                    ).model_dump(exclude_none=True)
+                )
+            await self.session.commit()
+        except Exception as e:
+            log.error(f"Error bulk syncing Jira users: {str(e)}")
+            await self.session.rollback()
+            raise
+
+        return results
+
+    async def _sync_jira_users(
+        self,
+        jira_users: List[SyncedJiraUserDTO],
+        project_id: int,
+        role_id: int,
+        match_by_email: bool,
+        is_jira_linked: bool,
+        created_users: List[Tuple[int, SyncedJiraUserDTO]]
+    ) -> JiraUserSyncResult:
+        """Resolve, create and enrol the Jira users of one project, leaving the commit to the caller.
+
+        Users inserted here are appended to created_users with their new id.
+        """
+        # One entry per Jira account
+        unique_users = list({jira_user.jira_account_id: jira_user for jira_user in jira_users}.values())
+        result = JiraUserSyncResult(total_users=len(unique_users))
+        if not unique_users:
+            return result
+
+        # account id -> user id
+        resolved: Dict[str, Optional[int]] = {}
+        created: List[SyncedJiraUserDTO] = []
+
+        # Stage 1: resolve existing users by email, then by Jira account id
+        started_at = time.perf_counter()
+        if match_by_email:
+            emails = {jira_user.email for jira_user in unique_users if jira_user.email}
+            if emails:
+                email_rows = await self.session.exec(
+                    select(UserModel.id, UserModel.email).where(col(UserModel.email).in_(emails))
+                )
+                user_ids_by_email = {email: user_id for user_id, email in email_rows.all()}
+                for jira_user in unique_users:
+                    if jira_user.email in user_ids_by_email:
+                        resolved[jira_user.jira_account_id] = user_ids_by_email[jira_user.email]
+
+        account_ids = [jira_user.jira_account_id for jira_user in unique_users
+                       if jira_user.jira_account_id not in resolved]
+        if account_ids:
+            account_rows = await self.session.exec(
+                select(UserModel.id, UserModel.jira_account_id)
+                .where(col(UserModel.jira_account_id).in_(account_ids))
+            )
+            for user_id, jira_account_id in account_rows.all():
+                if jira_account_id is not None:
+                    resolved.setdefault(jira_account_id, user_id)
+        result.matched_users = len(resolved)
+        result.stages.append(self._sync_stage("resolve_users", len(resolved), started_at))
+
+        # Stage 2: insert the missing users, skipping emails that appeared concurrently
+        started_at = time.perf_counter()
+        missing = [jira_user for jira_user in unique_users if jira_user.jira_account_id not in resolved]
+        # Users without an email cannot be created, the column is unique and required
+        result.skipped_users = sum(1 for jira_user in missing if not jira_user.email)
+        missing = [jira_user for jira_user in missing if jira_user.email]
+        now = datetime.now()
+        for chunk in self._chunks(missing):
+            insert_stmt = (
+                pg_insert(UserModel)
+                .values([
+                    {
+                        "email": jira_user.email,
+                        "name": jira_user.name,
+                        "is_active": False,
+                        "jira_account_id": jira_user.jira_account_id,
+                        "is_jira_linked": is_jira_linked,
+                        "is_system_user": False,  # Users created from Jira sync are not system users
+                        "avatar_url": jira_user.avatar_url,
+                        "profile_data": {},
+                        "created_at": now
+                    }
+                    for jira_user in chunk
+                ])
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(col(UserModel.id), col(UserModel.jira_account_id))
+            )
+            inserted_rows = await self.session.execute(insert_stmt)
+            inserted = {jira_account_id: user_id for user_id, jira_account_id in inserted_rows.all()}
+            resolved.update(inserted)
+            created.extend(jira_user for jira_user in chunk if jira_user.jira_account_id in inserted)
+
+        # Rows that lost the race on email still belong to an existing user
+        conflicted = {jira_user.email: jira_user.jira_account_id
+                      for jira_user in missing if jira_user.jira_account_id not in resolved}
+        if conflicted:
+            conflicted_rows = await self.session.exec(
+                select(UserModel.id, UserModel.email).where(col(UserModel.email).in_(conflicted.keys()))
+            )
+            for user_id, email in conflicted_rows.all():
+                resolved[conflicted[email]] = user_id
+                result.matched_users += 1
+        result.created_users = len(created)
+        result.stages.append(self._sync_stage("insert_users", len(created), started_at))
+
+        # Stage 3: enrol users that have no role in the project yet
+        started_at = time.perf_counter()
+        user_ids = {user_id for user_id in resolved.values() if user_id is not None}
+        member_rows = await self.session.exec(
+            select(UserProjectRoleModel.user_id)
+            .where(
+                col(UserProjectRoleModel.project_id) == project_id,
+                col(UserProjectRoleModel.user_id).in_(user_ids)
+            )
+            .distinct()
+        )
+        new_member_ids = sorted(user_ids - set(member_rows.all()))
+        for chunk in self._chunks(new_member_ids):
+            # A membership added concurrently since the lookup above is skipped by the unique constraint
+            await self.session.exec(
+                SQLAlchemyRoleRepository._insert_assignments([
+                    {"user_id": user_id, "project_id": project_id, "role_id": role_id, "created_at": now}
+                    for user_id in chunk
+                ])
+            )
+        result.assigned_memberships = len(new_member_ids)
+        result.stages.append(self._sync_stage("insert_memberships", len(new_member_ids), started_at))
+
+        for jira_user in created:
+            created_id = resolved[jira_user.jira_account_id]
+            if created_id is not None:
+                created_users.append((created_id, jira_user))
+        return result
+
+    @staticmethod
+    def _chunks(items: List[Any], size: int = 1000) -> Iterator[List[Any]]:
+        """Split bulk statements to stay under the bind parameter limit"""
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
+
+    @staticmethod
+    def _sync_stage(name: str, count: int, started_at: float) -> JiraUserSyncStage:
+        stage = JiraUserSyncStage(name=name, count=count, duration_ms=(time.perf_counter() - started_at) * 1000)
+        log.info(f"Jira user sync stage {name}: {count} rows in {stage.duration_ms:.1f} ms")
+        return stage
+
     async def update_user_by_id(self, user_id: int, user: UserUpdate) -> None:
         stmt = (
             update(UserModel).where(UserModel.id == user_id).values(  # type: ignore
                 **user.model_dump(exclude={"id"}, exclude_none=True))
         )
         await self.session.exec(stmt)  # type: ignore
-        await self.session.commit()
 
-        # Publish user update event
+        # Publish user update event, committed together with the update
         await self.user_event_service.publish_user_event(
             user_id=user_id,
             event_type=NATSPublishTopic.USER_UPDATED,
@@ -263,13 +568,14 @@ class SQLAlchemyUserRepository(IUserRepository):
                 user_id=user_id,
                 event_type=event_type
             )
+        await self.session.commit()
 
         # clear cache in redis with key user:{user_id}
         await self.redis_service.delete(f"user:{user_id}")
 
     async def get_user_by_jira_account_id(self, jira_account_id: str) -> Optional[UserEntity]:
         result = await self.session.exec(
-            select(UserModel).where(UserModel.jira_account_id == jira_account_id)
+            select(UserModel).options(*self._user_load_options()).where(UserModel.jira_account_id == jira_account_id)
         )
         user = result.first()
         return self._to_domain(user) if user else None
@@ -382,12 +688,8 @@ class SQLAlchemyUserRepository(IUserRepository):
 
         # Add search condition if provided
         if search:
-            search_term = f"%{search}%"
             stmt = stmt.where(
-                or_(
-                    col(UserModel.name).ilike(search_term),
-                    col(UserModel.email).ilike(search_term)
-                )
+                matches_search(search, col(UserModel.name), col(UserModel.email))
             )
 
         # Execute query
@@ -403,24 +705,12 @@ class SQLAlchemyUserRepository(IUserRepository):
     ) -> List[UserEntity]:
         """Get all users in the system with their roles"""
         # Build base query for users
-        stmt = (
-            select(UserModel)
-            .options(
-                selectinload(UserModel.system_role).selectinload(RoleModel.permissions),  # type: ignore
-                selectinload(UserModel.user_project_roles).selectinload(  # type: ignore
-                    UserProjectRoleModel.role).selectinload(RoleModel.permissions),  # type: ignore
-                selectinload(UserModel.user_project_roles).selectinload(UserProjectRoleModel.project)  # type: ignore
-            )
-        )
+        stmt = select(UserModel).options(*self._user_load_options())
 
         # Add search condition if provided
         if search:
-            search_term = f"%{search}%"
             stmt = stmt.where(
-                or_(
-                    col(UserModel.name).ilike(search_term),
-                    col(UserModel.email).ilike(search_term)
-                )
+                matches_search(search, col(UserModel.name), col(UserModel.email))
             )
 
         # Execute query
@@ -429,6 +719,51 @@ class SQLAlchemyUserRepository(IUserRepository):
 
         return [self._to_domain(user) for user in users]
 
+    async def stream_users(
+        self,
+        search: Optional[str] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[UserEntity]:
+        """Stream users with their system role, batch_size rows at a time from a server-side cursor"""
+        stmt = (
+            select(UserModel)
+            .options(
+                # Only the system role is exported, project roles are never loaded
+                selectinload(UserModel.system_role),  # type: ignore
+                noload(UserModel.user_project_roles)  # type: ignore
+            )
+            .order_by(col(UserModel.id))
+            .execution_options(yield_per=batch_size)
+        )
+
+        if search:
+            stmt = stmt.where(
+                matches_search(search, col(UserModel.name), col(UserModel.email))
+            )
+
+        # The identity map only holds weak references, so each batch is freed once it has been mapped
+        result = await self.session.stream_scalars(stmt)
+        async for batch in result.partitions():
+            for user in batch:
+                yield self._to_domain(user)
+
+    async def search_users(self, term: str, limit: int = 10) -> List[UserSearchResult]:
+        """Active users whose name or email contains or resembles the term, most similar first"""
+        name, email = col(UserModel.name), col(UserModel.email)
+        # Substring matches and pg_trgm's % (similarity above the threshold) are both served by the trigram indexes
+        stmt = (
+            select(UserModel.id, UserModel.name, UserModel.email, UserModel.avatar_url)
+            .where(col(UserModel.is_active).is_(True))
+            .where(or_(matches_search(term, name, email), name.op("%")(term), email.op("%")(term)))
+            .order_by(func.greatest(func.similarity(name, term), func.similarity(email, term)).desc(), name)
+            .limit(limit)
+        )
+        result = await self.session.exec(stmt)
+        return [
+            UserSearchResult(id=user_id, name=user_name, email=user_email, avatar_url=avatar_url)
+            for user_id, user_name, user_email, avatar_url in result.all()
+        ]
+
     def _to_domain_user_project_role(self, upr: UserProjectRoleModel) -> UserProjectRoleEntity:
         """Convert UserProjectRole model to domain entity"""
         return UserProjectRoleEntity(
@@ -475,7 +810,7 @@ class SQLAlchemyUserRepository(IUserRepository):
 
     async def update_profile(self, id: int, profile_data: UserProfileUpdate) -> UserEntity:
         """Update a user's profile data"""
-        stmt = select(UserModel).where(col(UserModel.id) == id)
+        stmt = select(UserModel).options(*self._user_load_options()).where(col(UserModel.id) == id)
         result = await self.session.exec(stmt)
         db_user = result.one_or_none()
 
@@ -496,6 +831,7 @@ class SQLAlchemyUserRepository(IUserRepository):
 
         await self.session.commit()
         await self.session.refresh(db_user)
+        await self.session.refresh(db_user, ["system_role", "user_project_roles"])
 
         # Convert to domain entity
         user = self._to_domain(db_user)
@@ -503,7 +839,7 @@ class SQLAlchemyUserRepository(IUserRepository):
 
     async def get_user_profile(self, user_id: int) -> UserEntity:
         """Get user profile"""
-        stmt = select(UserModel).where(col(UserModel.id) == user_id)
+        stmt = select(UserModel).options(*self._user_load_options()).where(col(UserModel.id) == user_id)
         result = await self.session.exec(stmt)
         db_user = result.one_or_none()
         if db_user is None:
@@ -2,6 +2,8 @@ from typing import cast
 
 from passlib.context import CryptContext
 
+from src.configs.auth import crypto_executor
+
 # Create a password context for hashing and verifying passwords
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -16,3 +18,8 @@ class BcryptService:
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a plain password against a hashed password."""
         return cast(bool, pwd_context.verify(plain_password, hashed_password))
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password on the crypto worker pool."""
+        return await crypto_executor.run(BcryptService.verify_password, plain_password, hashed_password)
@@ -0,0 +1,48 @@
+from typing import Any, Dict
+import uuid
+
+from src.configs.logger import log
+from src.domain.constants.nats_events import NATSPublishTopic
+from src.domain.services.cache_invalidation_service import ICacheInvalidationService
+from src.domain.services.local_cache import ILocalCache
+from src.domain.services.nats_service import INATSService
+
+# Keys that may be held in a replica's in-process cache
+BROADCAST_KEY_PREFIXES = ("user:", "user_profile:", "permissions:user:")
+
+
+class CacheInvalidationService(ICacheInvalidationService):
+    """Keeps the in-process caches of all replicas in step with Redis deletes"""
+
+    def __init__(self, local_cache: ILocalCache, nats_service: INATSService):
+        self.local_cache = local_cache
+        self.nats_service = nats_service
+        # Lets a replica ignore its own broadcasts
+        self.instance_id = uuid.uuid4().hex
+
+    async def invalidate(self, key: str) -> None:
+        self.local_cache.delete(key)
+        if not key.startswith(BROADCAST_KEY_PREFIXES):
+            return
+        try:
+            await self.nats_service.publish(
+                subject=NATSPublishTopic.USER_CACHE_INVALIDATED.value,
+                message={"keys": [key], "origin": self.instance_id}
+            )
+        except Exception as e:
+            # Other replicas fall back to the local TTL if the broadcast is lost
+            log.error(f"Failed to broadcast cache invalidation for {key}: {str(e)}")
+
+    async def start(self) -> None:
+        # No queue group, every replica has to drop its own copy
+        await self.nats_service.subscribe(
+            subject=NATSPublishTopic.USER_CACHE_INVALIDATED.value,
+            callback=self.handle_invalidation
+        )
+
+    async def handle_invalidation(self, subject: str, data: Dict[str, Any]) -> None:
+        """Drop keys invalidated by another replica"""
+        if data.get("origin") == self.instance_id:
+            return
+        for key in data.get("keys", []):
+            self.local_cache.delete(key)
@@ -0,0 +1,97 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+from prometheus_client import Gauge, Histogram
+
+from src.configs.logger import log
+
+T = TypeVar("T")
+
+CRYPTO_EXECUTOR_QUEUE_DEPTH = Gauge(
+    "crypto_executor_queue_depth",
+    "CPU-bound crypto tasks waiting for a free worker",
+    multiprocess_mode="livesum"
+)
+CRYPTO_EXECUTOR_IN_FLIGHT = Gauge(
+    "crypto_executor_in_flight",
+    "CPU-bound crypto tasks currently running on a worker",
+    multiprocess_mode="livesum"
+)
+CRYPTO_EXECUTOR_WAIT_SECONDS = Histogram(
+    "crypto_executor_wait_seconds",
+    "Time a crypto task spent queued before a worker picked it up",
+    ["task"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+CRYPTO_EXECUTOR_RUN_SECONDS = Histogram(
+    "crypto_executor_run_seconds",
+    "Time a crypto task spent running on a worker",
+    ["task"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+
+
+class CryptoExecutor:
+    """Bounded worker pool for CPU-heavy crypto (RS256 signing, bcrypt).
+
+    bcrypt and the ``cryptography`` RSA backend release the GIL while they work,
+    so a small thread pool keeps the event loop responsive without having to
+    pickle keys into worker processes.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="crypto"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking function on the pool and await its result"""
+        task = getattr(func, "__qualname__", "unknown")
+        queued_at = time.perf_counter()
+        CRYPTO_EXECUTOR_QUEUE_DEPTH.inc()
+
+        state_lock = threading.Lock()
+        state = {"started": False, "abandoned": False}
+
+        def _call() -> T:
+            with state_lock:
+                if state["abandoned"]:
+                    raise asyncio.CancelledError()
+                state["started"] = True
+            started_at = time.perf_counter()
+            CRYPTO_EXECUTOR_QUEUE_DEPTH.dec()
+            CRYPTO_EXECUTOR_IN_FLIGHT.inc()
+            CRYPTO_EXECUTOR_WAIT_SECONDS.labels(task=task).observe(started_at - queued_at)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                CRYPTO_EXECUTOR_IN_FLIGHT.dec()
+                CRYPTO_EXECUTOR_RUN_SECONDS.labels(task=task).observe(time.perf_counter() - started_at)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), _call)
+        except asyncio.CancelledError:
+            # Skip work nobody is waiting for any more and keep the depth gauge honest
+            with state_lock:
+                if not state["started"]:
+                    state["abandoned"] = True
+                    CRYPTO_EXECUTOR_QUEUE_DEPTH.dec()
+            raise
+
+    def shutdown(self) -> None:
+        """Wait for running tasks and release the worker threads"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            log.info("Crypto executor shut down")
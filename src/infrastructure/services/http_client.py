@@ -0,0 +1,54 @@
+from typing import Optional
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from src.configs.logger import log
+
+
+class HTTPClient:
+    """Process-wide aiohttp session for outbound calls to the SSO providers and Jira.
+
+    One pooled connector keeps connections to each host alive between logins, so a
+    call reuses an open TLS connection and a cached DNS answer instead of paying
+    for both every time. The session is created on first use, inside the running
+    event loop.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        total_timeout: float = 15.0,
+        connect_timeout: float = 5.0
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = ClientTimeout(total=total_timeout, connect=connect_timeout)
+        self._session: Optional[ClientSession] = None
+
+    @property
+    def session(self) -> ClientSession:
+        """The shared session, reopened if it was closed"""
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    use_dns_cache=True,
+                    ttl_dns_cache=self.dns_cache_ttl
+                ),
+                timeout=self.timeout
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            log.info("HTTP client closed")
+        self._session = None
@@ -1,12 +1,11 @@
-from typing import Any, Dict
-
-from aiohttp import ClientSession
+from typing import Any, Dict, Optional
 
 from src.configs.logger import log
 from src.configs.settings import settings
 from src.domain.entities.auth import JiraIdentity
 from src.domain.exceptions.auth_exceptions import SSOError
 from src.domain.services.jira_sso_service import IJiraSSOService
+from src.infrastructure.services.http_client import HTTPClient
 
 
 class JiraSSOService(IJiraSSOService):
@@ -35,6 +34,11 @@ class JiraSSOService(IJiraSSOService):
         "write:issue-link:jira",
     ]
 
+    def __init__(self, http_client: HTTPClient, token_endpoint: str = TOKEN_ENDPOINT, api_base_url: Optional[str] = None):
+        self.http_client = http_client
+        self.token_endpoint = token_endpoint
+        self.api_base_url = api_base_url or settings.JIRA_BASE_URL
+
     async def generate_jira_auth_url(self) -> str:
         """Generate Jira SSO authentication URL"""
         try:
@@ -67,20 +71,46 @@ class JiraSSOService(IJiraSSOService):
 
     async def _exchange_code_for_token(self, code: str) -> Dict[str, Any]:
         """Exchange authorization code for tokens"""
-        async with ClientSession() as session:
-            async with session.post(
-                self.TOKEN_ENDPOINT,
-                data={
-                    "grant_type": "authorization_code",
-                    "client_id": settings.JIRA_CLIENT_ID,
-                    "client_secret": settings.JIRA_CLIENT_SECRET,
-                    "code": code,
-                    "redirect_uri": settings.JIRA_REDIRECT_URI,
-                    "scope": self.SCOPE
-                }
-            ) as response:
-                data: Dict[str, Any] = await response.json()
-                if "error" in data:
-                    log.error(f"Jira token exchange failed: {data.get('error_description')}")
-                    raise SSOError("Failed to exchange Jira authorization code")
-                return data
+        async with self.http_client.session.post(
+            self.token_endpoint,
+            data={
+                "grant_type": "authorization_code",
+                "client_id": settings.JIRA_CLIENT_ID,
+                "client_secret": settings.JIRA_CLIENT_SECRET,
+                "code": code,
+                "redirect_uri": settings.JIRA_REDIRECT_URI,
+                "scope": self.SCOPE
+            }
+        ) as response:
+            data: Dict[str, Any] = await response.json()
+            if "error" in data:
+                log.error(f"Jira token exchange failed: {data.get('error_description')}")
+                raise SSOError("Failed to exchange Jira authorization code")
+            return data
+
+    async def fetch_user_avatar(self, access_token: str, account_id: str) -> Optional[str]:
+        """Fetch user avatar URL from Jira API"""
+        try:
+            # Jira API endpoint to get user information
+            url = f"{self.api_base_url}/rest/api/3/user"
+
+            # Set up headers with access token
+            headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Accept": "application/json"
+            }
+
+            # Make request to Jira API
+            async with self.http_client.session.get(url, headers=headers, params={"accountId": account_id}) as response:
+                if response.status == 200:
+                    user_data = await response.json()
+                    # Extract avatar URL from response
+                    if user_data and "avatarUrls" in user_data and "48x48" in user_data["avatarUrls"]:
+                        return str(user_data["avatarUrls"]["48x48"])
+                    return None
+                else:
+                    log.error(f"Failed to fetch Jira user avatar: {response.status}")
+                    return None
+        except Exception as e:
+            log.error(f"Error fetching Jira user avatar: {e}")
+            return None
@@ -0,0 +1,90 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import jwt
+
+from src.configs.logger import log
+
+
+class JWTKeyStore:
+    """Loads the JWT signing and verification keys once and keeps them parsed in memory.
+
+    Keys are handed out as ready-made key objects so PyJWT does not re-parse the
+    PEM on every encode/decode. The files are re-checked at most once per
+    ``reload_interval`` seconds and only re-read when their mtime or size changes.
+    """
+
+    def __init__(
+        self,
+        private_key_path: str,
+        public_key_path: str,
+        algorithm: str,
+        reload_interval: float = 60
+    ):
+        self.private_key_path = private_key_path
+        self.public_key_path = public_key_path
+        self.algorithm = algorithm
+        self.reload_interval = reload_interval
+
+        self._lock = threading.Lock()
+        # path -> (file signature, parsed key)
+        self._keys: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self._last_checked: Dict[str, float] = {}
+
+    @property
+    def private_key(self) -> Any:
+        """Parsed private key used to sign tokens"""
+        return self._get_key(self.private_key_path)
+
+    @property
+    def public_key(self) -> Any:
+        """Parsed public key used to verify tokens"""
+        return self._get_key(self.public_key_path)
+
+    def reload(self) -> None:
+        """Force both keys to be re-read from disk on next access"""
+        with self._lock:
+            self._keys.clear()
+            self._last_checked.clear()
+
+    def _get_key(self, path: str) -> Any:
+        cached = self._keys.get(path)
+        now = time.monotonic()
+        if cached and now - self._last_checked.get(path, 0) < self.reload_interval:
+            return cached[1]
+
+        with self._lock:
+            cached = self._keys.get(path)
+            signature = self._file_signature(path)
+            self._last_checked[path] = now
+
+            if cached and (signature is None or cached[0] == signature):
+                # Keep serving the last good key if the file briefly disappears during rotation
+                return cached[1]
+            if signature is None:
+                raise RuntimeError(f"JWT key file not found: {path}")
+
+            key = self._load_key(path)
+            self._keys[path] = (signature, key)
+            if cached:
+                log.info(f"Reloaded JWT key from {path}")
+            return key
+
+    def _load_key(self, path: str) -> Any:
+        try:
+            with open(path, "rb") as key_file:
+                pem = key_file.read()
+            return jwt.get_algorithm_by_name(self.algorithm).prepare_key(pem)
+        except Exception as e:
+            log.error(f"Failed to load JWT key from {path}: {str(e)}")
+            raise RuntimeError("Failed to load JWT keys") from e
+
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
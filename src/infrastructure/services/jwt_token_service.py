@@ -1,7 +1,7 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 import secrets
-from typing import Dict, List, Optional, cast
+from typing import Any, AsyncContextManager, Awaitable, Callable, Optional, Set, cast
 
 import jwt
 from sqlmodel import col, select
@@ -12,20 +12,34 @@ from src.configs.settings import settings
 from src.domain.constants.auth import TokenType
 from src.domain.entities.auth import RefreshTokenEntity, TokenPair
 from src.domain.entities.user import User as UserEntity
-from src.domain.exceptions.auth_exceptions import InvalidTokenError, TokenError, TokenExpiredError
+from src.domain.exceptions.auth_exceptions import InvalidTokenError, TokenError, TokenExpiredError, UserNotFoundError
 from src.domain.repositories.permission_repository import IPermissionRepository
 from src.domain.repositories.refresh_token_repository import IRefreshTokenRepository
 from src.domain.repositories.role_repository import IRoleRepository
 from src.domain.repositories.user_repository import IUserRepository
 from src.domain.services.redis_service import IRedisService
+from src.domain.services.refresh_token_store import IRefreshTokenStore
 from src.domain.services.token_service import ITokenService
 from src.domain.value_objects.token import TokenPayload
 from src.infrastructure.models.refresh_token import RefreshToken as RefreshTokenModel
+from src.infrastructure.services.crypto_executor import CryptoExecutor
+from src.infrastructure.services.jwt_key_store import JWTKeyStore
+from src.utils.tokens import hash_token
+
+# Opens a refresh token repository on its own database session, so a write-behind never borrows the request's
+RefreshTokenRepositoryScope = Callable[[], AsyncContextManager[IRefreshTokenRepository]]
+
+# Strong references to pending write-behinds, the event loop only keeps weak ones
+_pending_writes: Set["asyncio.Task[None]"] = set()
 
 
 class JWTTokenService(ITokenService):
-    _private_key: bytes
-    _public_key: bytes
+    """Issues JWT access tokens and rotates refresh tokens.
+
+    Refresh tokens are stored hashed. Whether one is active is answered by the refresh
+    token store; Postgres gets the same changes written behind as the durable log, and
+    is only read when the store does not know a token.
+    """
 
     def __init__(
         self,
@@ -33,79 +47,37 @@ class JWTTokenService(ITokenService):
         role_repository: IRoleRepository,
         user_repository: IUserRepository,
         refresh_token_repository: IRefreshTokenRepository,
-        permission_repository: IPermissionRepository
+        permission_repository: IPermissionRepository,
+        key_store: JWTKeyStore,
+        crypto_executor: CryptoExecutor,
+        refresh_token_store: IRefreshTokenStore,
+        refresh_token_repository_scope: RefreshTokenRepositoryScope
     ):
         self.redis_service = redis_service
         self.role_repository = role_repository
         self.user_repository = user_repository
         self.refresh_token_repository = refresh_token_repository
         self.permission_repository = permission_repository
-
-        self._load_keys()
+        self.key_store = key_store
+        self.crypto_executor = crypto_executor
+        self.refresh_token_store = refresh_token_store
+        self.refresh_token_repository_scope = refresh_token_repository_scope
 
     async def create_token_pair(self, user: UserEntity) -> TokenPair:
         """Create new access and refresh token pair"""
         try:
             if not user.id:
                 raise ValueError("User ID is required")
-            # Get user's roles and permissions
-            system_role = await self.role_repository.get_system_role_by_user_id(user.id)
-            project_roles = await self.role_repository.get_project_roles_by_user_id(user.id)
-            system_permissions = await self.permission_repository.get_system_permissions_by_user_id(user.id)
-            project_permissions = await self.permission_repository.get_permissions_of_all_projects_by_user_id(user.id)
-
-            # Build project roles dict mapping project_id -> list of role names
-            project_roles_dict: Dict[int, List[str]] = {}
-            for proj_role in project_roles:
-                project_id = proj_role.project_id
-                role_name = proj_role.role_name
-
-                if project_id not in project_roles_dict:
-                    project_roles_dict[project_id] = []
-
-                project_roles_dict[project_id].append(role_name)
-
-            # Build project permissions dict mapping project_id -> permission list
-            project_perms_dict: Dict[int, List[str]] = {}
-            for proj_perm in project_permissions:
-                project_perms_dict[proj_perm.project_id] = [p.name for p in proj_perm.permissions]
-
-            token_payload = TokenPayload(
-                sub=str(user.id),
-                email=user.email,
-                name=user.name,
-                system_role=system_role.role_name if system_role else "",
-                system_permissions=[p.name for p in system_permissions.permissions],
-                project_roles=project_roles_dict,
-                project_permissions=project_perms_dict,
-                is_jira_linked=user.is_jira_linked
-            )
-
-            # Create access token
-            access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-            access_token = self._create_token(token_payload, access_token_expires)
 
-            # Create refresh token
             refresh_token = secrets.token_urlsafe(64)
-            refresh_token_expires = timedelta(seconds=settings.REFRESH_TOKEN_EXPIRATION_TIME)
-            refresh_token_expires_at = (datetime.now(timezone.utc) + refresh_token_expires)
-
-            # Store refresh token
-            await self.refresh_token_repository.create_refresh_token(
-                RefreshTokenEntity(
-                    token=refresh_token,
-                    user_id=user.id,
-                    expires_at=refresh_token_expires_at,
-                    token_type=TokenType.APP
-                )
-            )
+            refresh_token_entity = self._refresh_token_entity(refresh_token, user.id)
+            token_pair = await self._token_pair(user.id, refresh_token)
 
-            return TokenPair(
-                access_token=access_token,
-                refresh_token=refresh_token,
-                token_type="bearer",
-                expires_in=int(access_token_expires.total_seconds())
+            await self.refresh_token_store.issue(
+                refresh_token_entity.token, user.id, settings.REFRESH_TOKEN_EXPIRATION_TIME
             )
+            self._write_behind(lambda repository: repository.create_refresh_token(refresh_token_entity))
+            return token_pair
 
         except Exception as e:
             log.error(f"Token creation error: {str(e)}")
@@ -114,37 +86,90 @@ class JWTTokenService(ITokenService):
     async def refresh_tokens(self, refresh_token: str) -> TokenPair:
         """Refresh access token using refresh token"""
         try:
-            # Get refresh token from database
-            stored_token = await self.refresh_token_repository.get_by_token(refresh_token)
-            if not stored_token:
-                raise InvalidTokenError("Invalid refresh token")
-
-            # Check if token is expired or revoked
-            if stored_token.is_revoked:
-                raise InvalidTokenError("Refresh token has been revoked")
-            if stored_token.expires_at < datetime.now(timezone.utc):
-                raise TokenExpiredError("Refresh token has expired")
-
-            # Get user
-            user = await self.user_repository.get_user_by_id(stored_token.user_id)
-            if not user:
-                raise InvalidTokenError("User not found")
-
-            # Revoke old refresh token
-            await self.refresh_token_repository.revoke_token(refresh_token)
-
-            # Create new token pair
-            return await self.create_token_pair(user)
+            token_hash = hash_token(refresh_token)
+            new_refresh_token = secrets.token_urlsafe(64)
+            new_token_hash = hash_token(new_refresh_token)
+            ttl = settings.REFRESH_TOKEN_EXPIRATION_TIME
+
+            # Validate the old token and swap in the new one in a single atomic step
+            user_id = await self.refresh_token_store.rotate(token_hash, new_token_hash, ttl)
+            if user_id is not None:
+                new_entity = self._refresh_token_entity(new_refresh_token, user_id)
+                self._write_behind(lambda repository: repository.rotate_token(token_hash, new_entity))
+            else:
+                # Unknown to the store, e.g. issued before it was introduced or lost with a Redis restart
+                stored_token = await self.refresh_token_repository.consume_token(token_hash)
+                if not stored_token:
+                    raise InvalidTokenError("Invalid refresh token")
+                if stored_token.expires_at < datetime.now(timezone.utc):
+                    raise TokenExpiredError("Refresh token has expired")
+                user_id = stored_token.user_id
+                new_entity = self._refresh_token_entity(new_refresh_token, user_id)
+                await self.refresh_token_store.issue(new_token_hash, user_id, ttl)
+                self._write_behind(lambda repository: repository.create_refresh_token(new_entity))
+
+            return await self._token_pair(user_id, new_refresh_token)
         except Exception as e:
             log.error(f"Token refresh error: {str(e)}")
             raise TokenError("Failed to refresh tokens") from e
 
+    async def get_refresh_token_user_id(self, refresh_token: str) -> Optional[int]:
+        """Owner of a refresh token this service issued, whether or not it is still valid"""
+        token_hash = hash_token(refresh_token)
+        user_id = await self.refresh_token_store.get_user_id(token_hash)
+        if user_id is not None:
+            return user_id
+        stored_token = await self.refresh_token_repository.get_by_token(token_hash)
+        return stored_token.user_id if stored_token else None
+
+    async def revoke_refresh_tokens(self, user_id: int) -> None:
+        """Revoke every active refresh token of a user in the store, the caller revokes them in Postgres"""
+        await self.refresh_token_store.revoke_user_tokens(user_id)
+
+    async def _token_pair(self, user_id: int, refresh_token: str) -> TokenPair:
+        # Roles and permissions are projected in a single round trip
+        token_payload = await self.user_repository.get_token_claims(user_id)
+        if not token_payload:
+            raise UserNotFoundError(f"User {user_id} not found")
+
+        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        access_token = await self.crypto_executor.run(self._create_token, token_payload, access_token_expires)
+
+        return TokenPair(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            token_type="bearer",
+            expires_in=int(access_token_expires.total_seconds())
+        )
+
+    def _refresh_token_entity(self, refresh_token: str, user_id: int) -> RefreshTokenEntity:
+        """What Postgres keeps of a refresh token, its hash"""
+        return RefreshTokenEntity(
+            token=hash_token(refresh_token),
+            user_id=user_id,
+            expires_at=datetime.now(timezone.utc) + timedelta(seconds=settings.REFRESH_TOKEN_EXPIRATION_TIME),
+            token_type=TokenType.APP
+        )
+
+    def _write_behind(self, write: Callable[[IRefreshTokenRepository], Awaitable[Any]]) -> None:
+        """Log a refresh token change to Postgres without holding up the response"""
+        task = asyncio.create_task(self._run_write_behind(write))
+        _pending_writes.add(task)
+        task.add_done_callback(_pending_writes.discard)
+
+    async def _run_write_behind(self, write: Callable[[IRefreshTokenRepository], Awaitable[Any]]) -> None:
+        try:
+            async with self.refresh_token_repository_scope() as repository:
+                await write(repository)
+        except Exception as e:
+            log.error(f"Failed to write refresh token to the database: {str(e)}")
+
     async def verify_token(self, token: str) -> Optional[UserEntity]:
         """Verify JWT token"""
         try:
             payload = jwt.decode(
                 token,
-                self._public_key,
+                self.key_store.public_key,
                 algorithms=[settings.JWT_ALGORITHM]
             )
 
@@ -233,22 +258,6 @@ class JWTTokenService(ITokenService):
     #         token_type=TokenType.JIRA
     #     )
 
-    def _load_keys(self) -> None:
-        """Load private and public keys from PEM files"""
-        try:
-            private_key_path = Path(settings.JWT_PRIVATE_KEY_PATH)
-            public_key_path = Path(settings.JWT_PUBLIC_KEY_PATH)
-
-            with open(private_key_path, 'rb') as private_file:
-                self._private_key = private_file.read()
-
-            with open(public_key_path, 'rb') as public_file:
-                self._public_key = public_file.read()
-
-        except Exception as e:
-            log.error(f"Failed to load JWT keys: {str(e)}")
-            raise RuntimeError("Failed to initialize JWT service") from e
-
     def _create_token(self, payload: TokenPayload, expires_delta: timedelta) -> str:
         """Create JWT token with role and permission claims"""
         expires_at = datetime.now() + expires_delta
@@ -262,7 +271,7 @@ class JWTTokenService(ITokenService):
 
         return cast(str, jwt.encode(
             token_payload,
-            self._private_key,
+            self.key_store.private_key,
             algorithm=settings.JWT_ALGORITHM
         ))
 
@@ -270,7 +279,14 @@ class JWTTokenService(ITokenService):
         """Decode and verify JWT token"""
         payload = jwt.decode(
             token,
-            self._public_key,
+            self.key_store.public_key,
             algorithms=[settings.JWT_ALGORITHM]
         )
         return TokenPayload.model_validate(payload)
+
+
+async def flush_refresh_token_writes(timeout: Optional[float] = None) -> None:
+    """Wait for the refresh token write-behinds still pending in this process"""
+    tasks = list(_pending_writes)
+    if tasks:
+        await asyncio.wait(tasks, timeout=timeout)
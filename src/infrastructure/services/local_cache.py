@@ -0,0 +1,96 @@
+from collections import OrderedDict
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from prometheus_client import Counter, Gauge
+
+from src.domain.services.local_cache import ILocalCache
+
+USER_CACHE_REQUESTS = Counter(
+    "user_cache_requests_total",
+    "User cache lookups per tier and outcome",
+    ["tier", "result"]
+)
+USER_CACHE_HIT_RATIO = Gauge(
+    "user_cache_hit_ratio",
+    "Hit ratio of each user cache tier since process start",
+    ["tier"],
+    multiprocess_mode="liveall"
+)
+USER_CACHE_LOCAL_SIZE = Gauge(
+    "user_cache_local_entries",
+    "Entries currently held in the in-process user cache",
+    multiprocess_mode="liveall"
+)
+
+_lookups: Dict[str, Dict[str, int]] = {}
+
+
+def record_cache_lookup(tier: str, hit: bool) -> None:
+    """Count a lookup against a cache tier and refresh that tier's hit ratio"""
+    result = "hit" if hit else "miss"
+    USER_CACHE_REQUESTS.labels(tier=tier, result=result).inc()
+    counts = _lookups.setdefault(tier, {"hit": 0, "miss": 0})
+    counts[result] += 1
+    USER_CACHE_HIT_RATIO.labels(tier=tier).set(counts["hit"] / (counts["hit"] + counts["miss"]))
+
+
+class LocalCache(ILocalCache):
+    """Bounded in-process LRU cache with a per-entry TTL.
+
+    Holds already-validated objects so a hit skips both the Redis round trip
+    and the Pydantic validation of the cached payload. Entries are only ever
+    touched from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, max_size: int, ttl: float, tier: str = "local", fallback_tier: str = "redis"):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.tier = tier
+        self.fallback_tier = fallback_tier
+        # key -> (expires at, value)
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live entry and mark it as recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            record_cache_lookup(self.tier, hit=False)
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            record_cache_lookup(self.tier, hit=False)
+            return None
+
+        self._entries.move_to_end(key)
+        record_cache_lookup(self.tier, hit=True)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used one when full"""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic() + (ttl if ttl is not None else self.ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        USER_CACHE_LOCAL_SIZE.set(len(self._entries))
+
+    def delete(self, key: str) -> None:
+        """Drop an entry if present"""
+        self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        self._entries.clear()
+        USER_CACHE_LOCAL_SIZE.set(0)
+
+    def record_fallback(self, hit: bool) -> None:
+        """Count a lookup against the shared tier behind this cache"""
+        record_cache_lookup(self.fallback_tier, hit=hit)
+
+    def _remove(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            USER_CACHE_LOCAL_SIZE.set(len(self._entries))
@@ -1,7 +1,6 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, cast
 
-from aiohttp import ClientSession
 import jwt
 
 from src.configs.logger import log
@@ -9,6 +8,9 @@ from src.configs.settings import settings
 from src.domain.entities.auth import MicrosoftIdentity
 from src.domain.exceptions.auth_exceptions import SSOError
 from src.domain.services.microsoft_sso_service import IMicrosoftSSOService
+from src.infrastructure.services.crypto_executor import CryptoExecutor
+from src.infrastructure.services.http_client import HTTPClient
+from src.infrastructure.services.jwt_key_store import JWTKeyStore
 
 
 class MicrosoftSSOService(IMicrosoftSSOService):
@@ -17,26 +19,22 @@ class MicrosoftSSOService(IMicrosoftSSOService):
         COMMON_TENANT}/oauth2/v2.0"
     SCOPE = "openid profile email offline_access User.Read"
 
-    _private_key: bytes
-    _public_key: bytes
-
-    def __init__(self):
-        # Read private and public keys
-        try:
-            with open(settings.JWT_PRIVATE_KEY_PATH, 'rb') as private_key_file:
-                self._private_key = private_key_file.read()
-
-            with open(settings.JWT_PUBLIC_KEY_PATH, 'rb') as public_key_file:
-                self._public_key = public_key_file.read()
-
-        except Exception as e:
-            log.error(f"Failed to load JWT keys: {str(e)}")
-            raise SSOError("Failed to initialize Microsoft SSO service") from e
+    def __init__(
+        self,
+        key_store: JWTKeyStore,
+        crypto_executor: CryptoExecutor,
+        http_client: HTTPClient,
+        token_endpoint: str = TOKEN_ENDPOINT
+    ):
+        self.key_store = key_store
+        self.crypto_executor = crypto_executor
+        self.http_client = http_client
+        self.token_endpoint = token_endpoint
 
     async def generate_microsoft_auth_url(self, code_challenge: str) -> str:
         """Generate Microsoft SSO authentication URL"""
         try:
-            state_token = self._generate_state_token()
+            state_token = await self.crypto_executor.run(self._generate_state_token)
 
             auth_url = (
                 f"{self.TOKEN_ENDPOINT}/authorize"
@@ -79,23 +77,22 @@ class MicrosoftSSOService(IMicrosoftSSOService):
 
     async def _exchange_code_for_token(self, code: str, code_verifier: str) -> Dict[str, Any]:
         """Exchange authorization code for tokens"""
-        async with ClientSession() as session:
-            async with session.post(
-                f"{self.TOKEN_ENDPOINT}/token",
-                data={
-                    "client_id": settings.CLIENT_AZURE_CLIENT_ID,
-                    "grant_type": "authorization_code",
-                    "code": code,
-                    "redirect_uri": settings.CLIENT_AZURE_REDIRECT_URI,
-                    "code_verifier": code_verifier,
-                }
-            ) as response:
-                data: Dict[str, Any] = await response.json()
-                if "error" in data:
-                    log.error(f"Token exchange failed: {
-                              data.get('error_description')}")
-                    raise SSOError("Failed to exchange authorization code")
-                return data
+        async with self.http_client.session.post(
+            f"{self.token_endpoint}/token",
+            data={
+                "client_id": settings.CLIENT_AZURE_CLIENT_ID,
+                "grant_type": "authorization_code",
+                "code": code,
+                "redirect_uri": settings.CLIENT_AZURE_REDIRECT_URI,
+                "code_verifier": code_verifier,
+            }
+        ) as response:
+            data: Dict[str, Any] = await response.json()
+            if "error" in data:
+                log.error(f"Token exchange failed: {
+                          data.get('error_description')}")
+                raise SSOError("Failed to exchange authorization code")
+            return data
 
     def _validate_microsoft_token(self, id_token: str) -> Dict[str, Any]:
         """Validate and decode Microsoft ID token"""
@@ -118,6 +115,6 @@ class MicrosoftSSOService(IMicrosoftSSOService):
                 "exp": datetime.now(timezone.utc).timestamp() + 600,  # 10 minutes
                 "iat": datetime.now(timezone.utc).timestamp()
             },
-            key=self._private_key,
+            key=self.key_store.private_key,
             algorithm=settings.JWT_ALGORITHM
         ))
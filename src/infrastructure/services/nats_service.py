@@ -1,104 +1,278 @@
-import json
-from typing import Any, Dict
+import asyncio
+from functools import partial
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 from nats.aio.client import Client
 from nats.aio.msg import Msg
+from nats.errors import TimeoutError as NATSTimeoutError
+from nats.js.api import AckPolicy, ConsumerConfig
+from nats.js.client import JetStreamContext
+from prometheus_client import Counter, Gauge, Histogram
 
 from src.configs.logger import log
 from src.configs.settings import settings
-from src.domain.services.nats_service import INATSService, MessageCallback, RequestReplyCallback
+from src.domain.services.nats_service import BatchMessageCallback, INATSService, MessageCallback, RequestReplyCallback
+from src.infrastructure.services.nats_codec import CONTENT_TYPE_HEADER, NATSCodec, NATSCodecRegistry, create_codec
+
+NATS_CONNECTIONS = Gauge(
+    "nats_connections",
+    "Number of open NATS connections held by this process",
+    multiprocess_mode="livesum"
+)
+NATS_CONNECTION_HEALTHY = Gauge(
+    "nats_connection_healthy",
+    "Whether the shared NATS connection is currently usable (1) or not (0)",
+    multiprocess_mode="liveall"
+)
+NATS_CONNECTION_EVENTS = Counter(
+    "nats_connection_events_total",
+    "NATS connection lifecycle events",
+    ["event"]
+)
+NATS_HANDLER_IN_FLIGHT = Gauge(
+    "nats_handler_in_flight",
+    "Messages currently being handled",
+    ["subject"],
+    multiprocess_mode="livesum"
+)
+NATS_HANDLER_DURATION = Histogram(
+    "nats_handler_duration_seconds",
+    "Time spent handling a message",
+    ["subject", "outcome"]
+)
+NATS_HANDLER_WAIT = Histogram(
+    "nats_handler_wait_seconds",
+    "Time a message waited for a free handler slot",
+    ["subject"]
+)
+NATS_HANDLER_SATURATED = Counter(
+    "nats_handler_saturated_total",
+    "Messages that arrived while every handler slot was busy",
+    ["subject"]
+)
+NATS_JETSTREAM_BATCH_SIZE = Histogram(
+    "nats_jetstream_batch_size",
+    "Messages handled per JetStream fetch",
+    ["subject"],
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500)
+)
+NATS_PAYLOAD_BYTES = Histogram(
+    "nats_payload_bytes",
+    "Size of encoded message payloads",
+    ["direction", "content_type"],
+    buckets=(128, 512, 1024, 4096, 16384, 65536, 262144, 1048576)
+)
+NATS_JETSTREAM_MESSAGES = Counter(
+    "nats_jetstream_messages_total",
+    "JetStream messages by how they were settled",
+    ["subject", "result"]
+)
 
 
 class NATSService(INATSService):
-    def __init__(self) -> None:
+    def __init__(self, codec: Optional[NATSCodec] = None) -> None:
         self._client: Client = Client()
+        # Outgoing messages use the configured codec, incoming ones the codec named in their headers
+        self._codecs = NATSCodecRegistry(codec or create_codec(settings.NATS_CODEC))
         self._is_connected: bool = False
+        self._connect_lock = asyncio.Lock()
+        # Bounds the handlers running at once across every subscription of this process
+        self._handler_slots = asyncio.Semaphore(settings.NATS_HANDLER_MAX_CONCURRENCY)
+        self._handler_tasks: Set["asyncio.Task[None]"] = set()
+        self._consumer_tasks: Set["asyncio.Task[None]"] = set()
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the underlying client currently has a live connection"""
+        return self._is_connected and self._client.is_connected
+
+    @property
+    def is_healthy(self) -> bool:
+        """Whether the connection can be used to publish right now"""
+        return self.is_connected and not self._client.is_reconnecting and not self._client.is_draining
 
     async def connect(self) -> None:
         """Connect to NATS server"""
-        try:
-            if not self._is_connected:
+        # Concurrent callers share a single connection attempt
+        async with self._connect_lock:
+            if self._is_connected:
+                return
+            try:
                 await self._client.connect(
                     servers=[settings.NATS_URL],
                     name=settings.NATS_CLIENT_NAME,
-                    reconnect_time_wait=3,
-                    max_reconnect_attempts=5,
+                    reconnect_time_wait=settings.NATS_RECONNECT_TIME_WAIT,
+                    max_reconnect_attempts=settings.NATS_MAX_RECONNECT_ATTEMPTS,
                     connect_timeout=5,
                     user=settings.NATS_USERNAME,
-                    password=settings.NATS_PASSWORD
+                    password=settings.NATS_PASSWORD,
+                    error_cb=self._on_error,
+                    disconnected_cb=self._on_disconnected,
+                    reconnected_cb=self._on_reconnected,
+                    closed_cb=self._on_closed
                 )
                 self._is_connected = True
+                NATS_CONNECTIONS.inc()
+                NATS_CONNECTION_HEALTHY.set(1)
+                NATS_CONNECTION_EVENTS.labels(event="connected").inc()
                 log.info(f"Connected to NATS server at {settings.NATS_URL}")
-        except Exception as e:
-            log.error(f"Failed to connect to NATS: {str(e)}")
-            raise
+            except Exception as e:
+                NATS_CONNECTION_EVENTS.labels(event="connect_failed").inc()
+                log.error(f"Failed to connect to NATS: {str(e)}")
+                raise
 
     async def disconnect(self) -> None:
         """Disconnect from NATS server"""
         if self._is_connected:
+            # Stop pulling, unacked messages are redelivered to another replica
+            for task in self._consumer_tasks:
+                task.cancel()
+            if self._consumer_tasks:
+                await asyncio.wait(self._consumer_tasks)
+            # Let in-flight handlers reply while the connection is still up
+            if self._handler_tasks:
+                await asyncio.wait(self._handler_tasks, timeout=settings.NATS_HANDLER_SHUTDOWN_TIMEOUT)
             await self._client.drain()
-            self._is_connected = False
             log.info("Disconnected from NATS server")
 
+    async def _dispatch(self, subject: str, handler: Callable[[], Awaitable[None]]) -> None:
+        """Run a message handler in its own task once a handler slot is free.
+
+        The subscription does not read its next message until this returns, so when every slot is
+        busy messages queue up in the subscription's bounded pending buffer instead of piling up
+        as tasks. That pushes back on NATS, which flags this process as a slow consumer.
+        """
+        if self._handler_slots.locked():
+            NATS_HANDLER_SATURATED.labels(subject=subject).inc()
+        wait_start = time.perf_counter()
+        await self._handler_slots.acquire()
+        NATS_HANDLER_WAIT.labels(subject=subject).observe(time.perf_counter() - wait_start)
+
+        task = asyncio.create_task(self._run_handler(subject, handler))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    async def _run_handler(self, subject: str, handler: Callable[[], Awaitable[None]]) -> None:
+        in_flight = NATS_HANDLER_IN_FLIGHT.labels(subject=subject)
+        in_flight.inc()
+        outcome = "ok"
+        start = time.perf_counter()
+        try:
+            await handler()
+        except Exception as e:
+            outcome = "error"
+            log.error(f"Error handling message on {subject}: {str(e)}")
+        finally:
+            NATS_HANDLER_DURATION.labels(subject=subject, outcome=outcome).observe(time.perf_counter() - start)
+            in_flight.dec()
+            self._handler_slots.release()
+
+    def _encode(self, message: Dict[str, Any], codec: Optional[NATSCodec] = None) -> bytes:
+        codec = codec or self._codecs.default
+        payload = codec.encode(message)
+        NATS_PAYLOAD_BYTES.labels(direction="out", content_type=codec.content_type).observe(len(payload))
+        return payload
+
+    def _decode(self, msg: Msg) -> Any:
+        codec = self._codecs.for_headers(msg.headers)
+        NATS_PAYLOAD_BYTES.labels(direction="in", content_type=codec.content_type).observe(len(msg.data))
+        return codec.decode(msg.data)
+
+    async def _respond(self, msg: Msg, message: Dict[str, Any], codec: NATSCodec) -> None:
+        """Reply in the format the request came in, so a JSON-only requester can read the answer"""
+        if not msg.reply:
+            raise ValueError(f"Message on {msg.subject} has no reply subject")
+        await self._client.publish(msg.reply, self._encode(message, codec), headers={CONTENT_TYPE_HEADER: codec.content_type})
+
+    async def _on_error(self, e: Exception) -> None:
+        NATS_CONNECTION_EVENTS.labels(event="error").inc()
+        log.error(f"NATS connection error: {str(e)}")
+
+    async def _on_disconnected(self) -> None:
+        NATS_CONNECTION_HEALTHY.set(0)
+        NATS_CONNECTION_EVENTS.labels(event="disconnected").inc()
+        log.warning("Disconnected from NATS server, waiting for reconnect")
+
+    async def _on_reconnected(self) -> None:
+        NATS_CONNECTION_HEALTHY.set(1)
+        NATS_CONNECTION_EVENTS.labels(event="reconnected").inc()
+        log.info(f"Reconnected to NATS server at {self._client.connected_url}")
+
+    async def _on_closed(self) -> None:
+        if self._is_connected:
+            self._is_connected = False
+            NATS_CONNECTIONS.dec()
+        NATS_CONNECTION_HEALTHY.set(0)
+        NATS_CONNECTION_EVENTS.labels(event="closed").inc()
+        log.info("NATS connection closed")
+
     async def publish(self, subject: str, message: Dict[str, Any]) -> None:
         """Publish message to a subject"""
         try:
             if not self._is_connected:
                 await self.connect()
 
-            payload = json.dumps(message).encode()
-            await self._client.publish(subject, payload)
-            log.debug(f"Published message to {subject}: {message}")
+            payload = self._encode(message)
+            await self._client.publish(subject, payload, headers=self._codecs.headers)
+            # Payloads carry access and refresh tokens, never log them
+            log.debug(f"Published {len(payload)} bytes to {subject}")
         except Exception as e:
             log.error(f"Failed to publish message: {str(e)}")
             raise
 
-    async def subscribe(self, subject: str, callback: MessageCallback) -> None:
+    async def subscribe(self, subject: str, callback: MessageCallback, queue: Optional[str] = None) -> None:
         """Subscribe to a subject"""
         try:
             if not self._is_connected:
                 await self.connect()
 
+            async def handle(msg: Msg) -> None:
+                data = self._decode(msg)
+                await callback(msg.subject, data)
+
             async def message_handler(msg: Msg) -> None:
-                try:
-                    data = json.loads(msg.data.decode())
-                    await callback(msg.subject, data)
-                except Exception as e:
-                    log.error(f"Error processing message: {str(e)}")
+                await self._dispatch(subject, lambda: handle(msg))
 
-            await self._client.subscribe(subject, cb=message_handler)
-            log.info(f"Subscribed to {subject}")
+            await self._client.subscribe(
+                subject,
+                queue=queue or "",
+                cb=message_handler,
+                pending_msgs_limit=settings.NATS_SUBSCRIPTION_PENDING_LIMIT
+            )
+            log.info(f"Subscribed to {subject}" + (f" in queue group {queue}" if queue else ""))
         except Exception as e:
             log.error(f"Failed to subscribe: {str(e)}")
             raise
 
-    async def request(self, subject: str, message: Dict[str, Any], timeout: int = 10) -> Dict[str, Any]:
+    async def request(self, subject: str, message: Dict[str, Any], timeout: float = 10) -> Dict[str, Any]:
         """Send request and wait for response"""
         try:
             if not self._is_connected:
                 await self.connect()
 
-            payload = json.dumps(message).encode()
-            response = await self._client.request(subject, payload, timeout=timeout)
-            return json.loads(response.data.decode()) if response.data else {}
+            payload = self._encode(message)
+            response = await self._client.request(subject, payload, timeout=timeout, headers=self._codecs.headers)
+            return self._decode(response) if response.data else {}
         except Exception as e:
             log.error(f"Failed to send request: {str(e)}")
             raise
 
-    async def subscribe_request(self, subject: str, callback: RequestReplyCallback) -> None:
+    async def subscribe_request(self, subject: str, callback: RequestReplyCallback, queue: Optional[str] = None) -> None:
         """Subscribe to a subject for handling request-reply"""
         try:
             if not self._is_connected:
                 await self.connect()
 
-            async def message_handler(msg: Msg) -> None:
+            async def handle(msg: Msg) -> None:
+                codec = self._codecs.default
                 try:
-                    data = json.loads(msg.data.decode())
+                    codec = self._codecs.for_headers(msg.headers)
+                    data = self._decode(msg)
 
                     async def respond(response_data: Dict[str, Any]) -> None:
                         """Helper function to respond to the request"""
-                        response_payload = json.dumps(response_data).encode()
-                        await msg.respond(response_payload)
+                        await self._respond(msg, response_data, codec)
 
                     # Call the callback with subject, data and respond function
                     await callback(msg.subject, data, respond)
@@ -110,10 +284,111 @@ class NATSService(INATSService):
                         "message": f"Error processing request: {str(e)}",
                         "error_code": "INTERNAL_ERROR"
                     }
-                    await msg.respond(json.dumps(error_response).encode())
+                    await self._respond(msg, error_response, codec)
 
-            await self._client.subscribe(subject, cb=message_handler)
-            log.info(f"Subscribed to request subject: {subject}")
+            async def message_handler(msg: Msg) -> None:
+                await self._dispatch(subject, lambda: handle(msg))
+
+            await self._client.subscribe(
+                subject,
+                queue=queue or "",
+                cb=message_handler,
+                pending_msgs_limit=settings.NATS_SUBSCRIPTION_PENDING_LIMIT
+            )
+            log.info(f"Subscribed to request subject: {subject}" + (f" in queue group {queue}" if queue else ""))
         except Exception as e:
             log.error(f"Failed to subscribe to request: {str(e)}")
             raise
+
+    async def subscribe_batch(
+        self,
+        subject: str,
+        durable: str,
+        callback: BatchMessageCallback,
+        batch_size: int = 100,
+        max_deliver: int = 5
+    ) -> None:
+        """Consume a subject through a durable JetStream pull consumer, a batch at a time"""
+        try:
+            if not self._is_connected:
+                await self.connect()
+
+            # The stream holding the subject is provisioned with the NATS cluster, not by this service
+            subscription = await self._client.jetstream().pull_subscribe(
+                subject,
+                durable=durable,
+                config=ConsumerConfig(
+                    durable_name=durable,
+                    ack_policy=AckPolicy.EXPLICIT,
+                    ack_wait=settings.NATS_JETSTREAM_ACK_WAIT,
+                    max_deliver=max_deliver
+                )
+            )
+            task = asyncio.create_task(
+                self._consume_batches(subject, subscription, callback, batch_size, max_deliver),
+                name=f"nats-consumer:{durable}"
+            )
+            self._consumer_tasks.add(task)
+            task.add_done_callback(self._consumer_tasks.discard)
+            log.info(f"Consuming {subject} through durable consumer {durable}")
+        except Exception as e:
+            log.error(f"Failed to create durable consumer: {str(e)}")
+            raise
+
+    async def _consume_batches(
+        self,
+        subject: str,
+        subscription: JetStreamContext.PullSubscription,
+        callback: BatchMessageCallback,
+        batch_size: int,
+        max_deliver: int
+    ) -> None:
+        while True:
+            try:
+                messages = await subscription.fetch(batch_size, timeout=settings.NATS_JETSTREAM_FETCH_TIMEOUT)
+            except NATSTimeoutError:
+                continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"Failed to fetch messages from {subject}: {str(e)}")
+                await asyncio.sleep(settings.NATS_RECONNECT_TIME_WAIT)
+                continue
+
+            # Handled inline, the next fetch waits for this batch to settle
+            await self._handler_slots.acquire()
+            await self._run_handler(subject, partial(self._handle_batch, subject, messages, callback, max_deliver))
+
+    async def _handle_batch(self, subject: str, messages: List[Msg], callback: BatchMessageCallback, max_deliver: int) -> None:
+        batch: List[Dict[str, Any]] = []
+        decoded: List[Msg] = []
+        for msg in messages:
+            try:
+                batch.append(self._decode(msg))
+                decoded.append(msg)
+            except Exception as e:
+                # Redelivery cannot fix a payload that does not parse
+                log.error(f"Dropping malformed message on {subject}: {str(e)}")
+                await msg.term()
+                NATS_JETSTREAM_MESSAGES.labels(subject=subject, result="terminated").inc()
+        if not batch:
+            return
+        NATS_JETSTREAM_BATCH_SIZE.labels(subject=subject).observe(len(batch))
+
+        try:
+            await callback(subject, batch)
+        except Exception:
+            for msg in decoded:
+                if msg.metadata.num_delivered >= max_deliver:
+                    log.error(f"Giving up on message {msg.metadata.sequence.stream} on {subject} " +
+                              f"after {msg.metadata.num_delivered} deliveries")
+                    await msg.term()
+                    NATS_JETSTREAM_MESSAGES.labels(subject=subject, result="terminated").inc()
+                else:
+                    await msg.nak(delay=settings.NATS_JETSTREAM_NAK_DELAY)
+                    NATS_JETSTREAM_MESSAGES.labels(subject=subject, result="nacked").inc()
+            raise
+
+        for msg in decoded:
+            await msg.ack()
+        NATS_JETSTREAM_MESSAGES.labels(subject=subject, result="acked").inc(len(decoded))
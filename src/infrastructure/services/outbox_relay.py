@@ -0,0 +1,185 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from prometheus_client import Counter, Histogram
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.configs.logger import log
+from src.domain.constants.nats_events import NATSPublishTopic
+from src.domain.entities.outbox_event import OutboxEvent
+from src.domain.services.nats_service import INATSService
+from src.infrastructure.repositories.sqlalchemy_outbox_repository import SQLAlchemyOutboxRepository
+
+OUTBOX_PUBLISHED = Counter(
+    "outbox_events_published_total",
+    "Outbox events published to NATS",
+    ["subject"]
+)
+OUTBOX_COALESCED = Counter(
+    "outbox_events_coalesced_total",
+    "Outbox events folded into a later event of the same user"
+)
+OUTBOX_PUBLISH_FAILURES = Counter(
+    "outbox_publish_failures_total",
+    "Failed attempts to publish an outbox event"
+)
+OUTBOX_DEAD_LETTERED = Counter(
+    "outbox_events_dead_lettered_total",
+    "Outbox events given up on after their last failed publish attempt"
+)
+OUTBOX_LAG = Histogram(
+    "outbox_event_lag_seconds",
+    "Time from an event being written to the outbox to it being published"
+)
+
+# Longest wait between rounds that keep failing, so an outage does not use up the attempts of every event at once
+MAX_RETRY_DELAY = 60.0
+
+# Partial updates of one user, folded into one event whose data holds every changed field
+MERGED_SUBJECTS = {NATSPublishTopic.USER_UPDATED.value}
+# Events where only the latest one per user matters, keyed by the group they replace each other in
+LATEST_ONLY_GROUPS = {
+    NATSPublishTopic.USER_ACTIVATED.value: "activation",
+    NATSPublishTopic.USER_DEACTIVATED.value: "activation",
+    NATSPublishTopic.MICROSOFT_LOGIN.value: NATSPublishTopic.MICROSOFT_LOGIN.value,
+    NATSPublishTopic.JIRA_LOGIN.value: NATSPublishTopic.JIRA_LOGIN.value,
+}
+
+
+@dataclass
+class PendingPublish:
+    """One message to publish, standing in for every outbox event folded into it"""
+    subject: str
+    payload: Dict[str, Any]
+    created_at: datetime
+    event_ids: List[int] = field(default_factory=list)
+    user_id: Optional[int] = None
+
+
+def coalesce_events(events: List[OutboxEvent]) -> List[PendingPublish]:
+    """Fold events of the same user that later ones make redundant.
+
+    A folded event takes the position of the latest event it absorbed, so per user the relative order
+    of what is published matches the order the events were written in.
+    """
+    pending: List[Optional[PendingPublish]] = []
+    latest: Dict[Tuple[int, str], int] = {}
+    for event in events:
+        group = LATEST_ONLY_GROUPS.get(event.subject)
+        if event.subject in MERGED_SUBJECTS:
+            group = event.subject
+        if event.user_id is None or group is None:
+            pending.append(PendingPublish(event.subject, event.payload, event.created_at, [event.id], event.user_id))
+            continue
+
+        key = (event.user_id, group)
+        payload = event.payload
+        event_ids = [event.id]
+        created_at = event.created_at
+        previous = pending[latest[key]] if key in latest else None
+        if previous is not None:
+            pending[latest[key]] = None
+            OUTBOX_COALESCED.inc(len(previous.event_ids))
+            event_ids = previous.event_ids + event_ids
+            created_at = previous.created_at
+            if event.subject in MERGED_SUBJECTS:
+                payload = {**payload, "data": {**(previous.payload.get("data") or {}), **(payload.get("data") or {})}}
+        latest[key] = len(pending)
+        pending.append(PendingPublish(event.subject, payload, created_at, event_ids, event.user_id))
+    return [item for item in pending if item is not None]
+
+
+class OutboxRelay:
+    """Drains the outbox in batches and publishes it to NATS.
+
+    Every replica runs a relay but an advisory lock lets only one of them publish at a time, parallel
+    relays would publish disjoint batches concurrently and could reorder a user's events.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        nats_service: INATSService,
+        batch_size: int,
+        poll_interval: float,
+        max_attempts: int
+    ):
+        self.session_factory = session_factory
+        self.nats_service = nats_service
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        retry_delay = self.poll_interval
+        while True:
+            try:
+                published, failed = await self.relay_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"Outbox relay failed: {str(e)}")
+                published, failed = 0, 1
+            if failed:
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+                continue
+            retry_delay = self.poll_interval
+            # A fully published batch means more are likely waiting
+            if published < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def relay_batch(self) -> Tuple[int, int]:
+        """Publish one batch of pending events, returning how many were published and how many failed"""
+        async with self.session_factory() as session:
+            outbox_repository = SQLAlchemyOutboxRepository(session)
+            if not await outbox_repository.try_lock_relay():
+                return 0, 0
+            events = await outbox_repository.claim_batch(self.batch_size)
+            if not events:
+                return 0, 0
+
+            attempts = {event.id: event.attempts for event in events}
+            pending = coalesce_events(events)
+            published: List[int] = []
+            failed = 0
+            # Users whose later events wait for the next round so they are not published ahead of a failed one
+            held_users: Set[int] = set()
+            for item in pending:
+                if item.user_id in held_users:
+                    continue
+                try:
+                    await self.nats_service.publish(item.subject, item.payload)
+                except Exception as e:
+                    OUTBOX_PUBLISH_FAILURES.inc()
+                    failed += len(item.event_ids)
+                    if item.user_id is not None:
+                        held_users.add(item.user_id)
+                    if max(attempts[event_id] for event_id in item.event_ids) + 1 >= self.max_attempts:
+                        OUTBOX_DEAD_LETTERED.inc(len(item.event_ids))
+                        await outbox_repository.dead_letter(item.event_ids, str(e))
+                        log.error(f"Dead-lettered outbox events {item.event_ids} ({item.subject}): {str(e)}")
+                    else:
+                        await outbox_repository.record_failure(item.event_ids, str(e))
+                        log.error(f"Failed to publish outbox events {item.event_ids} ({item.subject}): {str(e)}")
+                    continue
+                published.extend(item.event_ids)
+                OUTBOX_PUBLISHED.labels(subject=item.subject).inc()
+                OUTBOX_LAG.observe((datetime.now() - item.created_at).total_seconds())
+
+            await outbox_repository.delete(published)
+            await outbox_repository.commit()
+            return len(published), failed
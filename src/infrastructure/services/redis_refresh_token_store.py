@@ -0,0 +1,113 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.domain.exceptions.auth_exceptions import InvalidTokenError
+from src.domain.services.refresh_token_store import IRefreshTokenStore
+
+# A token key holds "a:<user_id>" while active and "r:<user_id>" once revoked. Revoked
+# tokens keep their key until they would have expired, so replaying one is told apart
+# from a token this store never saw.
+TOKEN_KEY_PREFIX = "refresh_token:"
+USER_TOKENS_KEY_PREFIX = "refresh_tokens:user:"
+
+# Scripts only touch the keys they are passed. The owner, and so the user token set, is read
+# from the token key before running them; a token key never changes owner.
+
+# KEYS: old token, new token, user token set of the owner. ARGV: new token TTL.
+# Returns nil for an unknown token, else the state of the old token.
+_ROTATE = """
+local value = redis.call('GET', KEYS[1])
+if not value then
+    return nil
+end
+local state, user_id = string.sub(value, 1, 1), string.sub(value, 3)
+if state ~= 'a' then
+    return state
+end
+local remaining = redis.call('PTTL', KEYS[1])
+if remaining > 0 then
+    redis.call('SET', KEYS[1], 'r:' .. user_id, 'PX', remaining)
+end
+redis.call('SET', KEYS[2], 'a:' .. user_id, 'EX', ARGV[1])
+redis.call('SREM', KEYS[3], KEYS[1])
+redis.call('SADD', KEYS[3], KEYS[2])
+redis.call('EXPIRE', KEYS[3], ARGV[1])
+return state
+"""
+
+# KEYS: user token set, then the tokens read from it. Revokes those tokens and takes them out
+# of the set, returning how many were added to the set meanwhile and are still in it.
+_REVOKE_USER = """
+for i = 2, #KEYS do
+    local value = redis.call('GET', KEYS[i])
+    local remaining = redis.call('PTTL', KEYS[i])
+    if value and string.sub(value, 1, 1) == 'a' and remaining > 0 then
+        redis.call('SET', KEYS[i], 'r:' .. string.sub(value, 3), 'PX', remaining)
+    end
+    redis.call('SREM', KEYS[1], KEYS[i])
+end
+return redis.call('SCARD', KEYS[1])
+"""
+
+
+class RedisRefreshTokenStore(IRefreshTokenStore):
+    """Refresh token state in Redis, each token expiring with its TTL"""
+
+    def __init__(self, redis_client: "Redis[str]"):
+        self.redis = redis_client
+        self._rotate = redis_client.register_script(_ROTATE)
+        self._revoke_user = redis_client.register_script(_REVOKE_USER)
+
+    async def issue(self, token_hash: str, user_id: int, ttl: int) -> None:
+        user_tokens = self._user_tokens_key(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(f"{TOKEN_KEY_PREFIX}{token_hash}", f"a:{user_id}", ex=ttl)
+            pipe.sadd(user_tokens, f"{TOKEN_KEY_PREFIX}{token_hash}")
+            pipe.expire(user_tokens, ttl)
+            await pipe.execute()
+
+    async def rotate(self, token_hash: str, new_token_hash: str, ttl: int) -> Optional[int]:
+        user_id = await self.get_user_id(token_hash)
+        if user_id is None:
+            return None
+        state = await self._rotate(
+            keys=[
+                f"{TOKEN_KEY_PREFIX}{token_hash}",
+                f"{TOKEN_KEY_PREFIX}{new_token_hash}",
+                self._user_tokens_key(user_id)
+            ],
+            args=[ttl]
+        )
+        if state is None:
+            # Expired since it was read
+            return None
+        if self._text(state) != "a":
+            raise InvalidTokenError("Refresh token has been revoked")
+        return user_id
+
+    async def get_user_id(self, token_hash: str) -> Optional[int]:
+        value = await self.redis.get(f"{TOKEN_KEY_PREFIX}{token_hash}")
+        if value is None:
+            return None
+        return int(self._text(value)[2:])
+
+    async def revoke_user_tokens(self, user_id: int) -> None:
+        user_tokens = self._user_tokens_key(user_id)
+        # Tokens issued between reading the set and revoking them are picked up by the next round
+        while True:
+            tokens = await self.redis.smembers(user_tokens)
+            if not tokens:
+                return
+            left = await self._revoke_user(keys=[user_tokens, *(self._text(token) for token in tokens)])
+            if not left:
+                return
+
+    @staticmethod
+    def _user_tokens_key(user_id: int) -> str:
+        return f"{USER_TOKENS_KEY_PREFIX}{user_id}"
+
+    @staticmethod
+    def _text(value: object) -> str:
+        # The shared client may or may not decode responses
+        return value.decode() if isinstance(value, bytes) else str(value)
@@ -1,20 +1,26 @@
 from datetime import datetime, timezone
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from redis.asyncio import Redis
 
 from src.configs.logger import log
 from src.domain.constants.auth import TokenType
 from src.domain.entities.auth import CachedToken
+from src.domain.services.cache_invalidation_service import ICacheInvalidationService
 from src.domain.services.redis_service import IRedisService
 
 
 class RedisService(IRedisService):
     """Service for managing Redis operations."""
 
-    def __init__(self, redis_client: Redis):
+    def __init__(
+        self,
+        redis_client: Redis,
+        cache_invalidation_service: Optional[ICacheInvalidationService] = None
+    ):
         self.redis = redis_client
+        self.cache_invalidation_service = cache_invalidation_service
 
     async def get(self, key: str) -> Optional[Any]:
         """Get a value from Redis by key."""
@@ -27,9 +33,27 @@ class RedisService(IRedisService):
         """Set a value in Redis with an expiry time."""
         await self.redis.setex(key, expiry, json.dumps(value, default=str))
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values from Redis in one round trip."""
+        if not keys:
+            return []
+        values = await self.redis.mget(keys)
+        return [json.loads(value) if value else None for value in values]
+
+    async def set_many(self, values: Dict[str, Dict[str, Any]], expiry: int) -> None:
+        """Set several values with an expiry time in one pipelined round trip."""
+        if not values:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.setex(key, expiry, json.dumps(value, default=str))
+            await pipe.execute()
+
     async def delete(self, key: str) -> None:
         """Delete a key from Redis."""
         await self.redis.delete(key)
+        if self.cache_invalidation_service:
+            await self.cache_invalidation_service.invalidate(key)
 
     async def cache_token(
         self,
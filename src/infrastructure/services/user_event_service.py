@@ -3,13 +3,15 @@ from typing import Any, Dict
 from src.configs.logger import log
 from src.domain.constants.nats_events import NATSPublishTopic
 from src.domain.entities.user_event import UserEvent
-from src.domain.services.nats_service import INATSService
+from src.domain.repositories.outbox_repository import IOutboxRepository
 from src.domain.services.user_event_service import IUserEventService
 
 
 class UserEventService(IUserEventService):
-    def __init__(self, nats_service: INATSService):
-        self.nats_service = nats_service
+    """Writes user events to the outbox, the outbox relay publishes them to NATS after commit"""
+
+    def __init__(self, outbox_repository: IOutboxRepository):
+        self.outbox_repository = outbox_repository
 
     async def publish_user_event(
         self,
@@ -24,12 +26,29 @@ class UserEventService(IUserEventService):
                 data=data
             )
 
-            await self.nats_service.publish(
+            await self.outbox_repository.add(
                 subject=event_type.value,
-                message=event.model_dump()
+                payload=event.model_dump(mode='json'),
+                user_id=user_id
             )
 
-            log.debug(f"Published user event: {event_type.value} for user {user_id}")
+            log.debug(f"Queued user event: {event_type.value} for user {user_id}")
+        except Exception as e:
+            log.error(f"Failed to queue user event: {str(e)}")
+            raise
+
+    async def publish_login_event(
+        self,
+        user_id: int,
+        event_type: NATSPublishTopic,
+        data: Dict[str, Any]
+    ) -> None:
+        try:
+            await self.outbox_repository.add(subject=event_type.value, payload=data, user_id=user_id)
+            log.debug(f"Queued login event: {event_type.value} for user {user_id}")
         except Exception as e:
-            log.error(f"Failed to publish user event: {str(e)}")
+            log.error(f"Failed to queue login event: {str(e)}")
             raise
+
+    async def commit(self) -> None:
+        await self.outbox_repository.commit()
@@ -6,6 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
 from redis.asyncio import Redis
 
+from src.app.dependencies.nats import nats_handler_scope
 from src.app.middlewares.exception_handler import register_exception_handlers
 from src.app.routers.auth_router import router as auth_router
 from src.app.routers.internal_router import router as internal_router
@@ -14,19 +15,19 @@ from src.app.routers.project_router import router as project_router
 from src.app.routers.public_auth_router import router as public_auth_router
 from src.app.routers.role_router import router as role_router
 from src.app.routers.user_router import router as user_router
+from src.app.services.jira_link_job_service import cancel_running_jira_link_jobs
 from src.app.services.nats_subscribe_service import NATSSubscribeService
-from src.app.services.project_service import ProjectService
-from src.app.services.role_service import RoleService
-from src.configs.database import get_db, init_db
+from src.configs.auth import crypto_executor
+from src.configs.cache import get_cache_invalidation_service
+from src.configs.container import get_app_container, reset_app_container
+from src.configs.database import AsyncSessionLocal, engine, init_db
+from src.configs.http import http_client
 from src.configs.logger import log
+from src.configs.metrics import mark_dead_workers, mark_process_dead
+from src.configs.nats import close_nats_client, get_nats_client
 from src.configs.settings import settings
-from src.infrastructure.repositories.sqlalchemy_permission_repository import SQLAlchemyPermissionRepository
-from src.infrastructure.repositories.sqlalchemy_project_repository import SQLAlchemyProjectRepository
-from src.infrastructure.repositories.sqlalchemy_role_repository import SQLAlchemyRoleRepository
-from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
-from src.infrastructure.services.nats_service import NATSService
-from src.infrastructure.services.redis_service import RedisService
-from src.infrastructure.services.user_event_service import UserEventService
+from src.infrastructure.services.jwt_token_service import flush_refresh_token_writes
+from src.infrastructure.services.outbox_relay import OutboxRelay
 
 # Define Prometheus instrumentator first
 instrumentator = Instrumentator(
@@ -46,6 +47,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Initialize configurations"""
     # Startup
     log.info(f"Starting up {settings.APP_NAME}")
+    # A worker replacing a crashed one clears the gauges its predecessor left behind
+    mark_dead_workers()
     await init_db()
 
     # Initialize Redis
@@ -54,56 +57,54 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         encoding="utf-8",
         decode_responses=True
     )
-    redis_service = RedisService(redis_client)
     app.state.redis = redis_client
 
-    # Initialize NATS service
-    nats_service = NATSService()
-    await nats_service.connect()
+    # Initialize the shared NATS connection used by every request
+    nats_service = await get_nats_client()
     app.state.nats = nats_service
 
-    # Initialize repositories
-    db_generator = get_db()
-    db = await anext(db_generator)  # Get the actual session from the generator
+    # Keep the in-process user cache in step with the other replicas
+    cache_invalidation_service = await get_cache_invalidation_service()
+    await cache_invalidation_service.start()
 
-    user_event_service = UserEventService(nats_service)
+    # Build the stateless services once, requests only add their session-bound repositories
+    app.state.container = await get_app_container()
 
-    user_repository = SQLAlchemyUserRepository(db, user_event_service, redis_service)
-    project_repository = SQLAlchemyProjectRepository(db)
-    role_repository = SQLAlchemyRoleRepository(db)
-    permission_repository = SQLAlchemyPermissionRepository(db)
-
-    # Initialize services
-    role_service = RoleService(
-        role_repository,
-        permission_repository,
-        project_repository,
-        user_repository
-    )
-
-    project_service = ProjectService(
-        project_repository,
-        role_repository,
-        user_repository,
+    # Start subscribers, every message gets its own session from the handler scope
+    nats_subscribe_service = NATSSubscribeService(
         nats_service,
-        redis_service
+        nats_handler_scope,
+        queue_group=settings.NATS_QUEUE_GROUP,
+        fanout_subjects=settings.NATS_FANOUT_SUBJECTS,
+        durable_prefix=settings.NATS_JETSTREAM_DURABLE_PREFIX if settings.NATS_JETSTREAM_ENABLED else None,
+        batch_size=settings.NATS_JETSTREAM_BATCH_SIZE,
+        max_deliver=settings.NATS_JETSTREAM_MAX_DELIVER
     )
+    await nats_subscribe_service.start_nats_subscribers()
 
-    # Start subscribers
-    nats_subscribe_service = NATSSubscribeService(
+    # Publish events written to the outbox by request handlers
+    outbox_relay = OutboxRelay(
+        AsyncSessionLocal,
         nats_service,
-        project_service,
-        role_service
+        batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
+        poll_interval=settings.OUTBOX_RELAY_POLL_INTERVAL,
+        max_attempts=settings.OUTBOX_RELAY_MAX_ATTEMPTS
     )
-
-    await nats_subscribe_service.start_nats_subscribers()
+    outbox_relay.start()
 
     yield
 
     # Shutdown
     log.info(f"Shutting down {settings.APP_NAME}")
-    if hasattr(app.state, "nats"):
-        await app.state.nats.disconnect()
+    await cancel_running_jira_link_jobs(timeout=5)
+    await outbox_relay.stop()
+    await flush_refresh_token_writes(timeout=5)
+    reset_app_container()
+    await close_nats_client()
+    await http_client.close()
+    await engine.dispose()
+    crypto_executor.shutdown()
+    mark_process_dead()
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -158,7 +159,6 @@ app.include_router(
 register_exception_handlers(app)
 
 if __name__ == "__main__":
-    import uvicorn
+    from src.server import run
 
-    uvicorn.run("src.main:app", host="0.0.0.0",
-                port=settings.PORT, reload=True)
+    run()
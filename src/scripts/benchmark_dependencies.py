@@ -0,0 +1,101 @@
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from fastapi import Depends, FastAPI
+from redis.asyncio import Redis
+from starlette.types import Message
+
+from src.app.dependencies.auth import get_auth_service
+from src.app.dependencies.common import get_token_service
+from src.app.dependencies.user import get_user_service
+from src.configs.cache import user_local_cache
+from src.configs.container import build_app_container, get_app_container
+from src.configs.settings import settings
+from src.infrastructure.services.cache_invalidation_service import CacheInvalidationService
+from src.infrastructure.services.nats_service import NATSService
+
+# Routes that only resolve a dependency graph, nothing touches the database, Redis or NATS
+app = FastAPI()
+
+
+@app.get("/noop")
+async def noop() -> None:
+    """Baseline, no dependencies at all"""
+    return None
+
+
+@app.get("/auth-service")
+async def auth_service(service: Any = Depends(get_auth_service)) -> None:
+    """Resolves the login dependency graph"""
+    return None
+
+
+@app.get("/token-service")
+async def token_service(service: Any = Depends(get_token_service)) -> None:
+    """Resolves the token service and its repositories"""
+    return None
+
+
+@app.get("/user-service")
+async def user_service(service: Any = Depends(get_user_service)) -> None:
+    """Resolves the user service and its repositories"""
+    return None
+
+
+async def _call(path: str) -> None:
+    """Drive one GET through the ASGI app, without a server or an HTTP client"""
+    scope: Dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "server": ("benchmark", 80),
+        "client": ("benchmark", 1),
+    }
+    messages: List[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    if messages[0]["status"] != 200:
+        raise RuntimeError(f"{path} answered {messages[0]['status']}")
+
+
+async def run(number: int = 5000) -> None:
+    """Print the mean time to serve each route, the difference to /noop is the per-request DI cost"""
+    # Unconnected clients, the container only has to exist for the graph to resolve
+    nats_service = NATSService()
+    container = build_app_container(
+        nats_service=nats_service,
+        redis_client=Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, decode_responses=True),
+        cache_invalidation_service=CacheInvalidationService(local_cache=user_local_cache, nats_service=nats_service)
+    )
+
+    async def override_container() -> Any:
+        return container
+
+    app.dependency_overrides[get_app_container] = override_container
+
+    for path in ("/noop", "/auth-service", "/token-service", "/user-service"):
+        for _ in range(number // 10):
+            await _call(path)
+        started_at = time.perf_counter()
+        for _ in range(number):
+            await _call(path)
+        elapsed = (time.perf_counter() - started_at) / number
+        print(f"{path:<16} {elapsed * 1e6:8.1f}us per request")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,53 @@
+from functools import partial
+import json
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.infrastructure.services.nats_codec import NATSCodec, create_codec
+
+# Shaped like the login event and the role assignment request, the two highest-volume messages
+LOGIN_EVENT: Dict[str, Any] = {
+    "user_id": 1024,
+    "event_type": "user.login",
+    "access_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJSUzI1NiJ9." + "a" * 900 + ".signature",
+    "refresh_token": "0" * 64,
+    "expires_in": 3600,
+    "token_type": "Bearer",
+    "scope": "openid profile email offline_access",
+    "occurred_at": "2026-10-16T21:18:02.000000",
+}
+ROLE_REQUEST: Dict[str, Any] = {
+    "project_key": "ZODC",
+    "assignments": [
+        {"user_id": i, "role_name": "developer", "email": f"user{i}@example.com"} for i in range(50)
+    ],
+}
+
+
+def _legacy() -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    """What NATSService did before the codec layer"""
+    return (lambda message: json.dumps(message).encode(), lambda data: json.loads(data.decode()))
+
+
+def run(number: int = 20000) -> None:
+    """Print encode and decode time per message and the payload size of every available codec"""
+    codecs: List[Tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]] = [("legacy", *_legacy())]
+    for name in ("json", "orjson", "msgpack"):
+        try:
+            codec: NATSCodec = create_codec(name)
+        except ValueError as e:
+            print(f"skipping {name}: {e}")
+            continue
+        codecs.append((name, codec.encode, codec.decode))
+
+    for label, message in (("login event", LOGIN_EVENT), ("role request", ROLE_REQUEST)):
+        print(f"{label}:")
+        for name, encode, decode in codecs:
+            payload = encode(message)
+            encode_time = timeit.timeit(partial(encode, message), number=number) / number
+            decode_time = timeit.timeit(partial(decode, payload), number=number) / number
+            print(f"  {name:<8} {len(payload):>6} bytes  encode {encode_time * 1e6:7.2f}us  decode {decode_time * 1e6:7.2f}us")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import sys
+from typing import Any, Iterator, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.sql import ClauseElement
+from sqlmodel import col, select, update
+
+from src.configs.database import engine
+from src.domain.constants.auth import TokenType
+from src.infrastructure.models.refresh_token import RefreshToken
+from src.infrastructure.models.user import User
+from src.infrastructure.models.user_performance import UserPerformance
+from src.infrastructure.models.user_project_role import USER_PROJECT_ROLE_UNIQUE_CONSTRAINT, UserProjectRole
+
+# The hot lookups and the indexes that should serve them, shaped like the repository queries
+CHECKS: List[Tuple[str, ClauseElement, Tuple[str, ...]]] = [
+    (
+        "membership check",
+        select(UserProjectRole.id).where(
+            col(UserProjectRole.user_id) == 1, col(UserProjectRole.project_id) == 1
+        ),
+        (USER_PROJECT_ROLE_UNIQUE_CONSTRAINT,),
+    ),
+    (
+        "projects of a user",
+        select(UserProjectRole.project_id).where(col(UserProjectRole.user_id) == 1),
+        (USER_PROJECT_ROLE_UNIQUE_CONSTRAINT,),
+    ),
+    (
+        "members of a project",
+        select(UserProjectRole.user_id).where(col(UserProjectRole.project_id) == 1),
+        ("ix_user_project_roles_project_id_user_id",),
+    ),
+    (
+        "assignments of a role",
+        select(UserProjectRole.id).where(col(UserProjectRole.role_id) == 1),
+        ("ix_user_project_roles_role_id",),
+    ),
+    (
+        "latest refresh token of a type",
+        select(RefreshToken)
+        .where(col(RefreshToken.user_id) == 1, col(RefreshToken.token_type) == TokenType.APP)
+        .order_by(col(RefreshToken.created_at).desc())
+        .limit(1),
+        ("ix_refresh_tokens_user_id_token_type_created_at",),
+    ),
+    (
+        "revoke refresh tokens of a type",
+        update(RefreshToken)
+        .where(
+            col(RefreshToken.user_id) == 1,
+            col(RefreshToken.token_type) == TokenType.APP,
+            col(RefreshToken.is_revoked) == False  # noqa: E712
+        )
+        .values(is_revoked=True),
+        ("ix_refresh_tokens_active_user_id_token_type", "ix_refresh_tokens_user_id_token_type_created_at"),
+    ),
+    (
+        "user by Jira account",
+        select(User.id).where(col(User.jira_account_id) == "jira-account"),
+        ("ix_users_jira_account_id",),
+    ),
+    (
+        "performance of a user for a quarter",
+        select(UserPerformance.id).where(
+            col(UserPerformance.user_id) == 1, col(UserPerformance.year) == 2026, col(UserPerformance.quarter) == 1
+        ),
+        ("ix_user_performance_user_id_year_quarter",),
+    ),
+]
+
+
+def _index_names(plan: Any) -> Iterator[str]:
+    """Every index an EXPLAIN (FORMAT JSON) plan reads from"""
+    if isinstance(plan, dict):
+        if "Index Name" in plan:
+            yield plan["Index Name"]
+        for value in plan.values():
+            yield from _index_names(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _index_names(item)
+
+
+async def run() -> bool:
+    """Print the indexes the planner picks for each hot lookup, True when all use an expected one.
+
+    Sequential scans are disabled for the check, on a near-empty table the planner would
+    rightly prefer them and the check would say nothing about whether the index is usable.
+    """
+    ok = True
+    async with engine.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+        for label, statement, expected in CHECKS:
+            sql = str(statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+            result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+            plan = result.scalar_one()
+            used = list(_index_names(json.loads(plan) if isinstance(plan, str) else plan))
+            passed = any(name in expected for name in used)
+            ok = ok and passed
+            print(f"{'ok' if passed else 'FAIL':<5} {label:<38} {', '.join(used) or 'no index'}")
+        await conn.rollback()
+    await engine.dispose()
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(run()) else 1)
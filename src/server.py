@@ -0,0 +1,61 @@
+import importlib
+import os
+
+import uvicorn
+
+from src.configs.logger import log
+from src.configs.metrics import MULTIPROC_DIR_ENV, mark_process_dead, prepare_multiprocess_dir
+from src.configs.settings import settings
+
+APP = "src.main:app"
+
+
+def _worker_count() -> int:
+    """Configured worker count, one per CPU core when unset"""
+    if settings.SERVER_WORKERS > 0:
+        return settings.SERVER_WORKERS
+    return os.cpu_count() or 1
+
+
+def run() -> None:
+    """Start the server.
+
+    Production runs several worker processes under uvicorn's supervisor, which
+    restarts a worker when it exits, including after serving SERVER_MAX_REQUESTS
+    requests. On SIGTERM each worker stops accepting connections, finishes
+    in-flight requests for up to SERVER_GRACEFUL_TIMEOUT seconds and then runs the
+    lifespan shutdown, which drains NATS and disposes the database pool.
+    """
+    if settings.SERVER_RELOAD:
+        # Development only, a single process restarted on file changes
+        uvicorn.run(APP, host=settings.SERVER_HOST, port=settings.PORT, reload=True)
+        return
+
+    workers = _worker_count()
+    if workers > 1:
+        # Before the app import below, prometheus_client fixes its storage when imported
+        prepare_multiprocess_dir(os.environ.get(MULTIPROC_DIR_ENV) or settings.METRICS_MULTIPROC_DIR)
+
+    # Workers are spawned, not forked, so nothing loaded here is shared with them.
+    # Importing the app once up front still fails fast on a broken config or import
+    # instead of crash-looping every worker.
+    importlib.import_module(APP.split(":")[0])
+    # The supervisor serves no requests, keep its idle gauges out of the aggregate
+    mark_process_dead()
+
+    log.info(f"Starting {settings.APP_NAME} on {settings.SERVER_HOST}:{settings.PORT} with {workers} workers")
+    uvicorn.run(
+        APP,
+        host=settings.SERVER_HOST,
+        port=settings.PORT,
+        workers=workers,
+        limit_max_requests=settings.SERVER_MAX_REQUESTS or None,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_TIMEOUT,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS
+    )
+
+
+if __name__ == "__main__":
+    run()
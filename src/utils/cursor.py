@@ -0,0 +1,34 @@
+import base64
+from datetime import datetime
+import json
+from typing import Any, Tuple
+
+from src.domain.exceptions.pagination_exceptions import InvalidCursorError
+
+
+def encode_cursor(sort: str, key: Any, row_id: int) -> str:
+    """Opaque cursor pointing just past a row, for the given sort (e.g. "name:asc")"""
+    if isinstance(key, datetime):
+        value: Any = {"dt": key.isoformat()}
+    else:
+        value = key
+    payload = json.dumps({"s": sort, "k": value, "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    """Sort key and id of the row a cursor points past.
+
+    Raises:
+        InvalidCursorError: If the cursor does not parse or belongs to another sort
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        key, row_id = payload["k"], int(payload["id"])
+        if isinstance(key, dict):
+            key = datetime.fromisoformat(key["dt"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError() from e
+    if payload.get("s") != sort:
+        raise InvalidCursorError("Pagination cursor was issued for a different sort order")
+    return key, row_id
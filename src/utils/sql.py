@@ -1,5 +1,9 @@
-from typing import TypeVar
+from contextlib import contextmanager
+from typing import Any, Iterator, List, TypeVar, Union
 
+from sqlalchemy import ColumnElement, event, literal, or_, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import InstrumentedAttribute
 
 _T = TypeVar("_T")
@@ -8,3 +12,67 @@ _T = TypeVar("_T")
 def attr(instance: _T) -> InstrumentedAttribute[_T]:
     """Return the attribute of the instance"""
     return instance  # type: ignore
+
+
+class QueryBudgetExceededError(AssertionError):
+    """Raised when a block emits more SQL statements than it was budgeted"""
+
+    def __init__(self, budget: int, statements: List[str]):
+        self.budget = budget
+        self.statements = statements
+        listing = "\n".join(f"  {i}. {sql}" for i, sql in enumerate(statements, start=1))
+        super().__init__(f"Expected at most {budget} SQL statements, got {len(statements)}:\n{listing}")
+
+
+@contextmanager
+def query_budget(engine: Union[Engine, AsyncEngine], max_statements: int) -> Iterator[List[str]]:
+    """Fail if the wrapped block emits more SQL statements than budgeted.
+
+    Meant for tests, to pin the load graph of a repository method, e.g.::
+
+        with query_budget(engine, 3):
+            await repository.get_user_by_id(user_id)
+
+    Yields the list of statements captured so far.
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    statements: List[str] = []
+
+    def _count(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", _count)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count)
+
+    if len(statements) > max_statements:
+        raise QueryBudgetExceededError(max_statements, statements)
+
+
+def keyset_after(
+    sort_column: ColumnElement[Any],
+    id_column: ColumnElement[Any],
+    key: Any,
+    row_id: int,
+    descending: bool = False
+) -> ColumnElement[bool]:
+    """Condition selecting the rows after (key, row_id) in ORDER BY sort_column, id_column.
+
+    Both columns must be sorted in the same direction and sort_column must not be NULL,
+    a NULL key would drop rows out of the comparison.
+    """
+    position = tuple_(sort_column, id_column)
+    after = tuple_(literal(key), literal(row_id))
+    return position < after if descending else position > after
+
+
+def matches_search(term: str, *columns: Any) -> Any:
+    """Case-insensitive substring match of term on any of the columns.
+
+    LIKE wildcards in the term are matched literally. With a pg_trgm GIN index on a column,
+    Postgres answers the match from the index instead of scanning the table.
+    """
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return or_(*(column.ilike(f"%{escaped}%", escape="\\") for column in columns))
@@ -0,0 +1,10 @@
+import hashlib
+
+
+def hash_token(token: str) -> str:
+    """SHA-256 of a token, what is stored in place of it.
+
+    Refresh tokens are long random strings, so an unsalted hash is enough to make a
+    leaked store useless without making lookups by token any harder.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
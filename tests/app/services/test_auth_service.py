@@ -0,0 +1,55 @@
+from unittest.mock import AsyncMock
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.services.auth_service import AuthService
+from src.domain.constants.nats_events import NATSPublishTopic
+from src.domain.entities.auth import MicrosoftIdentity, SSOCredentials, TokenPair
+from src.domain.entities.user import User
+from src.infrastructure.models.outbox_event import OutboxEvent
+from src.infrastructure.repositories.sqlalchemy_outbox_repository import SQLAlchemyOutboxRepository
+from src.infrastructure.services.user_event_service import UserEventService
+
+
+async def test_microsoft_callback_commits_login_event(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """The login event outlives the request session, which get_db closes without committing"""
+    microsoft_sso_service = AsyncMock()
+    microsoft_sso_service.exchange_microsoft_code.return_value = MicrosoftIdentity(
+        email="jane@example.com",
+        name="Jane",
+        access_token="microsoft-access-token",
+        expires_in=3600,
+        refresh_token="microsoft-refresh-token",
+        scope="User.Read",
+    )
+    user_repository = AsyncMock()
+    user_repository.get_user_by_email.return_value = User(id=7, email="jane@example.com", name="Jane")
+    token_service = AsyncMock()
+    token_service.create_token_pair.return_value = TokenPair(
+        access_token="access", refresh_token="refresh", expires_in=60
+    )
+
+    async with session_factory() as session:
+        auth_service = AuthService(
+            auth_repository=AsyncMock(),
+            user_repository=user_repository,
+            role_repository=AsyncMock(),
+            token_service=token_service,
+            microsoft_sso_service=microsoft_sso_service,
+            jira_sso_service=AsyncMock(),
+            redis_service=AsyncMock(),
+            refresh_token_repository=AsyncMock(),
+            user_event_service=UserEventService(SQLAlchemyOutboxRepository(session)),
+            nats_service=AsyncMock(),
+        )
+        token_pair = await auth_service.handle_microsoft_callback(
+            SSOCredentials(code="code", state="state", code_verifier="verifier")
+        )
+
+    assert token_pair.access_token == "access"
+    async with session_factory() as session:
+        events = (await session.exec(select(OutboxEvent))).all()
+    assert [(event.subject, event.user_id) for event in events] == [(NATSPublishTopic.MICROSOFT_LOGIN.value, 7)]
+    assert events[0].payload["access_token"] == "microsoft-access-token"
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta, timezone
+from itertools import permutations
+from typing import Awaitable, Callable, Dict, Tuple
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.constants.auth import TokenType
+from src.domain.entities.auth import RefreshTokenEntity
+from src.infrastructure.models.refresh_token import RefreshToken
+from src.infrastructure.repositories.sqlalchemy_refresh_token_repository import SQLAlchemyRefreshTokenRepository
+
+Write = Callable[[SQLAlchemyRefreshTokenRepository], Awaitable[object]]
+
+
+def _token(token: str) -> RefreshTokenEntity:
+    return RefreshTokenEntity(
+        token=token,
+        user_id=7,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=30),
+        token_type=TokenType.APP
+    )
+
+
+# What a token issued, then refreshed twice, writes behind: each write may land in any order
+WRITES: Dict[str, Write] = {
+    "issue": lambda repository: repository.create_refresh_token(_token("first")),
+    "first rotation": lambda repository: repository.rotate_token("first", _token("second")),
+    "second rotation": lambda repository: repository.rotate_token("second", _token("third")),
+}
+
+
+@pytest.mark.parametrize("order", list(permutations(WRITES)), ids=" > ".join)
+async def test_write_behinds_end_in_the_same_rows_in_any_order(
+    session_factory: async_sessionmaker[AsyncSession], order: Tuple[str, ...]
+) -> None:
+    """Write-behinds run as independent tasks, Postgres must not depend on which lands first"""
+    for name in order:
+        async with session_factory() as session:
+            await WRITES[name](SQLAlchemyRefreshTokenRepository(session))
+
+    async with session_factory() as session:
+        rows = (await session.exec(select(RefreshToken))).all()
+    assert sorted((row.token, row.user_id, row.is_revoked) for row in rows) == [
+        ("first", 7, True),
+        ("second", 7, True),
+        ("third", 7, False),
+    ]
@@ -0,0 +1,53 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.infrastructure.models.role import Role
+from src.infrastructure.repositories.sqlalchemy_role_repository import SQLAlchemyRoleRepository
+
+
+async def _add_roles(session: AsyncSession, *names: str) -> None:
+    session.add_all(Role(name=name, description=f"{name} role") for name in names)
+    await session.commit()
+
+
+async def test_cursor_pages_cover_every_role_once(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Following next_cursor walks the listing in name order without gaps or repeats"""
+    async with session_factory() as session:
+        await _add_roles(session, "delta", "alpha", "echo", "charlie", "bravo")
+        repository = SQLAlchemyRoleRepository(session)
+
+        names = []
+        cursor = None
+        while True:
+            page = await repository.get_all_roles(limit=2, cursor=cursor)
+            names.extend(role.name for role in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+    assert names == ["alpha", "bravo", "charlie", "delta", "echo"]
+
+
+async def test_deprecated_page_number_is_served_with_an_offset(
+    session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    """Clients still sending page get the same rows OFFSET paging gave them"""
+    async with session_factory() as session:
+        await _add_roles(session, "delta", "alpha", "echo", "charlie", "bravo")
+        page = await SQLAlchemyRoleRepository(session).get_all_roles(limit=2, offset=2, include_total=True)
+
+    assert [role.name for role in page.items] == ["charlie", "delta"]
+    assert page.total == 5
+    assert page.next_cursor is not None
+
+
+async def test_search_matches_like_wildcards_literally(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """A % or _ in the search term is not a wildcard"""
+    async with session_factory() as session:
+        await _add_roles(session, "qa_lead", "qaxlead", "100%")
+        repository = SQLAlchemyRoleRepository(session)
+        underscore = await repository.get_all_roles(search="qa_")
+        percent = await repository.get_system_roles(search="%")
+
+    assert [role.name for role in underscore.items] == ["qa_lead"]
+    assert percent.items == []
@@ -0,0 +1,79 @@
+from typing import List
+from unittest.mock import AsyncMock
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.infrastructure.models.permission import Permission
+from src.infrastructure.models.project import Project
+from src.infrastructure.models.role import Role
+from src.infrastructure.models.role_permission import RolePermission
+from src.infrastructure.models.user import User
+from src.infrastructure.models.user_project_role import UserProjectRole
+from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
+from src.utils.sql import query_budget
+
+# users, system role, project role rows
+USER_LOAD_GRAPH = 3
+# users, system role, its permissions, project role rows, their roles, those roles' permissions, projects
+PROJECT_ROLES_LOAD_GRAPH = 7
+
+
+async def _seed(session: AsyncSession, user_count: int) -> List[int]:
+    """Users holding a system role and a role in each of two projects, every role with a permission"""
+    view, edit = Permission(name="project.view"), Permission(name="project.edit")
+    admin = Role(name="admin", is_system_role=True)
+    developer = Role(name="developer")
+    projects = [Project(name="Alpha", key="ALPHA"), Project(name="Beta", key="BETA")]
+    session.add_all([view, edit, admin, developer, *projects])
+    await session.flush()
+    session.add_all([
+        RolePermission(role_id=admin.id, permission_id=edit.id),
+        RolePermission(role_id=developer.id, permission_id=view.id),
+    ])
+    users = [User(email=f"user{i}@example.com", name=f"User {i}", role_id=admin.id) for i in range(user_count)]
+    session.add_all(users)
+    await session.flush()
+    session.add_all(
+        UserProjectRole(user_id=user.id, project_id=project.id, role_id=developer.id)
+        for user in users for project in projects
+    )
+    await session.commit()
+    return [user.id for user in users if user.id is not None]
+
+
+def _repository(session: AsyncSession) -> SQLAlchemyUserRepository:
+    return SQLAlchemyUserRepository(session=session, user_event_service=AsyncMock(), redis_service=AsyncMock())
+
+
+async def test_get_user_by_id_loads_its_graph_in_fixed_statements(
+    engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    """One statement per relationship level, whatever the user holds"""
+    async with session_factory() as session:
+        user_id = (await _seed(session, 1))[0]
+
+    async with session_factory() as session:
+        with query_budget(engine, PROJECT_ROLES_LOAD_GRAPH):
+            user = await _repository(session).get_user_by_id(user_id)
+
+    assert user is not None
+    assert user.system_role is not None
+    assert len(user.user_project_roles or []) == 2
+
+
+async def test_user_listings_do_not_query_per_user(
+    engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    """Fetching many users costs the same statements as fetching one"""
+    async with session_factory() as session:
+        user_ids = await _seed(session, 5)
+
+    async with session_factory() as session:
+        repository = _repository(session)
+        with query_budget(engine, PROJECT_ROLES_LOAD_GRAPH):
+            users = await repository.get_users_by_ids(user_ids)
+        with query_budget(engine, USER_LOAD_GRAPH):
+            all_users = await repository.get_all_users()
+
+    assert len(users) == len(all_users) == 5
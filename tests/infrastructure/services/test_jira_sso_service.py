@@ -0,0 +1,73 @@
+from typing import AsyncIterator, List
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from src.domain.exceptions.auth_exceptions import SSOError
+from src.infrastructure.services.http_client import HTTPClient
+from src.infrastructure.services.jira_sso_service import JiraSSOService
+
+# Identity of the connection behind every request the stub served
+CONNECTIONS = web.AppKey("connections", List[int])
+
+
+@pytest.fixture
+async def jira_stub() -> AsyncIterator[TestServer]:
+    """Local stand-in for the Atlassian token endpoint and the Jira user API"""
+    connections: List[int] = []
+
+    async def token(request: web.Request) -> web.Response:
+        connections.append(id(request.transport))
+        form = await request.post()
+        if form["code"] != "valid-code":
+            return web.json_response({"error": "invalid_grant", "error_description": "bad code"})
+        return web.json_response({"access_token": "jira-access", "refresh_token": "jira-refresh", "expires_in": 60})
+
+    async def user(request: web.Request) -> web.Response:
+        connections.append(id(request.transport))
+        assert request.headers["Authorization"] == "Bearer jira-access"
+        account_id = request.query["accountId"]
+        return web.json_response({"avatarUrls": {"48x48": f"https://avatars.example.com/{account_id}.png"}})
+
+    app = web.Application()
+    app.router.add_post("/oauth/token", token)
+    app.router.add_get("/rest/api/3/user", user)
+    app[CONNECTIONS] = connections
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+def _jira_sso_service(http_client: HTTPClient, server: TestServer) -> JiraSSOService:
+    return JiraSSOService(
+        http_client,
+        token_endpoint=str(server.make_url("/oauth/token")),
+        api_base_url=str(server.make_url("")).rstrip("/")
+    )
+
+
+async def test_token_exchange_and_avatar_share_one_connection(jira_stub: TestServer) -> None:
+    """Both calls of a Jira login go through the pooled session and reuse its connection"""
+    http_client = HTTPClient()
+    service = _jira_sso_service(http_client, jira_stub)
+    try:
+        identity = await service.exchange_jira_code("valid-code")
+        avatar_url = await service.fetch_user_avatar(identity.access_token, "account-1")
+    finally:
+        await http_client.close()
+
+    assert identity.refresh_token == "jira-refresh"
+    assert avatar_url == "https://avatars.example.com/account-1.png"
+    assert len(set(jira_stub.app[CONNECTIONS])) == 1
+
+
+async def test_rejected_code_raises_sso_error(jira_stub: TestServer) -> None:
+    """An error body from the token endpoint is an SSO failure, not a token"""
+    http_client = HTTPClient()
+    try:
+        with pytest.raises(SSOError):
+            await _jira_sso_service(http_client, jira_stub).exchange_jira_code("expired-code")
+    finally:
+        await http_client.close()
@@ -0,0 +1,108 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.constants.auth import TokenType
+from src.domain.entities.auth import RefreshTokenEntity
+from src.domain.entities.user import User
+from src.domain.exceptions.auth_exceptions import TokenError
+from src.domain.repositories.refresh_token_repository import IRefreshTokenRepository
+from src.domain.value_objects.token import TokenPayload
+from src.infrastructure.models.refresh_token import RefreshToken
+from src.infrastructure.repositories.sqlalchemy_refresh_token_repository import SQLAlchemyRefreshTokenRepository
+from src.infrastructure.services.jwt_token_service import JWTTokenService, flush_refresh_token_writes
+from src.infrastructure.services.redis_refresh_token_store import RedisRefreshTokenStore
+from src.utils.tokens import hash_token
+
+
+def _token_service(
+    redis_client: "Redis[str]", session: AsyncSession, session_factory: async_sessionmaker[AsyncSession]
+) -> JWTTokenService:
+    user_repository = AsyncMock()
+    user_repository.get_token_claims.return_value = TokenPayload(
+        sub="7",
+        email="jane@example.com",
+        name="Jane",
+        system_role="user",
+        system_permissions=[],
+        project_roles={},
+        project_permissions={},
+        is_jira_linked=False,
+    )
+    crypto_executor = AsyncMock()
+    crypto_executor.run.return_value = "access-token"
+
+    @asynccontextmanager
+    async def refresh_token_repository_scope() -> AsyncIterator[IRefreshTokenRepository]:
+        async with session_factory() as write_session:
+            yield SQLAlchemyRefreshTokenRepository(write_session)
+
+    return JWTTokenService(
+        redis_service=AsyncMock(),
+        role_repository=AsyncMock(),
+        user_repository=user_repository,
+        refresh_token_repository=SQLAlchemyRefreshTokenRepository(session),
+        permission_repository=AsyncMock(),
+        key_store=AsyncMock(),
+        crypto_executor=crypto_executor,
+        refresh_token_store=RedisRefreshTokenStore(redis_client),
+        refresh_token_repository_scope=refresh_token_repository_scope,
+    )
+
+
+async def _revoked_by_token(session_factory: async_sessionmaker[AsyncSession]) -> Dict[str, bool]:
+    async with session_factory() as session:
+        rows = (await session.exec(select(RefreshToken))).all()
+    return {row.token: row.is_revoked for row in rows}
+
+
+async def test_refresh_rotates_the_token_and_rejects_its_replay(
+    redis_client: "Redis[str]", session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    """The store decides, Postgres ends up logging the same rotation"""
+    async with session_factory() as session:
+        token_service = _token_service(redis_client, session, session_factory)
+        issued = await token_service.create_token_pair(User(id=7, email="jane@example.com", name="Jane"))
+        refreshed = await token_service.refresh_tokens(issued.refresh_token)
+        with pytest.raises(TokenError):
+            await token_service.refresh_tokens(issued.refresh_token)
+    await flush_refresh_token_writes()
+
+    assert await _revoked_by_token(session_factory) == {
+        hash_token(issued.refresh_token): True,
+        hash_token(refreshed.refresh_token): False,
+    }
+
+
+async def test_refresh_falls_back_to_postgres_for_tokens_the_store_never_saw(
+    redis_client: "Redis[str]", session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    """Tokens issued before the store existed, or lost with a Redis restart, are consumed from Postgres"""
+    async with session_factory() as session:
+        await SQLAlchemyRefreshTokenRepository(session).create_refresh_token(RefreshTokenEntity(
+            token=hash_token("issued-before-the-store"),
+            user_id=7,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+            token_type=TokenType.APP
+        ))
+
+    async with session_factory() as session:
+        token_service = _token_service(redis_client, session, session_factory)
+        refreshed = await token_service.refresh_tokens("issued-before-the-store")
+        with pytest.raises(TokenError):
+            await token_service.refresh_tokens("issued-before-the-store")
+        # The replacement lives in the store from now on
+        assert await token_service.get_refresh_token_user_id(refreshed.refresh_token) == 7
+    await flush_refresh_token_writes()
+
+    assert await _revoked_by_token(session_factory) == {
+        hash_token("issued-before-the-store"): True,
+        hash_token(refreshed.refresh_token): False,
+    }
@@ -0,0 +1,19 @@
+import sys
+
+import pytest
+
+from src.infrastructure.services.nats_codec import JSONCodec, create_codec
+
+
+def test_create_codec_fails_without_its_library(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A configured codec whose library is missing stops startup instead of silently sending JSON"""
+    monkeypatch.setitem(sys.modules, "msgpack", None)
+    with pytest.raises(ValueError, match="msgpack extra"):
+        create_codec("msgpack")
+
+
+def test_create_codec_rejects_unknown_names() -> None:
+    """Only the codecs shipped here can be configured"""
+    with pytest.raises(ValueError, match="Unknown NATS codec"):
+        create_codec("protobuf")
+    assert isinstance(create_codec("JSON"), JSONCodec)
@@ -0,0 +1,57 @@
+import pytest
+from redis.asyncio import Redis
+
+from src.domain.exceptions.auth_exceptions import InvalidTokenError
+from src.infrastructure.services.redis_refresh_token_store import (
+    TOKEN_KEY_PREFIX,
+    USER_TOKENS_KEY_PREFIX,
+    RedisRefreshTokenStore,
+)
+
+TTL = 3600
+
+
+async def test_rotate_hands_the_owner_over_to_the_new_token(redis_client: "Redis[str]") -> None:
+    """The new token joins the user's token set in place of the old one"""
+    store = RedisRefreshTokenStore(redis_client)
+    await store.issue("old", 7, TTL)
+
+    assert await store.rotate("old", "new", TTL) == 7
+    assert await store.get_user_id("new") == 7
+    assert await redis_client.smembers(f"{USER_TOKENS_KEY_PREFIX}7") == {f"{TOKEN_KEY_PREFIX}new"}
+
+
+async def test_rotate_rejects_a_replayed_token(redis_client: "Redis[str]") -> None:
+    """A rotated token stays known as revoked, so a replay is not mistaken for an unknown token"""
+    store = RedisRefreshTokenStore(redis_client)
+    await store.issue("old", 7, TTL)
+    await store.rotate("old", "new", TTL)
+
+    with pytest.raises(InvalidTokenError):
+        await store.rotate("old", "other", TTL)
+    assert await store.get_user_id("other") is None
+    assert await store.get_user_id("old") == 7
+
+
+async def test_rotate_leaves_unknown_tokens_to_the_caller(redis_client: "Redis[str]") -> None:
+    """None sends the caller to Postgres, nothing is issued meanwhile"""
+    store = RedisRefreshTokenStore(redis_client)
+
+    assert await store.rotate("unknown", "new", TTL) is None
+    assert await store.get_user_id("new") is None
+
+
+async def test_revoke_user_tokens_revokes_every_token_of_the_user(redis_client: "Redis[str]") -> None:
+    """Other users' tokens are left alone"""
+    store = RedisRefreshTokenStore(redis_client)
+    await store.issue("first", 7, TTL)
+    await store.issue("second", 7, TTL)
+    await store.issue("others", 8, TTL)
+
+    await store.revoke_user_tokens(7)
+
+    for token_hash in ("first", "second"):
+        with pytest.raises(InvalidTokenError):
+            await store.rotate(token_hash, f"{token_hash}-next", TTL)
+    assert not await redis_client.exists(f"{USER_TOKENS_KEY_PREFIX}7")
+    assert await store.rotate("others", "others-next", TTL) == 8